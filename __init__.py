@@ -4,65 +4,79 @@ __init__.py for the Agent Core component.
 This module initializes the Agent Core package.
 """
 
-from agent_core.agent_core import AgentCore
-from agent_core.agent_loop_controller import AgentLoopController
-from agent_core.event_stream_processor import EventStreamProcessor
-from agent_core.prompt_manager import PromptManager
-from agent_core.state_manager import AgentStateManager
-from agent_core.tool_manager import ToolManager
-from agent_core.models import (
-    Event, EventType, EventFilter, EventStream,
-    AgentLoopState, Plan, PlanStep,
-    PromptTemplate, SystemInstruction,
-    UserContext, ExecutionContext, MemoryContext, ToolContext, AgentState,
-    ComponentType, Component, DependencyIssue,
-    LLMRequest, LLMResponse, TokenUsage, ModelInfo,
-    Tool, ToolCall, ToolResult, ValidationError,
-    FormatType, StyleGuide, Attachment, Response, QualityIssue,
-    MessageType, UIMessage, UIEventType, UIEvent, UIType, UIFeature
-)
+import importlib.util
+import logging
 
-__all__ = [
-    'AgentCore',
-    'AgentLoopController',
-    'EventStreamProcessor',
-    'PromptManager',
-    'StateManager',
-    'ToolManager',
-    'Event',
-    'EventType',
-    'EventFilter',
-    'EventStream',
-    'AgentLoopState',
-    'Plan',
-    'PlanStep',
-    'PromptTemplate',
-    'SystemInstruction',
-    'UserContext',
-    'ExecutionContext',
-    'MemoryContext',
-    'ToolContext',
-    'AgentState',
-    'ComponentType',
-    'Component',
-    'DependencyIssue',
-    'LLMRequest',
-    'LLMResponse',
-    'TokenUsage',
-    'ModelInfo',
-    'Tool',
-    'ToolCall',
-    'ToolResult',
-    'ValidationError',
-    'FormatType',
-    'StyleGuide',
-    'Attachment',
-    'Response',
-    'QualityIssue',
-    'MessageType',
-    'UIMessage',
-    'UIEventType',
-    'UIEvent',
-    'UIType',
-    'UIFeature'
-]
+# The components live under src/, which is only importable once callers
+# (or the tests) have put it on sys.path. Only skip the re-exports when
+# agent_core is genuinely absent, so import errors inside the modules
+# themselves still surface.
+if importlib.util.find_spec("agent_core") is None:
+    logging.getLogger(__name__).warning(
+        "agent_core is not importable; add src/ to sys.path to use the "
+        "package-level re-exports"
+    )
+    __all__ = []
+else:
+    from agent_core.agent_core import AgentCore
+    from agent_core.agent_loop_controller import AgentLoopController
+    from agent_core.event_stream_processor import EventStreamProcessor
+    from agent_core.prompt_manager import PromptManager
+    from agent_core.state_manager import AgentStateManager
+    from agent_core.tool_manager import ToolManager
+    from agent_core.models import (
+        Event, EventType, EventFilter, EventStream,
+        AgentLoopState, Plan, PlanStep,
+        PromptTemplate, SystemInstruction,
+        UserContext, ExecutionContext, MemoryContext, ToolContext, AgentState,
+        ComponentType, Component, DependencyIssue,
+        LLMRequest, LLMResponse, TokenUsage, ModelInfo,
+        Tool, ToolCall, ToolResult, ValidationError,
+        FormatType, StyleGuide, Attachment, Response, QualityIssue,
+        MessageType, UIMessage, UIEventType, UIEvent, UIType, UIFeature
+    )
+
+    __all__ = [
+        'AgentCore',
+        'AgentLoopController',
+        'EventStreamProcessor',
+        'PromptManager',
+        'AgentStateManager',
+        'ToolManager',
+        'Event',
+        'EventType',
+        'EventFilter',
+        'EventStream',
+        'AgentLoopState',
+        'Plan',
+        'PlanStep',
+        'PromptTemplate',
+        'SystemInstruction',
+        'UserContext',
+        'ExecutionContext',
+        'MemoryContext',
+        'ToolContext',
+        'AgentState',
+        'ComponentType',
+        'Component',
+        'DependencyIssue',
+        'LLMRequest',
+        'LLMResponse',
+        'TokenUsage',
+        'ModelInfo',
+        'Tool',
+        'ToolCall',
+        'ToolResult',
+        'ValidationError',
+        'FormatType',
+        'StyleGuide',
+        'Attachment',
+        'Response',
+        'QualityIssue',
+        'MessageType',
+        'UIMessage',
+        'UIEventType',
+        'UIEvent',
+        'UIType',
+        'UIFeature'
+    ]
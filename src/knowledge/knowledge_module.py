@@ -110,7 +110,7 @@ class KnowledgeModule:
             metadata={
                 "source": source,
                 "confidence": confidence,
-                **metadata or {}
+                **(metadata or {})
             },
             importance=confidence
         )
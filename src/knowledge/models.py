@@ -0,0 +1,316 @@
+"""
+Models for the Knowledge Module component.
+
+This module defines the data structures used by the Knowledge Module.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+class MemoryType(Enum):
+    """Types of memory."""
+    SHORT_TERM = "short_term"
+    LONG_TERM = "long_term"
+    SEMANTIC = "semantic"
+    EPISODIC = "episodic"
+
+
+class QueryType(Enum):
+    """Types of knowledge queries."""
+    SEMANTIC = "semantic"
+    KEYWORD = "keyword"
+    HYBRID = "hybrid"
+    EXACT = "exact"
+
+
+class KnowledgeEventType(Enum):
+    """Types of knowledge events."""
+    ITEM_ADDED = "item_added"
+    ITEM_UPDATED = "item_updated"
+    ITEM_REMOVED = "item_removed"
+    QUERY_EXECUTED = "query_executed"
+    CONTEXT_UPDATED = "context_updated"
+
+
+class MemoryItem:
+    """An item stored in memory."""
+    def __init__(
+        self,
+        item_id: str,
+        content: str,
+        memory_type: MemoryType,
+        embedding: Optional[List[float]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        importance: float = 0.5
+    ):
+        self.item_id = item_id
+        self.content = content
+        self.memory_type = memory_type
+        self.embedding = embedding
+        self.metadata = metadata or {}
+        self.importance = importance
+        self.created_at = datetime.now()
+        self.last_accessed = self.created_at
+        self.access_count = 0
+
+
+class MemoryCategory:
+    """A category grouping related memory items."""
+    def __init__(
+        self,
+        category_id: str,
+        name: str,
+        description: str,
+        parent_id: Optional[str] = None,
+        items: Optional[List[str]] = None
+    ):
+        self.category_id = category_id
+        self.name = name
+        self.description = description
+        self.parent_id = parent_id
+        self.items = items if items is not None else []
+
+
+class ContextItem:
+    """An item selected into a context window."""
+    def __init__(
+        self,
+        item_id: str,
+        content: str,
+        importance: float,
+        recency: float,
+        token_count: int,
+        source: str = "memory",
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        self.item_id = item_id
+        self.content = content
+        self.importance = importance
+        self.recency = recency
+        self.token_count = token_count
+        self.source = source
+        self.metadata = metadata or {}
+
+
+class ContextWindow:
+    """A token-bounded window of context items."""
+    def __init__(
+        self,
+        window_id: str,
+        items: List[ContextItem],
+        max_tokens: int,
+        current_tokens: int = 0,
+        strategy: str = "importance_recency"
+    ):
+        self.window_id = window_id
+        self.items = items
+        self.max_tokens = max_tokens
+        self.current_tokens = current_tokens
+        self.strategy = strategy
+
+
+class KnowledgeItem:
+    """A knowledge item managed by the Knowledge Module."""
+    def __init__(
+        self,
+        item_id: str,
+        content: str,
+        source: str,
+        confidence: float = 0.8,
+        metadata: Optional[Dict[str, Any]] = None,
+        created_at: Optional[datetime] = None
+    ):
+        self.item_id = item_id
+        self.content = content
+        self.source = source
+        self.confidence = confidence
+        self.metadata = metadata or {}
+        self.created_at = created_at
+
+
+class KnowledgeQuery:
+    """A query against the knowledge base."""
+    def __init__(
+        self,
+        query_id: str,
+        query_text: str,
+        query_type: QueryType = QueryType.SEMANTIC,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 5,
+        threshold: float = 0.0
+    ):
+        self.query_id = query_id
+        self.query_text = query_text
+        self.query_type = query_type
+        self.filters = filters
+        self.top_k = top_k
+        self.threshold = threshold
+
+
+class KnowledgeResponse:
+    """The response to a knowledge query."""
+    def __init__(
+        self,
+        query_id: str,
+        items: List[KnowledgeItem],
+        scores: Optional[Dict[str, float]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        self.query_id = query_id
+        self.items = items
+        self.scores = scores or {}
+        self.metadata = metadata or {}
+
+
+class KnowledgeState:
+    """The knowledge state of a session."""
+    def __init__(
+        self,
+        session_id: str,
+        context_window: Optional[ContextWindow] = None,
+        recent_queries: Optional[List[KnowledgeQuery]] = None,
+        recent_results: Optional[Dict[str, KnowledgeResponse]] = None
+    ):
+        self.session_id = session_id
+        self.context_window = context_window
+        self.recent_queries = recent_queries if recent_queries is not None else []
+        self.recent_results = recent_results if recent_results is not None else {}
+
+
+class KnowledgeEvent:
+    """An event in the knowledge event log."""
+    def __init__(
+        self,
+        event_id: str,
+        event_type: KnowledgeEventType,
+        details: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime] = None
+    ):
+        self.event_id = event_id
+        self.event_type = event_type
+        self.details = details or {}
+        self.timestamp = timestamp if timestamp is not None else datetime.now()
+
+
+class ValidationResult:
+    """The result of validating a knowledge item."""
+    def __init__(
+        self,
+        item_id: str,
+        is_valid: bool,
+        confidence: float,
+        issues: Optional[List[str]] = None
+    ):
+        self.item_id = item_id
+        self.is_valid = is_valid
+        self.confidence = confidence
+        self.issues = issues if issues is not None else []
+
+
+class FactCheckResult:
+    """The result of fact checking a statement."""
+    def __init__(
+        self,
+        statement: str,
+        is_factual: bool,
+        confidence: float,
+        sources: Optional[List[str]] = None,
+        explanation: str = ""
+    ):
+        self.statement = statement
+        self.is_factual = is_factual
+        self.confidence = confidence
+        self.sources = sources if sources is not None else []
+        self.explanation = explanation
+
+
+class ConsistencyResult:
+    """The result of checking consistency between statements."""
+    def __init__(
+        self,
+        is_consistent: bool,
+        conflicts: Optional[List[Dict[str, Any]]] = None,
+        confidence: float = 0.0
+    ):
+        self.is_consistent = is_consistent
+        self.conflicts = conflicts if conflicts is not None else []
+        self.confidence = confidence
+
+
+class VectorCollection:
+    """A collection of vectors in the vector database."""
+    def __init__(
+        self,
+        collection_id: str,
+        name: str,
+        dimension: int,
+        index_type: str = "flat",
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        self.collection_id = collection_id
+        self.name = name
+        self.dimension = dimension
+        self.index_type = index_type
+        self.metadata = metadata or {}
+
+
+class VectorEntry:
+    """A vector entry in a collection."""
+    def __init__(
+        self,
+        entry_id: str,
+        vector: List[float],
+        item_id: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        self.entry_id = entry_id
+        self.vector = vector
+        self.item_id = item_id
+        self.metadata = metadata or {}
+
+
+class SearchResult:
+    """A single search hit with its similarity score."""
+    def __init__(
+        self,
+        item_id: str,
+        score: float,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        self.item_id = item_id
+        self.score = score
+        self.metadata = metadata or {}
+
+
+class OptimizationResult:
+    """The result of an optimization operation."""
+    def __init__(
+        self,
+        success: bool,
+        items_affected: int = 0,
+        space_saved: int = 0,
+        time_taken: float = 0.0,
+        details: Optional[Dict[str, Any]] = None
+    ):
+        self.success = success
+        self.items_affected = items_affected
+        self.space_saved = space_saved
+        self.time_taken = time_taken
+        self.details = details or {}
+
+
+class OptimizationStrategy:
+    """A named optimization strategy with its parameters."""
+    def __init__(
+        self,
+        strategy_id: str,
+        name: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        description: str = ""
+    ):
+        self.strategy_id = strategy_id
+        self.name = name
+        self.parameters = parameters or {}
+        self.description = description
@@ -5,8 +5,13 @@ This module implements the Retrieval Engine which handles the search and retriev
 of knowledge items based on queries.
 """
 
+import os
+import re
+import copy
 import uuid
 import logging
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 
@@ -15,6 +20,25 @@ from knowledge.models import (
     SearchResult, OptimizationStrategy
 )
 
+# Compiled once at import; tokenization is on the per-item hot path
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Shared executor for scoring candidates concurrently, created on first use
+_ranking_executor = None
+
+
+def _get_ranking_executor() -> ThreadPoolExecutor:
+    """Get the shared ranking executor, creating it on first use."""
+    global _ranking_executor
+    if _ranking_executor is None:
+        _ranking_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _ranking_executor
+
+
+def _tokenize(text: str) -> frozenset:
+    """Tokenize text into a frozenset of lowercase alphanumeric tokens."""
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
 
 class RetrievalEngine:
     """
@@ -33,6 +57,7 @@ class RetrievalEngine:
         self.embedding_service = embedding_service
         self.logger = logging.getLogger(__name__)
         self.default_collection_id = None
+        self._content_cache = {}  # item_id -> (content, content_lower, tokens)
 
     def set_default_collection(self, collection_id: str) -> None:
         """
@@ -107,7 +132,24 @@ class RetrievalEngine:
         if not self.default_collection_id:
             self.logger.warning("No default collection set for semantic search")
             return []
-        
+
+        # Short-circuit before the embedding round-trip when no result can
+        # possibly come back: the embedding call is the dominant cost here
+        if not items_dict:
+            return []
+
+        if query.threshold > 1.0:
+            # Cosine similarity is bounded by 1, nothing can pass
+            return []
+
+        if query.filters:
+            now = datetime.now()
+            if not any(
+                self._matches_filters(item, query.filters, now)
+                for item in items_dict.values()
+            ):
+                return []
+
         # Generate embedding for query
         query_embedding = self.embedding_service.get_embedding(query.query_text)
         
@@ -144,18 +186,21 @@ class RetrievalEngine:
             List[Tuple[str, float]]: List of (item_id, score) tuples.
         """
         # Tokenize query
-        query_tokens = set(query.query_text.lower().split())
-        
+        query_tokens = _tokenize(query.query_text)
+
+        # Snapshot the clock once per query for age-based filters
+        now = datetime.now() if query.filters else None
+
         # Calculate scores for each item
         scores = []
         for item_id, item in items_dict.items():
             # Apply filters if specified
-            if query.filters and not self._matches_filters(item, query.filters):
+            if query.filters and not self._matches_filters(item, query.filters, now):
                 continue
-            
-            # Tokenize item content
-            item_tokens = set(item.content.lower().split())
-            
+
+            # Tokenize item content (cached across queries)
+            _, item_tokens = self._cached_content(item)
+
             # Calculate score based on token overlap
             if not query_tokens or not item_tokens:
                 score = 0.0
@@ -185,33 +230,25 @@ class RetrievalEngine:
         Returns:
             List[Tuple[str, float]]: List of (item_id, score) tuples.
         """
-        # Perform both search types
-        semantic_results = self._semantic_search(query, items_dict)
-        keyword_results = self._keyword_search(query, items_dict)
-        
-        # Combine results with weighted scores
-        semantic_weight = 0.7
-        keyword_weight = 0.3
-        
-        # Create dictionaries for easy lookup
-        semantic_scores = {item_id: score for item_id, score in semantic_results}
-        keyword_scores = {item_id: score for item_id, score in keyword_results}
-        
-        # Combine all item IDs
-        all_item_ids = set(semantic_scores.keys()).union(set(keyword_scores.keys()))
-        
-        # Calculate combined scores
-        combined_scores = []
-        for item_id in all_item_ids:
-            semantic_score = semantic_scores.get(item_id, 0.0)
-            keyword_score = keyword_scores.get(item_id, 0.0)
-            
-            combined_score = (semantic_score * semantic_weight) + (keyword_score * keyword_weight)
-            
-            if combined_score >= query.threshold:
-                combined_scores.append((item_id, combined_score))
-        
-        # Sort by score (descending) and take top_k
+        # The query threshold is a 0-1 similarity bound, so it is applied on
+        # each arm's native score scale; fused RRF sums live on a different
+        # (rank-based) scale and are never compared against it
+        arm_query = copy.copy(query)
+        arm_query.top_k = query.top_k * 2
+
+        semantic_results = self._semantic_search(arm_query, items_dict)
+        keyword_results = self._keyword_search(arm_query, items_dict)
+
+        # Reciprocal Rank Fusion: cosine and token-overlap scores live on
+        # different scales, so fuse by rank instead of by weighted score
+        rrf_k = 60
+        combined = {}
+        for results in (semantic_results, keyword_results):
+            for rank, (item_id, _) in enumerate(results):
+                combined[item_id] = combined.get(item_id, 0.0) + 1.0 / (rrf_k + rank + 1)
+
+        # Sort by fused score (descending) and take top_k
+        combined_scores = list(combined.items())
         combined_scores.sort(key=lambda x: x[1], reverse=True)
         return combined_scores[:query.top_k]
 
@@ -232,16 +269,20 @@ class RetrievalEngine:
         """
         # Normalize query
         query_text = query.query_text.lower()
-        
+
+        # Snapshot the clock once per query for age-based filters
+        now = datetime.now() if query.filters else None
+
         # Find exact matches
         matches = []
         for item_id, item in items_dict.items():
             # Apply filters if specified
-            if query.filters and not self._matches_filters(item, query.filters):
+            if query.filters and not self._matches_filters(item, query.filters, now):
                 continue
             
-            # Check for exact match
-            if query_text in item.content.lower():
+            # Check for exact match against the cached lowered content
+            content_lower, _ = self._cached_content(item)
+            if query_text in content_lower:
                 # Score is 1.0 for exact match
                 matches.append((item_id, 1.0))
         
@@ -288,12 +329,16 @@ class RetrievalEngine:
         Returns:
             List[KnowledgeItem]: The ranked items.
         """
-        # Calculate relevance scores
-        scored_items = [
-            (item, self.compute_relevance(query, item))
-            for item in items
-        ]
-        
+        # Calculate relevance scores concurrently; each score involves an
+        # embedding round-trip, so the wins come from overlapping those calls
+        if len(items) > 1:
+            executor = _get_ranking_executor()
+            scores = list(executor.map(lambda item: self.compute_relevance(query, item), items))
+        else:
+            scores = [self.compute_relevance(query, item) for item in items]
+
+        scored_items = list(zip(items, scores))
+
         # Sort by score (descending)
         scored_items.sort(key=lambda x: x[1], reverse=True)
         
@@ -352,13 +397,41 @@ class RetrievalEngine:
                 description="Default optimization strategy"
             )
 
-    def _matches_filters(self, item: KnowledgeItem, filters: Dict[str, Any]) -> bool:
+    def _cached_content(self, item: KnowledgeItem) -> Tuple[str, frozenset]:
+        """
+        Get the cached lowered content and token set for an item.
+
+        The cache is invalidated when the item's content changes.
+
+        Args:
+            item: The knowledge item.
+
+        Returns:
+            Tuple[str, frozenset]: The lowered content and its token set.
+        """
+        cached = self._content_cache.get(item.item_id)
+        if cached is None or (cached[0] is not item.content and cached[0] != item.content):
+            content_lower = item.content.lower()
+            cached = (item.content, content_lower, frozenset(_TOKEN_RE.findall(content_lower)))
+            self._content_cache[item.item_id] = cached
+
+        return cached[1], cached[2]
+
+    def _matches_filters(
+        self,
+        item: KnowledgeItem,
+        filters: Dict[str, Any],
+        now: Optional[datetime] = None
+    ) -> bool:
         """
         Check if an item matches filters.
 
         Args:
             item: The item to check.
             filters: The filters to apply.
+            now: Reference time for age filters. Callers checking many items
+                should pass a single snapshot instead of paying for a clock
+                read per item.
 
         Returns:
             bool: True if the item matches the filters, False otherwise.
@@ -370,7 +443,9 @@ class RetrievalEngine:
             elif key == "min_confidence" and item.confidence < float(value):
                 return False
             elif key == "max_age" and item.created_at:
-                age = (datetime.now() - item.created_at).total_seconds() / 86400  # days
+                if now is None:
+                    now = datetime.now()
+                age = (now - item.created_at).total_seconds() / 86400  # days
                 if age > float(value):
                     return False
             elif key in item.metadata and item.metadata[key] != value:
@@ -389,15 +464,19 @@ class RetrievalEngine:
         Returns:
             float: Cosine similarity.
         """
-        # Simple implementation using dot product and magnitudes
         if not vec1 or not vec2 or len(vec1) != len(vec2):
             return 0.0
-        
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude1 = sum(a * a for a in vec1) ** 0.5
-        magnitude2 = sum(b * b for b in vec2) ** 0.5
-        
+
+        # Let BLAS handle the dot product and norms; for the common embedding
+        # dimensions this is orders of magnitude faster than a Python loop
+        vec1_np = np.asarray(vec1, dtype=np.float32)
+        vec2_np = np.asarray(vec2, dtype=np.float32)
+
+        dot_product = np.dot(vec1_np, vec2_np)
+        magnitude1 = np.linalg.norm(vec1_np)
+        magnitude2 = np.linalg.norm(vec2_np)
+
         if magnitude1 == 0 or magnitude2 == 0:
             return 0.0
-        
-        return dot_product / (magnitude1 * magnitude2)
+
+        return float(dot_product / (magnitude1 * magnitude2))
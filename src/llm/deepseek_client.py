@@ -8,9 +8,41 @@ providing a unified interface for the Agent Core to interact with the model.
 import os
 import logging
 import json
-from typing import Dict, List, Any, Optional, Union, Callable
+from typing import AsyncIterator, Dict, Iterator, List, Any, Optional, Union, Callable
 
-import openai
+# openai (and its httpx/pydantic/anyio dependency tree) is imported on
+# first client construction rather than at module load, so importing this
+# module stays cheap for code paths that never talk to the API.
+
+# Connection limits shared by every client instance. A generous pool keeps
+# concurrent agent code from queueing on sockets, while keepalive reuse
+# amortizes the TLS handshake over many requests.
+_HTTP_LIMITS = {"max_connections": 1000, "max_keepalive_connections": 200}
+
+_shared_http_client = None
+_shared_async_http_client = None
+
+
+class EmbeddingError(Exception):
+    """Raised when an embedding request fails."""
+
+
+def _get_shared_http_client() -> "httpx.Client":
+    """Return the process-wide sync HTTP client, creating it on first use."""
+    global _shared_http_client
+    if _shared_http_client is None:
+        import httpx
+        _shared_http_client = httpx.Client(limits=httpx.Limits(**_HTTP_LIMITS))
+    return _shared_http_client
+
+
+def _get_shared_async_http_client() -> "httpx.AsyncClient":
+    """Return the process-wide async HTTP client, creating it on first use."""
+    global _shared_async_http_client
+    if _shared_async_http_client is None:
+        import httpx
+        _shared_async_http_client = httpx.AsyncClient(limits=httpx.Limits(**_HTTP_LIMITS))
+    return _shared_async_http_client
 
 
 class DeepSeekR1Client:
@@ -24,7 +56,8 @@ class DeepSeekR1Client:
         base_url: str = "https://api.deepseek.com",
         model_name: str = "deepseek-reasoner",
         timeout: int = 120,
-        max_retries: int = 3
+        max_retries: int = 3,
+        http_client: Optional["httpx.Client"] = None
     ):
         """
         Initialize the DeepSeekR1Client.
@@ -35,7 +68,11 @@ class DeepSeekR1Client:
             model_name: Model name to use.
             timeout: Timeout for API calls in seconds.
             max_retries: Maximum number of retries for API calls.
+            http_client: Optional httpx client to use for requests. If None,
+                a process-wide pooled client is shared across instances.
         """
+        import openai
+
         self.api_key = api_key or os.environ.get("DEEPSEEK_API_KEY")
         if not self.api_key:
             raise ValueError("DeepSeek API key is required. Please provide it or set DEEPSEEK_API_KEY environment variable.")
@@ -45,14 +82,52 @@ class DeepSeekR1Client:
         self.timeout = timeout
         self.max_retries = max_retries
         
-        # Initialize OpenAI client
+        # Initialize OpenAI client on the shared connection pool so TLS
+        # handshakes are paid once, not per client or per call
         self.client = openai.OpenAI(
             api_key=self.api_key,
             base_url=self.base_url,
             timeout=self.timeout,
-            max_retries=self.max_retries
+            max_retries=self.max_retries,
+            http_client=http_client or _get_shared_http_client()
         )
-        
+
+        # Async client sharing the same connection pool settings, used by the
+        # a-prefixed methods so callers can overlap many requests
+        self.aclient = openai.AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            http_client=_get_shared_async_http_client()
+        )
+
+        # Wrap the completion entry points with jittered exponential backoff
+        # for transient failures (rate limits, connection drops, 5xx). The
+        # SDK's own retry covers a narrower set and retries in lockstep;
+        # jitter spreads synchronized retries out. tenacity is optional --
+        # without it the calls go through undecorated.
+        self._do_chat = self.client.chat.completions.create
+        self._ado_chat = self.aclient.chat.completions.create
+        try:
+            import tenacity
+        except ImportError:
+            tenacity = None
+
+        if tenacity is not None:
+            retrying = tenacity.retry(
+                wait=tenacity.wait_exponential_jitter(initial=0.5, max=30),
+                stop=tenacity.stop_after_attempt(5),
+                retry=tenacity.retry_if_exception_type((
+                    openai.APIError,
+                    openai.APIConnectionError,
+                    openai.RateLimitError
+                )),
+                reraise=True
+            )
+            self._do_chat = retrying(self._do_chat)
+            self._ado_chat = retrying(self._ado_chat)
+
         # Configure logging
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"DeepSeekR1Client initialized with model: {model_name}")
@@ -64,7 +139,8 @@ class DeepSeekR1Client:
         temperature: float = 0.7,
         max_tokens: int = 4000,
         stream: bool = False,
-        callback: Optional[Callable] = None
+        callback: Optional[Callable] = None,
+        model: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate text using the DeepSeek-R1 model.
@@ -76,23 +152,24 @@ class DeepSeekR1Client:
             max_tokens: Maximum number of tokens to generate.
             stream: Whether to stream the response.
             callback: Optional callback function for streaming responses.
+            model: Model to use for this call. If None, uses the client default.
 
         Returns:
             Dict[str, Any]: The generated text and metadata.
         """
         messages = []
-        
+
         # Add system message if provided
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
-        
+
         # Add user message
         messages.append({"role": "user", "content": prompt})
-        
+
         try:
             # Call the API
-            response = self.client.chat.completions.create(
-                model=self.model_name,
+            response = self._do_chat(
+                model=model or self.model_name,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
@@ -121,7 +198,8 @@ class DeepSeekR1Client:
         temperature: float = 0.7,
         max_tokens: int = 4000,
         stream: bool = False,
-        callback: Optional[Callable] = None
+        callback: Optional[Callable] = None,
+        model: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Chat with the DeepSeek-R1 model.
@@ -132,14 +210,15 @@ class DeepSeekR1Client:
             max_tokens: Maximum number of tokens to generate.
             stream: Whether to stream the response.
             callback: Optional callback function for streaming responses.
+            model: Model to use for this call. If None, uses the client default.
 
         Returns:
             Dict[str, Any]: The chat response and metadata.
         """
         try:
             # Call the API
-            response = self.client.chat.completions.create(
-                model=self.model_name,
+            response = self._do_chat(
+                model=model or self.model_name,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
@@ -162,6 +241,317 @@ class DeepSeekR1Client:
                 "reasoning_content": None
             }
 
+    async def agenerate_text(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        stream: bool = False,
+        callback: Optional[Callable] = None,
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate text using the DeepSeek-R1 model asynchronously.
+
+        Args:
+            prompt: The prompt to generate text from.
+            system_prompt: Optional system prompt to guide the model.
+            temperature: Temperature for text generation.
+            max_tokens: Maximum number of tokens to generate.
+            stream: Whether to stream the response.
+            callback: Optional callback function for streaming responses.
+            model: Model to use for this call. If None, uses the client default.
+
+        Returns:
+            Dict[str, Any]: The generated text and metadata.
+        """
+        messages = []
+
+        # Add system message if provided
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        # Add user message
+        messages.append({"role": "user", "content": prompt})
+
+        return await self.achat(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=stream,
+            callback=callback,
+            model=model
+        )
+
+    async def achat(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        stream: bool = False,
+        callback: Optional[Callable] = None,
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Chat with the DeepSeek-R1 model asynchronously.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content' keys.
+            temperature: Temperature for text generation.
+            max_tokens: Maximum number of tokens to generate.
+            stream: Whether to stream the response.
+            callback: Optional callback function for streaming responses.
+            model: Model to use for this call. If None, uses the client default.
+
+        Returns:
+            Dict[str, Any]: The chat response and metadata.
+        """
+        try:
+            # Call the API
+            response = await self._ado_chat(
+                model=model or self.model_name,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=stream
+            )
+
+            # Handle streaming response
+            if stream:
+                return await self._ahandle_streaming_response(response, callback)
+
+            # Handle non-streaming response
+            return self._process_response(response)
+
+        except Exception as e:
+            self.logger.error(f"Error in async chat: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e),
+                "content": None,
+                "reasoning_content": None
+            }
+
+    def get_embeddings(self, texts: List[str], model: Optional[str] = None) -> List[List[float]]:
+        """
+        Get embeddings for multiple texts in a single API call.
+
+        Args:
+            texts: The texts to get embeddings for.
+            model: Embedding model to use. Defaults to "deepseek-embedding".
+
+        Returns:
+            List[List[float]]: One embedding vector per input text, in order.
+
+        Raises:
+            EmbeddingError: If the embedding request fails.
+        """
+        if not texts:
+            return []
+
+        try:
+            response = self.client.embeddings.create(
+                model=model or "deepseek-embedding",
+                input=texts
+            )
+
+            return [item.embedding for item in response.data]
+
+        except Exception as e:
+            self.logger.error(f"Error getting embeddings: {str(e)}")
+            raise EmbeddingError(f"Failed to get embeddings: {str(e)}") from e
+
+    async def aget_embedding(self, text: str, model: Optional[str] = None) -> List[float]:
+        """
+        Get embedding for text asynchronously using DeepSeek's embedding model.
+
+        Args:
+            text: The text to get embedding for.
+            model: Embedding model to use. Defaults to "deepseek-embedding".
+
+        Returns:
+            List[float]: The embedding vector.
+
+        Raises:
+            EmbeddingError: If the embedding request fails.
+        """
+        try:
+            response = await self.aclient.embeddings.create(
+                model=model or "deepseek-embedding",
+                input=text
+            )
+
+            return response.data[0].embedding
+
+        except Exception as e:
+            self.logger.error(f"Error getting embedding: {str(e)}")
+            raise EmbeddingError(f"Failed to get embedding: {str(e)}") from e
+
+    def _iter_deltas(self, response, callback: Optional[Callable] = None) -> Iterator[Any]:
+        """
+        Yield message deltas from a streaming response as they arrive.
+
+        Args:
+            response: The streaming API response.
+            callback: Optional callback function for streaming chunks.
+
+        Yields:
+            Any: Each chunk's message delta.
+        """
+        for chunk in response:
+            try:
+                delta = chunk.choices[0].delta
+            except Exception as e:
+                self.logger.error(f"Error processing chunk: {str(e)}")
+                continue
+
+            # Call callback if provided
+            if callback:
+                callback(delta)
+
+            yield delta
+
+    async def _aiter_deltas(self, response, callback: Optional[Callable] = None) -> AsyncIterator[Any]:
+        """
+        Yield message deltas from an async streaming response as they arrive.
+
+        Args:
+            response: The async streaming API response.
+            callback: Optional callback function for streaming chunks.
+
+        Yields:
+            Any: Each chunk's message delta.
+        """
+        async for chunk in response:
+            try:
+                delta = chunk.choices[0].delta
+            except Exception as e:
+                self.logger.error(f"Error processing chunk: {str(e)}")
+                continue
+
+            # Call callback if provided
+            if callback:
+                callback(delta)
+
+            yield delta
+
+    def stream_text(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        model: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Generate text and yield content chunks as they arrive.
+
+        Unlike generate_text(stream=True), which aggregates the whole
+        response before returning, this keeps memory at one chunk and lets
+        callers render from the first token.
+
+        Args:
+            prompt: The prompt to generate text from.
+            system_prompt: Optional system prompt to guide the model.
+            temperature: Temperature for text generation.
+            max_tokens: Maximum number of tokens to generate.
+            model: Model to use for this call. If None, uses the client default.
+
+        Yields:
+            str: Content chunks in arrival order.
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        response = self._do_chat(
+            model=model or self.model_name,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+
+        for delta in self._iter_deltas(response):
+            if getattr(delta, 'content', None):
+                yield delta.content
+
+    async def astream_text(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        model: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generate text asynchronously and yield content chunks as they arrive.
+
+        Args:
+            prompt: The prompt to generate text from.
+            system_prompt: Optional system prompt to guide the model.
+            temperature: Temperature for text generation.
+            max_tokens: Maximum number of tokens to generate.
+            model: Model to use for this call. If None, uses the client default.
+
+        Yields:
+            str: Content chunks in arrival order.
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        response = await self._ado_chat(
+            model=model or self.model_name,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+
+        async for delta in self._aiter_deltas(response):
+            if getattr(delta, 'content', None):
+                yield delta.content
+
+    async def _ahandle_streaming_response(
+        self,
+        response,
+        callback: Optional[Callable] = None
+    ) -> Dict[str, Any]:
+        """
+        Handle an async streaming response.
+
+        Args:
+            response: The async streaming API response.
+            callback: Optional callback function for streaming chunks.
+
+        Returns:
+            Dict[str, Any]: Aggregated response data.
+        """
+        content_chunks = []
+        reasoning_chunks = []
+
+        async for delta in self._aiter_deltas(response, callback):
+            # Single guarded lookup per attribute; hasattr-then-access would
+            # resolve each attribute twice for every chunk of the stream
+            content = getattr(delta, 'content', None)
+            if content:
+                content_chunks.append(content)
+
+            reasoning = getattr(delta, 'reasoning_content', None)
+            if reasoning:
+                reasoning_chunks.append(reasoning)
+
+        return {
+            "success": True,
+            "content": "".join(content_chunks),
+            "reasoning_content": "".join(reasoning_chunks),
+            "is_streaming": True
+        }
+
     def _process_response(self, response) -> Dict[str, Any]:
         """
         Process a non-streaming response.
@@ -232,55 +622,45 @@ class DeepSeekR1Client:
         """
         content_chunks = []
         reasoning_chunks = []
-        
-        for chunk in response:
-            try:
-                # Extract content from chunk
-                delta = chunk.choices[0].delta
-                
-                if hasattr(delta, 'content') and delta.content:
-                    content_chunks.append(delta.content)
-                
-                if hasattr(delta, 'reasoning_content') and delta.reasoning_content:
-                    reasoning_chunks.append(delta.reasoning_content)
-                
-                # Call callback if provided
-                if callback:
-                    callback(delta)
-            
-            except Exception as e:
-                self.logger.error(f"Error processing chunk: {str(e)}")
-        
-        # Combine chunks
-        content = "".join(content_chunks)
-        reasoning_content = "".join(reasoning_chunks)
-        
+
+        for delta in self._iter_deltas(response, callback):
+            content = getattr(delta, 'content', None)
+            if content:
+                content_chunks.append(content)
+
+            reasoning = getattr(delta, 'reasoning_content', None)
+            if reasoning:
+                reasoning_chunks.append(reasoning)
+
         return {
             "success": True,
-            "content": content,
-            "reasoning_content": reasoning_content,
+            "content": "".join(content_chunks),
+            "reasoning_content": "".join(reasoning_chunks),
             "is_streaming": True
         }
 
-    def get_embedding(self, text: str) -> List[float]:
+    def get_embedding(self, text: str, model: Optional[str] = None) -> List[float]:
         """
         Get embedding for text using DeepSeek's embedding model.
 
         Args:
             text: The text to get embedding for.
+            model: Embedding model to use. Defaults to "deepseek-embedding".
 
         Returns:
             List[float]: The embedding vector.
+
+        Raises:
+            EmbeddingError: If the embedding request fails.
         """
         try:
             response = self.client.embeddings.create(
-                model="deepseek-embedding",
+                model=model or "deepseek-embedding",
                 input=text
             )
-            
+
             return response.data[0].embedding
-        
+
         except Exception as e:
             self.logger.error(f"Error getting embedding: {str(e)}")
-            # Return empty embedding in case of error
-            return []
+            raise EmbeddingError(f"Failed to get embedding: {str(e)}") from e
@@ -6,12 +6,92 @@ for text using various LLM providers.
 """
 
 import os
+import math
+import hashlib
 import logging
-import numpy as np
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Union
 
 from llm.llm_service_manager import LLMServiceManager
 
+# NumPy (and the optional Numba accelerator) are deferred to first use so
+# short-lived CLI paths that never embed anything skip their import cost.
+# _load_numpy() populates the module-level `np` before any method runs.
+np = None
+
+# Maximum number of texts sent in one embedding API request
+_EMBEDDING_BATCH_SIZE = 128
+
+_batch_cosine_numba = None
+_numba_checked = False
+
+
+def _load_numpy():
+    """Import NumPy on first use and bind it to the module-level `np`."""
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+
+def _get_numba_kernel():
+    """
+    Build the Numba bulk-cosine kernel on first use, or return None.
+
+    Numba is an optional accelerator; without it _batch_cosine falls back
+    to the vectorized NumPy path.
+    """
+    global _batch_cosine_numba, _numba_checked
+    if _numba_checked:
+        return _batch_cosine_numba
+    _numba_checked = True
+
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, fastmath=True)
+    def kernel(q, C, out):
+        # One fused pass per row keeps the float32 data in SIMD registers,
+        # parallel over candidates; for small vectors this beats separate
+        # NumPy dot/norm dispatches
+        for i in prange(C.shape[0]):
+            s = 0.0
+            nc = 0.0
+            for j in range(C.shape[1]):
+                s += q[j] * C[i, j]
+                nc += C[i, j] * C[i, j]
+            out[i] = s / math.sqrt(nc) if nc > 0 else 0.0
+
+    _batch_cosine_numba = kernel
+    return _batch_cosine_numba
+
+
+def _batch_cosine(q: "np.ndarray", C: "np.ndarray") -> "np.ndarray":
+    """
+    Compute cosine similarity of a unit-length query against a candidate matrix.
+
+    Args:
+        q: L2-normalized float32 query vector of shape (D,).
+        C: float32 candidate matrix of shape (N, D).
+
+    Returns:
+        np.ndarray: float32 similarities of shape (N,).
+    """
+    np = _load_numpy()
+
+    kernel = _get_numba_kernel()
+    if kernel is not None:
+        out = np.empty(C.shape[0], dtype=np.float32)
+        kernel(q, C, out)
+        return out
+
+    denom = np.linalg.norm(C, axis=1)
+    scores = C @ q
+    return np.divide(scores, denom, out=np.zeros_like(scores), where=denom > 0)
+
 
 class EmbeddingService:
     """
@@ -26,20 +106,59 @@ class EmbeddingService:
             llm_service_manager: LLM Service Manager instance.
             config: Optional configuration dictionary.
         """
+        _load_numpy()
+
         self.config = config or {}
         self.llm_service_manager = llm_service_manager or LLMServiceManager(self.config)
         self.default_provider = self.config.get("default_embedding_provider", "deepseek")
         self.default_model = self.config.get("default_embedding_model", "deepseek-embedding")
         self.embedding_dimension = self.config.get("embedding_dimension", 768)
+
+        # In strict mode embedding failures propagate to the caller instead
+        # of degrading into zero vectors that rank as silent rubbish
+        self.strict = self.config.get("strict_embeddings", False)
         
         # Initialize logger
         self.logger = logging.getLogger(__name__)
         self.logger.info("EmbeddingService initialized")
         
-        # Cache for embeddings
+        # Cache for embeddings, LRU-ordered: hits move to the back,
+        # eviction pops from the front
         self.cache_enabled = self.config.get("enable_embedding_cache", True)
-        self.cache = {}
+        self.cache = OrderedDict()
         self.max_cache_size = self.config.get("max_embedding_cache_size", 10000)
+        self._key_providers = {}  # cache key -> provider, for cache stats
+
+        # Semantic cache layer: cached embeddings are mirrored into one
+        # contiguous float32 matrix so a fresh embedding can be compared
+        # against every cached one with a single matmul. Near-duplicates
+        # (paraphrases) collapse onto the canonical cached vector.
+        self.semantic_cache_threshold = self.config.get("semantic_cache_threshold", 0.97)
+        self._cache_matrix: Optional[np.ndarray] = None
+        self._matrix_keys: List[bytes] = []
+        self._matrix_index: Dict[bytes, int] = {}
+
+        # Optionally pay JIT specialization at startup instead of on the
+        # first user-facing query
+        if self.config.get("warm_similarity_kernel", False):
+            self.warm_kernels()
+
+    def warm_kernels(self) -> None:
+        """
+        Specialize the similarity kernel for the configured dimension.
+
+        The embedding dimension is fixed per deployment, so compiling the
+        Numba kernel once on a dummy (1, D) input here moves the one-off
+        JIT cost off the first query's critical path. A no-op when numba
+        is not installed.
+        """
+        kernel = _get_numba_kernel()
+        if kernel is None:
+            return
+
+        dummy = np.zeros(self.embedding_dimension, dtype=np.float32)
+        kernel(dummy, dummy.reshape(1, -1), np.empty(1, dtype=np.float32))
+        self.logger.debug(f"Similarity kernel warmed for dimension {self.embedding_dimension}")
 
     def get_embedding(
         self,
@@ -58,17 +177,44 @@ class EmbeddingService:
             use_cache: Whether to use the embedding cache.
 
         Returns:
-            List[float]: The embedding vector.
+            List[float]: The L2-normalized embedding vector.
+        """
+        return self.get_embedding_np(text, provider, model, use_cache).tolist()
+
+    def get_embedding_np(
+        self,
+        text: str,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        use_cache: bool = True
+    ) -> "np.ndarray":
+        """
+        Get embedding for text as a float32 array.
+
+        Cache hits return the stored array by reference, so internal
+        similarity paths never pay the list-to-ndarray round trip that
+        get_embedding's List[float] API implies. Callers must not mutate
+        the returned array.
+
+        Args:
+            text: The text to get embedding for.
+            provider: Provider to use. If None, uses the default provider.
+            model: Model to use. If None, uses the default embedding model.
+            use_cache: Whether to use the embedding cache.
+
+        Returns:
+            np.ndarray: The L2-normalized float32 embedding vector.
         """
         provider = provider or self.default_provider
         model = model or self.default_model
-        
+
         # Check cache if enabled and requested
-        cache_key = f"{provider}:{model}:{text}"
+        cache_key = self._cache_key(provider, model, text)
         if self.cache_enabled and use_cache and cache_key in self.cache:
             self.logger.debug(f"Using cached embedding for text: {text[:50]}...")
+            self.cache.move_to_end(cache_key)
             return self.cache[cache_key]
-        
+
         try:
             # Get embedding from LLM service
             embedding = self.llm_service_manager.get_embedding(
@@ -76,17 +222,30 @@ class EmbeddingService:
                 provider=provider,
                 model=model
             )
-            
+
+            # Normalize once; every embedding this service hands out is
+            # unit-length, so downstream cosine reduces to a dot product
+            normalized = self._normalize(embedding)
+
             # Cache the embedding if enabled
             if self.cache_enabled and use_cache:
-                self._add_to_cache(cache_key, embedding)
-            
-            return embedding
-        
+                match = self._semantic_match(normalized)
+                if match is not None:
+                    self.logger.debug(f"Semantic cache near-match for text: {text[:50]}...")
+                    normalized = match
+                self._add_to_cache(cache_key, normalized, provider)
+                # Return the stored array so repeat callers always see the
+                # same object the cache will keep handing out
+                return self.cache[cache_key]
+
+            return normalized
+
         except Exception as e:
+            if self.strict:
+                raise
             self.logger.error(f"Error getting embedding: {str(e)}")
             # Return zero vector in case of error
-            return [0.0] * self.embedding_dimension
+            return np.zeros(self.embedding_dimension, dtype=np.float32)
 
     def get_embeddings(
         self,
@@ -107,7 +266,62 @@ class EmbeddingService:
         Returns:
             List[List[float]]: The embedding vectors.
         """
-        return [self.get_embedding(text, provider, model, use_cache) for text in texts]
+        provider = provider or self.default_provider
+        model = model or self.default_model
+
+        # Deduplicate inputs first: repeated chunks (headers, boilerplate)
+        # are embedded once and their result scattered back at the end
+        unique_texts: List[str] = []
+        unique_pos: Dict[str, int] = {}
+        for text in texts:
+            if text not in unique_pos:
+                unique_pos[text] = len(unique_texts)
+                unique_texts.append(text)
+
+        # Resolve cache hits next; only misses go to the API
+        unique_results: List[Optional[List[float]]] = [None] * len(unique_texts)
+        miss_positions = []
+
+        for pos, text in enumerate(unique_texts):
+            cache_key = self._cache_key(provider, model, text)
+            if self.cache_enabled and use_cache and cache_key in self.cache:
+                self.cache.move_to_end(cache_key)
+                unique_results[pos] = self.cache[cache_key].tolist()
+            else:
+                miss_positions.append(pos)
+
+        # Fetch misses in multi-input batches instead of one call per text
+        for start in range(0, len(miss_positions), _EMBEDDING_BATCH_SIZE):
+            batch_positions = miss_positions[start:start + _EMBEDDING_BATCH_SIZE]
+
+            try:
+                embeddings = self.llm_service_manager.get_embeddings(
+                    texts=[unique_texts[pos] for pos in batch_positions],
+                    provider=provider,
+                    model=model
+                )
+            except Exception as e:
+                if self.strict:
+                    raise
+                self.logger.error(f"Error getting embeddings: {str(e)}")
+                embeddings = [[] for _ in batch_positions]
+
+            for pos, embedding in zip(batch_positions, embeddings):
+                if not embedding:
+                    # Mirror get_embedding's error behavior per failed text
+                    unique_results[pos] = [0.0] * self.embedding_dimension
+                    continue
+
+                normalized = self._normalize(embedding)
+                if self.cache_enabled and use_cache:
+                    match = self._semantic_match(normalized)
+                    if match is not None:
+                        normalized = match
+                    self._add_to_cache(self._cache_key(provider, model, unique_texts[pos]), normalized, provider)
+
+                unique_results[pos] = normalized.tolist()
+
+        return [unique_results[unique_pos[text]] for text in texts]
 
     def compute_similarity(
         self,
@@ -128,12 +342,12 @@ class EmbeddingService:
         Returns:
             float: Cosine similarity between the texts.
         """
-        # Get embeddings
-        embedding1 = self.get_embedding(text1, provider, model)
-        embedding2 = self.get_embedding(text2, provider, model)
-        
-        # Compute cosine similarity
-        return self._cosine_similarity(embedding1, embedding2)
+        # Get embeddings as float32 arrays straight from the cache
+        embedding1 = self.get_embedding_np(text1, provider, model)
+        embedding2 = self.get_embedding_np(text2, provider, model)
+
+        # Both are unit-length, so cosine is just the dot product
+        return float(np.dot(embedding1, embedding2))
 
     def find_most_similar(
         self,
@@ -156,31 +370,62 @@ class EmbeddingService:
         Returns:
             List[Dict[str, Any]]: List of dictionaries with 'text', 'similarity', and 'index' keys.
         """
+        if not candidate_texts:
+            return []
+
         # Get query embedding
-        query_embedding = self.get_embedding(query_text, provider, model)
-        
+        query_embedding = self.get_embedding_np(query_text, provider, model)
+
         # Get embeddings for all candidate texts
         candidate_embeddings = self.get_embeddings(candidate_texts, provider, model)
-        
-        # Compute similarities
-        similarities = [
-            self._cosine_similarity(query_embedding, candidate_embedding)
-            for candidate_embedding in candidate_embeddings
-        ]
-        
-        # Create result items
-        result_items = [
+
+        # Stack candidates into one contiguous matrix and compute every
+        # similarity in a single batched call instead of a Python loop
+        candidates = np.asarray(candidate_embeddings, dtype=np.float32)
+        query = np.asarray(query_embedding, dtype=np.float32)
+
+        # In non-strict mode failed embeddings come back as zero vectors;
+        # drop them rather than ranking garbage
+        valid = np.flatnonzero(np.linalg.norm(candidates, axis=1) > 0)
+        if valid.size == 0:
+            return []
+
+        similarities = self.batch_cosine(query, candidates[valid])
+
+        # Partial-select the top_k, then sort only those
+        top_k = min(top_k, valid.size)
+        top_positions = np.argpartition(similarities, -top_k)[-top_k:]
+        top_positions = top_positions[np.argsort(similarities[top_positions])[::-1]]
+
+        return [
             {
-                "text": text,
-                "similarity": similarity,
-                "index": i
+                "text": candidate_texts[valid[pos]],
+                "similarity": float(similarities[pos]),
+                "index": int(valid[pos])
             }
-            for i, (text, similarity) in enumerate(zip(candidate_texts, similarities))
+            for pos in top_positions
         ]
-        
-        # Sort by similarity (descending) and take top_k
-        result_items.sort(key=lambda x: x["similarity"], reverse=True)
-        return result_items[:top_k]
+
+    def batch_cosine(self, query: "np.ndarray", candidates: "np.ndarray") -> "np.ndarray":
+        """
+        Compute cosine similarity of one query against many candidates.
+
+        A single matrix-vector product plus one row-norm pass replaces the
+        per-pair dot/norm dispatches, so the whole batch costs two NumPy
+        calls (or one fused Numba kernel) regardless of candidate count.
+
+        Args:
+            query: float32 query vector of shape (D,), any length.
+            candidates: float32 candidate matrix of shape (N, D).
+
+        Returns:
+            np.ndarray: float32 similarities of shape (N,).
+        """
+        norm = np.linalg.norm(query)
+        if norm == 0 or candidates.shape[0] == 0:
+            return np.zeros(candidates.shape[0], dtype=np.float32)
+
+        return _batch_cosine(query / norm, candidates)
 
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """
@@ -193,10 +438,11 @@ class EmbeddingService:
         Returns:
             float: Cosine similarity.
         """
-        # Convert to numpy arrays
-        vec1_np = np.array(vec1)
-        vec2_np = np.array(vec2)
-        
+        # Convert to numpy arrays; float32 ndarrays (the service's native
+        # representation) pass through without a copy or float64 upcast
+        vec1_np = np.asarray(vec1, dtype=np.float32)
+        vec2_np = np.asarray(vec2, dtype=np.float32)
+
         # Calculate dot product and magnitudes
         dot_product = np.dot(vec1_np, vec2_np)
         magnitude1 = np.linalg.norm(vec1_np)
@@ -208,25 +454,156 @@ class EmbeddingService:
         
         return dot_product / (magnitude1 * magnitude2)
 
-    def _add_to_cache(self, key: str, embedding: List[float]) -> None:
+    def _normalize(self, embedding: Union[List[float], "np.ndarray"]) -> "np.ndarray":
+        """
+        Convert an embedding to a unit-length float32 array.
+
+        Args:
+            embedding: Embedding vector.
+
+        Returns:
+            np.ndarray: The L2-normalized float32 embedding.
+        """
+        arr = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(arr)
+        return arr / norm if norm > 0 else arr
+
+    @staticmethod
+    def _cache_key(provider: str, model: str, text: str) -> bytes:
+        """
+        Build a fixed-size cache key for a (provider, model, text) triple.
+
+        Keys are 16-byte BLAKE2b digests rather than the full text, so the
+        cache never holds a second copy of long prompts and hashing on
+        lookup is O(len(text)) once instead of per dict probe.
+
+        Args:
+            provider: Provider name.
+            model: Model name.
+            text: The text being embedded.
+
+        Returns:
+            bytes: 16-byte digest usable as a dict key.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(provider.encode())
+        h.update(b"\0")
+        h.update(model.encode())
+        h.update(b"\0")
+        h.update(text.encode())
+        return h.digest()
+
+    def _add_to_cache(self, key: bytes, embedding: Union[List[float], "np.ndarray"], provider: str) -> None:
         """
         Add an embedding to the cache.
 
+        Cached values are pre-normalized float32 arrays, so similarity
+        lookups never re-box Python lists or recompute norms.
+
         Args:
             key: Cache key.
             embedding: Embedding vector.
+            provider: Provider the embedding came from.
         """
-        # If cache is full, remove oldest item
-        if len(self.cache) >= self.max_cache_size:
-            oldest_key = next(iter(self.cache))
-            del self.cache[oldest_key]
-        
-        # Add to cache
-        self.cache[key] = embedding
+        # If cache is full, evict the least recently used entry
+        if len(self.cache) >= self.max_cache_size and key not in self.cache:
+            evicted_key, _ = self.cache.popitem(last=False)
+            self._key_providers.pop(evicted_key, None)
+            self._matrix_remove(evicted_key)
+
+        # Add to cache (most recently used position)
+        normalized = self._normalize(embedding)
+        self.cache[key] = normalized
+        self.cache.move_to_end(key)
+        self._key_providers[key] = provider
+        self._matrix_add(key, normalized)
+
+    def _semantic_match(self, normalized: "np.ndarray") -> Optional["np.ndarray"]:
+        """
+        Find a cached embedding that is nearly identical to a fresh one.
+
+        Since all tracked vectors are unit-length, one matmul against the
+        cache matrix yields every cosine similarity at once.
+
+        Args:
+            normalized: L2-normalized float32 embedding.
+
+        Returns:
+            Optional[np.ndarray]: The canonical cached vector if its cosine
+                similarity reaches the semantic cache threshold, else None.
+        """
+        count = len(self._matrix_keys)
+        if count == 0 or self.semantic_cache_threshold >= 1.0:
+            return None
+        if normalized.shape[0] != self._cache_matrix.shape[1]:
+            return None
+
+        similarities = self._cache_matrix[:count] @ normalized
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.semantic_cache_threshold:
+            return self.cache.get(self._matrix_keys[best])
+        return None
+
+    def _matrix_add(self, key: bytes, normalized: "np.ndarray") -> None:
+        """
+        Mirror a cached embedding into the semantic cache matrix.
+
+        Vectors whose dimension differs from the matrix (e.g. a different
+        embedding model) are simply not tracked.
+
+        Args:
+            key: Cache key of the entry.
+            normalized: L2-normalized float32 embedding.
+        """
+        row = self._matrix_index.get(key)
+        if row is not None:
+            self._cache_matrix[row] = normalized
+            return
+
+        count = len(self._matrix_keys)
+        if self._cache_matrix is None:
+            self._cache_matrix = np.empty((64, normalized.shape[0]), dtype=np.float32)
+        elif normalized.shape[0] != self._cache_matrix.shape[1]:
+            return
+        elif count == self._cache_matrix.shape[0]:
+            # Double capacity so appends stay amortized O(1)
+            grown = np.empty((count * 2, self._cache_matrix.shape[1]), dtype=np.float32)
+            grown[:count] = self._cache_matrix
+            self._cache_matrix = grown
+
+        self._cache_matrix[count] = normalized
+        self._matrix_keys.append(key)
+        self._matrix_index[key] = count
+
+    def _matrix_remove(self, key: bytes) -> None:
+        """
+        Drop an evicted entry's row from the semantic cache matrix.
+
+        The last row is swapped into the freed slot so the live rows stay
+        contiguous for the matmul.
+
+        Args:
+            key: Cache key of the evicted entry.
+        """
+        row = self._matrix_index.pop(key, None)
+        if row is None:
+            return
+
+        last = len(self._matrix_keys) - 1
+        if row != last:
+            last_key = self._matrix_keys[last]
+            self._cache_matrix[row] = self._cache_matrix[last]
+            self._matrix_keys[row] = last_key
+            self._matrix_index[last_key] = row
+        self._matrix_keys.pop()
 
     def clear_cache(self) -> None:
         """Clear the embedding cache."""
-        self.cache = {}
+        self.cache = OrderedDict()
+        self._key_providers = {}
+        self._cache_matrix = None
+        self._matrix_keys = []
+        self._matrix_index = {}
         self.logger.info("Embedding cache cleared")
 
     def get_cache_stats(self) -> Dict[str, Any]:
@@ -240,5 +617,5 @@ class EmbeddingService:
             "enabled": self.cache_enabled,
             "size": len(self.cache),
             "max_size": self.max_cache_size,
-            "providers": list(set(key.split(":")[0] for key in self.cache.keys()))
+            "providers": list(set(self._key_providers.values()))
         }
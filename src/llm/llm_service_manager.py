@@ -6,11 +6,11 @@ for interacting with different LLM providers and models.
 """
 
 import os
+import asyncio
 import logging
+import threading
 from typing import Dict, List, Any, Optional, Union, Callable
 
-from llm.deepseek_client import DeepSeekR1Client
-
 
 class LLMServiceManager:
     """
@@ -28,7 +28,12 @@ class LLMServiceManager:
         self.clients = {}
         self.default_provider = self.config.get("default_provider", "deepseek")
         self.default_model = self.config.get("default_model", "deepseek-reasoner")
-        
+
+        # Per-provider concurrency caps for the async paths; created lazily
+        # so they bind to the event loop that actually runs the requests
+        self.max_concurrent_requests = self.config.get("max_concurrent_requests", 64)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
         # Initialize logger
         self.logger = logging.getLogger(__name__)
         
@@ -44,6 +49,10 @@ class LLMServiceManager:
             
             if api_key:
                 try:
+                    # Imported here so loading the manager doesn't pull in
+                    # the provider SDK when no client gets configured
+                    from llm.deepseek_client import DeepSeekR1Client
+
                     self.clients["deepseek"] = DeepSeekR1Client(
                         api_key=api_key,
                         base_url=deepseek_config.get("base_url", "https://api.deepseek.com"),
@@ -52,11 +61,62 @@ class LLMServiceManager:
                         max_retries=deepseek_config.get("max_retries", 3)
                     )
                     self.logger.info("DeepSeek client initialized successfully")
+                    self._start_prewarm(self.clients["deepseek"])
                 except Exception as e:
                     self.logger.error(f"Failed to initialize DeepSeek client: {str(e)}")
             else:
                 self.logger.warning("DeepSeek API key not found, client not initialized")
 
+    def _start_prewarm(self, client: Any) -> None:
+        """
+        Open connections to a provider in the background at startup.
+
+        The first real request otherwise pays the TCP + TLS handshake on
+        the user's critical path. Several sockets are opened in parallel so
+        the shared pool already has warm keepalive connections.
+
+        Args:
+            client: Client instance to pre-warm.
+        """
+        for _ in range(self.config.get("pool_prewarm_count", 2)):
+            threading.Thread(target=self._prewarm, args=(client,), daemon=True).start()
+
+    def _prewarm(self, client: Any) -> None:
+        """
+        Issue one cheap request against a client to establish a connection.
+
+        Args:
+            client: Client instance to pre-warm.
+        """
+        try:
+            client.client.models.list()
+        except Exception as e:
+            # Pre-warming is best-effort; failures only mean the first
+            # real call pays the handshake as before
+            self.logger.debug(f"Connection pre-warm failed: {str(e)}")
+
+    def _get_semaphore(self, provider: str) -> asyncio.Semaphore:
+        """
+        Get the concurrency semaphore for a provider, creating it on first use.
+
+        Shaping traffic here keeps a large asyncio.gather from overrunning
+        the provider's rate limit and triggering synchronized 429 backoff.
+
+        Args:
+            provider: Provider name.
+
+        Returns:
+            asyncio.Semaphore: The provider's shared semaphore.
+        """
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            limit = self.config.get(provider, {}).get(
+                "max_concurrent", self.max_concurrent_requests
+            )
+            semaphore = asyncio.Semaphore(limit)
+            self._semaphores[provider] = semaphore
+        return semaphore
+
     def add_client(self, provider: str, client: Any) -> None:
         """
         Add a new LLM client.
@@ -119,35 +179,126 @@ class LLMServiceManager:
         """
         provider = provider or self.default_provider
         client = self.get_client(provider)
-        
-        # Override model if specified
-        if model and hasattr(client, "model_name"):
-            original_model = client.model_name
-            client.model_name = model
-        
-        try:
-            result = client.generate_text(
+
+        # The model override is passed through per call; mutating the shared
+        # client's model_name would race under concurrent requests
+        result = client.generate_text(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=stream,
+            callback=callback,
+            model=model,
+            **kwargs
+        )
+
+        # Add provider and model info to result
+        result["provider"] = provider
+        result["model"] = model or getattr(client, "model_name", self.default_model)
+
+        return result
+
+    def chat(
+        self,
+        messages: List[Dict[str, str]],
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        stream: bool = False,
+        callback: Optional[Callable] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Chat with an LLM.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content' keys.
+            provider: Provider to use. If None, uses the default provider.
+            model: Model to use. If None, uses the default model for the provider.
+            temperature: Temperature for text generation.
+            max_tokens: Maximum number of tokens to generate.
+            stream: Whether to stream the response.
+            callback: Optional callback function for streaming responses.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            Dict[str, Any]: The chat response and metadata.
+        """
+        provider = provider or self.default_provider
+        client = self.get_client(provider)
+
+        result = client.chat(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=stream,
+            callback=callback,
+            model=model,
+            **kwargs
+        )
+
+        # Add provider and model info to result
+        result["provider"] = provider
+        result["model"] = model or getattr(client, "model_name", self.default_model)
+
+        return result
+
+    async def agenerate_text(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        stream: bool = False,
+        callback: Optional[Callable] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Generate text using an LLM asynchronously.
+
+        Mirrors generate_text; callers can asyncio.gather many concurrent
+        requests over the client's shared connection pool.
+
+        Args:
+            prompt: The prompt to generate text from.
+            system_prompt: Optional system prompt to guide the model.
+            provider: Provider to use. If None, uses the default provider.
+            model: Model to use. If None, uses the default model for the provider.
+            temperature: Temperature for text generation.
+            max_tokens: Maximum number of tokens to generate.
+            stream: Whether to stream the response.
+            callback: Optional callback function for streaming responses.
+            **kwargs: Additional provider-specific parameters.
+
+        Returns:
+            Dict[str, Any]: The generated text and metadata.
+        """
+        provider = provider or self.default_provider
+        client = self.get_client(provider)
+
+        async with self._get_semaphore(provider):
+            result = await client.agenerate_text(
                 prompt=prompt,
                 system_prompt=system_prompt,
                 temperature=temperature,
                 max_tokens=max_tokens,
                 stream=stream,
                 callback=callback,
+                model=model,
                 **kwargs
             )
-            
-            # Add provider and model info to result
-            result["provider"] = provider
-            result["model"] = getattr(client, "model_name", model or self.default_model)
-            
-            return result
-        
-        finally:
-            # Restore original model if it was changed
-            if model and hasattr(client, "model_name"):
-                client.model_name = original_model
 
-    def chat(
+        # Add provider and model info to result
+        result["provider"] = provider
+        result["model"] = model or getattr(client, "model_name", self.default_model)
+
+        return result
+
+    async def achat(
         self,
         messages: List[Dict[str, str]],
         provider: Optional[str] = None,
@@ -159,7 +310,7 @@ class LLMServiceManager:
         **kwargs
     ) -> Dict[str, Any]:
         """
-        Chat with an LLM.
+        Chat with an LLM asynchronously.
 
         Args:
             messages: List of message dictionaries with 'role' and 'content' keys.
@@ -176,32 +327,51 @@ class LLMServiceManager:
         """
         provider = provider or self.default_provider
         client = self.get_client(provider)
-        
-        # Override model if specified
-        if model and hasattr(client, "model_name"):
-            original_model = client.model_name
-            client.model_name = model
-        
-        try:
-            result = client.chat(
+
+        async with self._get_semaphore(provider):
+            result = await client.achat(
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
                 stream=stream,
                 callback=callback,
+                model=model,
                 **kwargs
             )
-            
-            # Add provider and model info to result
-            result["provider"] = provider
-            result["model"] = getattr(client, "model_name", model or self.default_model)
-            
-            return result
-        
-        finally:
-            # Restore original model if it was changed
-            if model and hasattr(client, "model_name"):
-                client.model_name = original_model
+
+        # Add provider and model info to result
+        result["provider"] = provider
+        result["model"] = model or getattr(client, "model_name", self.default_model)
+
+        return result
+
+    async def aget_embedding(
+        self,
+        text: str,
+        provider: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> List[float]:
+        """
+        Get embedding for text asynchronously.
+
+        Args:
+            text: The text to get embedding for.
+            provider: Provider to use. If None, uses the default provider.
+            model: Model to use. If None, uses the default embedding model for the provider.
+
+        Returns:
+            List[float]: The embedding vector.
+        """
+        provider = provider or self.default_provider
+        client = self.get_client(provider)
+
+        # Use provider-specific embedding method
+        if hasattr(client, "aget_embedding"):
+            async with self._get_semaphore(provider):
+                return await client.aget_embedding(text, model=model)
+        else:
+            self.logger.error(f"Provider '{provider}' does not support async embeddings")
+            return []
 
     def get_embedding(
         self,
@@ -225,11 +395,38 @@ class LLMServiceManager:
         
         # Use provider-specific embedding method
         if hasattr(client, "get_embedding"):
-            return client.get_embedding(text)
+            return client.get_embedding(text, model=model)
         else:
             self.logger.error(f"Provider '{provider}' does not support embeddings")
             return []
 
+    def get_embeddings(
+        self,
+        texts: List[str],
+        provider: Optional[str] = None,
+        model: Optional[str] = None
+    ) -> List[List[float]]:
+        """
+        Get embeddings for multiple texts, batched into one API call when
+        the provider supports multi-input requests.
+
+        Args:
+            texts: The texts to get embeddings for.
+            provider: Provider to use. If None, uses the default provider.
+            model: Model to use. If None, uses the default embedding model for the provider.
+
+        Returns:
+            List[List[float]]: One embedding vector per input text, in order.
+        """
+        provider = provider or self.default_provider
+        client = self.get_client(provider)
+
+        if hasattr(client, "get_embeddings"):
+            return client.get_embeddings(texts, model=model)
+
+        # Fall back to per-text calls for providers without batch support
+        return [self.get_embedding(text, provider, model) for text in texts]
+
     def get_available_providers(self) -> List[str]:
         """
         Get list of available providers.
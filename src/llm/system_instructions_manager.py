@@ -6,12 +6,156 @@ management, and application of system instructions for the LLM.
 """
 
 import os
+import sys
+import bisect
+import heapq
 import logging
 import json
+from itertools import takewhile
 from typing import Dict, List, Any, Optional, Union
 
 from agent_core.models import SystemInstruction
 
+# orjson is an optional accelerator; stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Default system instructions as (category, text, priority). Defined once at
+# module scope and interned so every manager instance shares the same string
+# objects instead of re-building ten literals per construction.
+_DEFAULT_INSTRUCTIONS = (
+    (
+        "core",
+        sys.intern(
+            "You are a personal AI agent designed to assist users with a wide range of tasks. "
+            "You can access tools, browse the web, process information, and generate content."
+        ),
+        100
+    ),
+    (
+        "language",
+        sys.intern(
+            "- Default working language: English\n"
+            "- Use the language specified by user in messages as the working language when explicitly provided\n"
+            "- All thinking and responses must be in the working language\n"
+            "- Natural language arguments in tool calls must be in the working language"
+        ),
+        90
+    ),
+    (
+        "capabilities",
+        sys.intern(
+            "- Communicate with users through message tools\n"
+            "- Access a Linux sandbox environment with internet connection\n"
+            "- Use shell, text editor, browser, and other software\n"
+            "- Write and run code in Python and various programming languages\n"
+            "- Independently install required software packages and dependencies via shell\n"
+            "- Deploy websites or applications and provide public access\n"
+            "- Suggest users to temporarily take control of the browser for sensitive operations when necessary\n"
+            "- Utilize various tools to complete user-assigned tasks step by step"
+        ),
+        80
+    ),
+    (
+        "agent_loop",
+        sys.intern(
+            "You are operating in an agent loop, iteratively completing tasks through these steps:\n"
+            "1. Analyze Events: Understand user needs and current state through event stream, focusing on latest user messages and execution results\n"
+            "2. Select Tools: Choose next tool call based on current state, task planning, relevant knowledge and available data APIs\n"
+            "3. Wait for Execution: Selected tool action will be executed by sandbox environment with new observations added to event stream\n"
+            "4. Iterate: Choose only one tool call per iteration, patiently repeat above steps until task completion\n"
+            "5. Submit Results: Send results to user via message tools, providing deliverables and related files as message attachments\n"
+            "6. Enter Standby: Enter idle state when all tasks are completed or user explicitly requests to stop, and wait for new tasks"
+        ),
+        70
+    ),
+    (
+        "planning",
+        sys.intern(
+            "- System is equipped with planner module for overall task planning\n"
+            "- Task planning will be provided as events in the event stream\n"
+            "- Task plans use numbered pseudocode to represent execution steps\n"
+            "- Each planning update includes the current step number, status, and reflection\n"
+            "- Pseudocode representing execution steps will update when overall task objective changes\n"
+            "- Must complete all planned steps and reach the final step number by completion"
+        ),
+        60
+    ),
+    (
+        "knowledge",
+        sys.intern(
+            "- System is equipped with knowledge and memory module for best practice references\n"
+            "- Task-relevant knowledge will be provided as events in the event stream\n"
+            "- Each knowledge item has its scope and should only be adopted when conditions are met"
+        ),
+        50
+    ),
+    (
+        "messaging",
+        sys.intern(
+            "- Communicate with users via message tools instead of direct text responses\n"
+            "- Reply immediately to new user messages before other operations\n"
+            "- First reply must be brief, only confirming receipt without specific solutions\n"
+            "- Events from Planner, Knowledge, and Datasource modules are system-generated, no reply needed\n"
+            "- Notify users with brief explanation when changing methods or strategies\n"
+            "- Message tools are divided into notify (non-blocking, no reply needed from users) and ask (blocking, reply required)\n"
+            "- Actively use notify for progress updates, but reserve ask for only essential needs to minimize user disruption and avoid blocking progress\n"
+            "- Provide all relevant files as attachments, as users may not have direct access to local filesystem\n"
+            "- Must message users with results and deliverables before entering idle state upon task completion"
+        ),
+        40
+    ),
+    (
+        "tools",
+        sys.intern(
+            "- Must respond with a tool use (function calling); plain text responses are forbidden\n"
+            "- Do not mention any specific tool names to users in messages\n"
+            "- Carefully verify available tools; do not fabricate non-existent tools\n"
+            "- Events may originate from other system modules; only use explicitly provided tools"
+        ),
+        30
+    ),
+    (
+        "browser",
+        sys.intern(
+            "- Must use browser tools to access and comprehend all URLs provided by users in messages\n"
+            "- Must use browser tools to access URLs from search tool results\n"
+            "- Actively explore valuable links for deeper information, either by clicking elements or accessing URLs directly\n"
+            "- Browser tools only return elements in visible viewport by default\n"
+            "- Visible elements are returned as `index[:]<tag>text</tag>`, where index is for interactive elements in subsequent browser actions\n"
+            "- Due to technical limitations, not all interactive elements may be identified; use coordinates to interact with unlisted elements\n"
+            "- Browser tools automatically attempt to extract page content, providing it in Markdown format if successful\n"
+            "- Extracted Markdown includes text beyond viewport but omits links and images; completeness not guaranteed\n"
+            "- If extracted Markdown is complete and sufficient for the task, no scrolling is needed; otherwise, must actively scroll to view the entire page\n"
+            "- Use message tools to suggest user to take over the browser for sensitive operations or actions with side effects when necessary"
+        ),
+        20
+    ),
+    (
+        "coding",
+        sys.intern(
+            "- Must save code to files before execution; direct code input to interpreter commands is forbidden\n"
+            "- Write Python code for complex mathematical calculations and analysis\n"
+            "- Use search tools to find solutions when encountering unfamiliar problems\n"
+            "- For index.html referencing local resources, use deployment tools directly, or package everything into a zip file and provide it as a message attachment"
+        ),
+        10
+    ),
+)
+
+
+def _instruction_to_dict(instr: SystemInstruction) -> Dict[str, Any]:
+    """Serialize a SystemInstruction for JSON output."""
+    return {
+        "instruction_id": instr.instruction_id,
+        "category": instr.category,
+        "instruction_text": instr.instruction_text,
+        "priority": instr.priority
+    }
+
 
 class SystemInstructionsManager:
     """
@@ -27,7 +171,23 @@ class SystemInstructionsManager:
         """
         self.config = config or {}
         self.instructions = {}  # category -> List[SystemInstruction]
-        
+
+        # Combined-text results keyed by (categories, min_priority, separator);
+        # invalidated whenever the instruction set changes. Prompt building
+        # hits this on every turn while instructions change rarely.
+        self._text_cache = {}
+
+        # Pre-joined text per (category, separator), so full-prompt rebuilds
+        # join ~K category strings instead of N instruction strings
+        self._category_text_cache = {}
+
+        # instruction_id -> category, so removal doesn't scan every category,
+        # plus per-category counters for generated IDs. Counters only move
+        # forward, so a generated ID can't collide with one freed by a delete
+        # the way the old len(list)-based scheme could.
+        self._id_index = {}
+        self._id_counters = {}
+
         # Initialize logger
         self.logger = logging.getLogger(__name__)
         
@@ -37,142 +197,12 @@ class SystemInstructionsManager:
 
     def _load_default_instructions(self) -> None:
         """Load default system instructions."""
-        # Core capabilities
-        self.add_instruction(
-            category="core",
-            instruction_text=(
-                "You are a personal AI agent designed to assist users with a wide range of tasks. "
-                "You can access tools, browse the web, process information, and generate content."
-            ),
-            priority=100
-        )
-        
-        # Language settings
-        self.add_instruction(
-            category="language",
-            instruction_text=(
-                "- Default working language: English\n"
-                "- Use the language specified by user in messages as the working language when explicitly provided\n"
-                "- All thinking and responses must be in the working language\n"
-                "- Natural language arguments in tool calls must be in the working language"
-            ),
-            priority=90
-        )
-        
-        # System capabilities
-        self.add_instruction(
-            category="capabilities",
-            instruction_text=(
-                "- Communicate with users through message tools\n"
-                "- Access a Linux sandbox environment with internet connection\n"
-                "- Use shell, text editor, browser, and other software\n"
-                "- Write and run code in Python and various programming languages\n"
-                "- Independently install required software packages and dependencies via shell\n"
-                "- Deploy websites or applications and provide public access\n"
-                "- Suggest users to temporarily take control of the browser for sensitive operations when necessary\n"
-                "- Utilize various tools to complete user-assigned tasks step by step"
-            ),
-            priority=80
-        )
-        
-        # Agent loop
-        self.add_instruction(
-            category="agent_loop",
-            instruction_text=(
-                "You are operating in an agent loop, iteratively completing tasks through these steps:\n"
-                "1. Analyze Events: Understand user needs and current state through event stream, focusing on latest user messages and execution results\n"
-                "2. Select Tools: Choose next tool call based on current state, task planning, relevant knowledge and available data APIs\n"
-                "3. Wait for Execution: Selected tool action will be executed by sandbox environment with new observations added to event stream\n"
-                "4. Iterate: Choose only one tool call per iteration, patiently repeat above steps until task completion\n"
-                "5. Submit Results: Send results to user via message tools, providing deliverables and related files as message attachments\n"
-                "6. Enter Standby: Enter idle state when all tasks are completed or user explicitly requests to stop, and wait for new tasks"
-            ),
-            priority=70
-        )
-        
-        # Planning module
-        self.add_instruction(
-            category="planning",
-            instruction_text=(
-                "- System is equipped with planner module for overall task planning\n"
-                "- Task planning will be provided as events in the event stream\n"
-                "- Task plans use numbered pseudocode to represent execution steps\n"
-                "- Each planning update includes the current step number, status, and reflection\n"
-                "- Pseudocode representing execution steps will update when overall task objective changes\n"
-                "- Must complete all planned steps and reach the final step number by completion"
-            ),
-            priority=60
-        )
-        
-        # Knowledge module
-        self.add_instruction(
-            category="knowledge",
-            instruction_text=(
-                "- System is equipped with knowledge and memory module for best practice references\n"
-                "- Task-relevant knowledge will be provided as events in the event stream\n"
-                "- Each knowledge item has its scope and should only be adopted when conditions are met"
-            ),
-            priority=50
-        )
-        
-        # Message rules
-        self.add_instruction(
-            category="messaging",
-            instruction_text=(
-                "- Communicate with users via message tools instead of direct text responses\n"
-                "- Reply immediately to new user messages before other operations\n"
-                "- First reply must be brief, only confirming receipt without specific solutions\n"
-                "- Events from Planner, Knowledge, and Datasource modules are system-generated, no reply needed\n"
-                "- Notify users with brief explanation when changing methods or strategies\n"
-                "- Message tools are divided into notify (non-blocking, no reply needed from users) and ask (blocking, reply required)\n"
-                "- Actively use notify for progress updates, but reserve ask for only essential needs to minimize user disruption and avoid blocking progress\n"
-                "- Provide all relevant files as attachments, as users may not have direct access to local filesystem\n"
-                "- Must message users with results and deliverables before entering idle state upon task completion"
-            ),
-            priority=40
-        )
-        
-        # Tool use rules
-        self.add_instruction(
-            category="tools",
-            instruction_text=(
-                "- Must respond with a tool use (function calling); plain text responses are forbidden\n"
-                "- Do not mention any specific tool names to users in messages\n"
-                "- Carefully verify available tools; do not fabricate non-existent tools\n"
-                "- Events may originate from other system modules; only use explicitly provided tools"
-            ),
-            priority=30
-        )
-        
-        # Browser rules
-        self.add_instruction(
-            category="browser",
-            instruction_text=(
-                "- Must use browser tools to access and comprehend all URLs provided by users in messages\n"
-                "- Must use browser tools to access URLs from search tool results\n"
-                "- Actively explore valuable links for deeper information, either by clicking elements or accessing URLs directly\n"
-                "- Browser tools only return elements in visible viewport by default\n"
-                "- Visible elements are returned as `index[:]<tag>text</tag>`, where index is for interactive elements in subsequent browser actions\n"
-                "- Due to technical limitations, not all interactive elements may be identified; use coordinates to interact with unlisted elements\n"
-                "- Browser tools automatically attempt to extract page content, providing it in Markdown format if successful\n"
-                "- Extracted Markdown includes text beyond viewport but omits links and images; completeness not guaranteed\n"
-                "- If extracted Markdown is complete and sufficient for the task, no scrolling is needed; otherwise, must actively scroll to view the entire page\n"
-                "- Use message tools to suggest user to take over the browser for sensitive operations or actions with side effects when necessary"
-            ),
-            priority=20
-        )
-        
-        # Coding rules
-        self.add_instruction(
-            category="coding",
-            instruction_text=(
-                "- Must save code to files before execution; direct code input to interpreter commands is forbidden\n"
-                "- Write Python code for complex mathematical calculations and analysis\n"
-                "- Use search tools to find solutions when encountering unfamiliar problems\n"
-                "- For index.html referencing local resources, use deployment tools directly, or package everything into a zip file and provide it as a message attachment"
-            ),
-            priority=10
-        )
+        for category, instruction_text, priority in _DEFAULT_INSTRUCTIONS:
+            self.add_instruction(
+                category=category,
+                instruction_text=instruction_text,
+                priority=priority
+            )
 
     def add_instruction(
         self,
@@ -195,8 +225,16 @@ class SystemInstructionsManager:
         """
         # Generate ID if not provided
         if instruction_id is None:
-            instruction_id = f"{category}_{len(self.instructions.get(category, []))}"
-        
+            counter = self._id_counters.get(category, 0)
+            instruction_id = f"{category}_{counter}"
+            while instruction_id in self._id_index:
+                counter += 1
+                instruction_id = f"{category}_{counter}"
+            self._id_counters[category] = counter + 1
+        elif instruction_id in self._id_index:
+            # Replace an existing instruction with the same ID
+            self.remove_instruction(instruction_id)
+
         # Create instruction
         instruction = SystemInstruction(
             instruction_id=instruction_id,
@@ -208,13 +246,14 @@ class SystemInstructionsManager:
         # Add to instructions
         if category not in self.instructions:
             self.instructions[category] = []
-        
-        self.instructions[category].append(instruction)
-        
-        # Sort by priority (higher first)
-        self.instructions[category].sort(key=lambda x: x.priority, reverse=True)
-        
-        self.logger.info(f"Added instruction {instruction_id} to category {category}")
+
+        # Each category list is kept sorted by priority (higher first), so a
+        # single O(log n) ordered insertion replaces the full re-sort per add
+        bisect.insort(self.instructions[category], instruction, key=lambda x: -x.priority)
+
+        self._id_index[instruction_id] = category
+        self._invalidate_cache(category)
+        self.logger.info("Added instruction %s to category %s", instruction_id, category)
         return instruction_id
 
     def get_instructions(
@@ -232,23 +271,20 @@ class SystemInstructionsManager:
         Returns:
             List[SystemInstruction]: The system instructions.
         """
-        result = []
-        
         # Get all categories if none specified
         if categories is None:
             categories = list(self.instructions.keys())
-        
-        # Get instructions for each category
-        for category in categories:
-            if category in self.instructions:
-                for instruction in self.instructions[category]:
-                    if instruction.priority >= min_priority:
-                        result.append(instruction)
-        
-        # Sort by priority (higher first)
-        result.sort(key=lambda x: x.priority, reverse=True)
-        
-        return result
+
+        # Each category list is already sorted by descending priority, so
+        # the filter can stop at the first too-low priority and an O(N log K)
+        # K-way merge replaces re-sorting the combined list
+        per_category = [
+            takewhile(lambda x: x.priority >= min_priority, self.instructions[category])
+            for category in categories
+            if category in self.instructions
+        ]
+
+        return list(heapq.merge(*per_category, key=lambda x: -x.priority))
 
     def get_instruction_text(
         self,
@@ -267,8 +303,107 @@ class SystemInstructionsManager:
         Returns:
             str: The combined instruction text.
         """
-        instructions = self.get_instructions(categories, min_priority)
-        return separator.join(instr.instruction_text for instr in instructions)
+        cache_key = (
+            tuple(categories) if categories is not None else None,
+            min_priority,
+            separator
+        )
+        cached = self._text_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Common case: nothing filtered and category ranges don't overlap,
+        # so the text is a join of K cached category strings
+        text = self._join_category_texts(categories, min_priority, separator)
+        if text is None:
+            instructions = self.get_instructions(categories, min_priority)
+            text = separator.join(instr.instruction_text for instr in instructions)
+
+        self._text_cache[cache_key] = text
+        return text
+
+    def _invalidate_cache(self, category: Optional[str] = None) -> None:
+        """
+        Drop memoized text after a change to the instruction set.
+
+        Args:
+            category: Category that changed. If None, all per-category
+                entries are dropped as well.
+        """
+        self._text_cache.clear()
+        if category is None:
+            self._category_text_cache.clear()
+        else:
+            for key in [k for k in self._category_text_cache if k[0] == category]:
+                del self._category_text_cache[key]
+
+    def _category_text(self, category: str, separator: str) -> str:
+        """
+        Get the joined text of one category, memoized per separator.
+
+        Args:
+            category: Category to join.
+            separator: Separator between instructions.
+
+        Returns:
+            str: The category's instruction texts joined in priority order.
+        """
+        key = (category, separator)
+        cached = self._category_text_cache.get(key)
+        if cached is None:
+            cached = separator.join(
+                instr.instruction_text for instr in self.instructions[category]
+            )
+            self._category_text_cache[key] = cached
+        return cached
+
+    def _join_category_texts(
+        self,
+        categories: Optional[List[str]],
+        min_priority: int,
+        separator: str
+    ) -> Optional[str]:
+        """
+        Build combined text from per-category strings when that is safe.
+
+        The shortcut is only valid when no instruction is filtered out and
+        the categories' priority ranges don't overlap, so that
+        concatenating whole categories in range order reproduces the exact
+        global priority order. Returns None when those conditions don't
+        hold and the caller must take the exact path.
+
+        Args:
+            categories: Selected categories, or None for all.
+            min_priority: Minimum priority of instructions to include.
+            separator: Separator between instructions.
+
+        Returns:
+            Optional[str]: The combined text, or None if the shortcut
+                doesn't apply.
+        """
+        if categories is None:
+            categories = list(self.instructions.keys())
+
+        ranges = []
+        for category in categories:
+            instructions = self.instructions.get(category)
+            if not instructions:
+                continue
+            if instructions[-1].priority < min_priority:
+                # Filtering would drop instructions; take the exact path
+                return None
+            ranges.append((instructions[0].priority, instructions[-1].priority, category))
+
+        if not ranges:
+            return ""
+
+        ranges.sort(key=lambda r: -r[0])
+        for (_, prev_min, _), (next_max, _, _) in zip(ranges, ranges[1:]):
+            if prev_min <= next_max:
+                # Overlapping priority ranges interleave across categories
+                return None
+
+        return separator.join(self._category_text(category, separator) for _, _, category in ranges)
 
     def remove_instruction(self, instruction_id: str) -> bool:
         """
@@ -280,13 +415,18 @@ class SystemInstructionsManager:
         Returns:
             bool: True if the instruction was removed, False if it wasn't found.
         """
-        for category, instructions in self.instructions.items():
-            for i, instruction in enumerate(instructions):
-                if instruction.instruction_id == instruction_id:
-                    del self.instructions[category][i]
-                    self.logger.info(f"Removed instruction {instruction_id} from category {category}")
-                    return True
-        
+        category = self._id_index.get(instruction_id)
+        if category is None:
+            return False
+
+        for i, instruction in enumerate(self.instructions[category]):
+            if instruction.instruction_id == instruction_id:
+                del self.instructions[category][i]
+                del self._id_index[instruction_id]
+                self._invalidate_cache(category)
+                self.logger.info("Removed instruction %s from category %s", instruction_id, category)
+                return True
+
         return False
 
     def clear_category(self, category: str) -> bool:
@@ -300,8 +440,11 @@ class SystemInstructionsManager:
             bool: True if the category was cleared, False if it wasn't found.
         """
         if category in self.instructions:
+            for instruction in self.instructions[category]:
+                self._id_index.pop(instruction.instruction_id, None)
             self.instructions[category] = []
-            self.logger.info(f"Cleared all instructions in category {category}")
+            self._invalidate_cache(category)
+            self.logger.info("Cleared all instructions in category %s", category)
             return True
         
         return False
@@ -317,28 +460,24 @@ class SystemInstructionsManager:
             bool: True if successful, False otherwise.
         """
         try:
-            # Convert to serializable format
-            data = {}
-            for category, instructions in self.instructions.items():
-                data[category] = [
-                    {
-                        "instruction_id": instr.instruction_id,
-                        "category": instr.category,
-                        "instruction_text": instr.instruction_text,
-                        "priority": instr.priority
-                    }
-                    for instr in instructions
-                ]
-            
-            # Write to file
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            self.logger.info(f"Saved instructions to {file_path}")
+            # Serialize instructions directly via the encoder's default hook
+            # instead of building an intermediate dict structure first
+            if orjson is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(
+                        self.instructions,
+                        option=orjson.OPT_INDENT_2,
+                        default=_instruction_to_dict
+                    ))
+            else:
+                with open(file_path, 'w') as f:
+                    json.dump(self.instructions, f, indent=2, default=_instruction_to_dict)
+
+            self.logger.info("Saved instructions to %s", file_path)
             return True
         
         except Exception as e:
-            self.logger.error(f"Error saving instructions to {file_path}: {str(e)}")
+            self.logger.error("Error saving instructions to %s: %s", file_path, str(e))
             return False
 
     def load_from_file(self, file_path: str) -> bool:
@@ -353,12 +492,19 @@ class SystemInstructionsManager:
         """
         try:
             # Read from file
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r') as f:
+                    data = json.load(f)
             
             # Clear existing instructions
             self.instructions = {}
-            
+            self._id_index = {}
+            self._id_counters = {}
+            self._invalidate_cache()
+
             # Load instructions
             for category, instructions in data.items():
                 self.instructions[category] = []
@@ -370,10 +516,16 @@ class SystemInstructionsManager:
                         priority=instr_data["priority"]
                     )
                     self.instructions[category].append(instruction)
+                    self._id_index[instruction.instruction_id] = category
+
+                # Restore the descending-priority invariant in one pass;
+                # files written by save_to_file are already ordered but
+                # hand-edited ones may not be
+                self.instructions[category].sort(key=lambda x: -x.priority)
             
-            self.logger.info(f"Loaded instructions from {file_path}")
+            self.logger.info("Loaded instructions from %s", file_path)
             return True
         
         except Exception as e:
-            self.logger.error(f"Error loading instructions from {file_path}: {str(e)}")
+            self.logger.error("Error loading instructions from %s: %s", file_path, str(e))
             return False
@@ -0,0 +1,100 @@
+"""
+Accelerated dependency-graph helpers for execution plans.
+
+Step dependencies are flattened once per plan into CSR-style arrays
+(indptr/indices over int32 buffers) so ready-set computation runs over
+flat memory with a Numba-compiled kernel instead of re-resolving step-ID
+strings per query. Both numpy and numba are optional; callers fall back
+to pure Python when ``ready_steps`` is None.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional accelerator
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional accelerator
+    njit = None
+
+
+def build_csr(steps):
+    """
+    Flatten step dependencies into CSR adjacency arrays.
+
+    Args:
+        steps: List of PlanStep objects in plan order.
+
+    Returns:
+        Tuple of (indptr, indices) int32 arrays, where row i holds the
+        step indices that step i depends on and unknown step IDs are
+        encoded as -1, or None if numpy is unavailable.
+    """
+    if np is None:
+        return None
+
+    id_to_idx = {step.step_id: i for i, step in enumerate(steps)}
+
+    indptr = np.empty(len(steps) + 1, dtype=np.int32)
+    indptr[0] = 0
+    flat = []
+    for i, step in enumerate(steps):
+        for dep_id in step.dependencies:
+            flat.append(id_to_idx.get(dep_id, -1))
+        indptr[i + 1] = len(flat)
+
+    indices = np.asarray(flat, dtype=np.int32)
+    return indptr, indices
+
+
+def as_status_array(status_codes):
+    """
+    Convert a list of step status codes to an int8 numpy array.
+
+    Args:
+        status_codes: List of ints (0=pending, 1=completed, 2=other).
+
+    Returns:
+        numpy int8 array, or None if numpy is unavailable.
+    """
+    if np is None:
+        return None
+    return np.asarray(status_codes, dtype=np.int8)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def ready_steps(status, indptr, indices):
+        """
+        Find pending steps whose dependencies are all completed.
+
+        Args:
+            status: int8 array of status codes (0=pending, 1=completed,
+                2=other).
+            indptr: CSR row pointers from build_csr.
+            indices: CSR dependency indices from build_csr; -1 marks a
+                dependency on an unknown step and is never satisfied.
+
+        Returns:
+            int32 array of ready step indices.
+        """
+        out = np.empty(len(status), dtype=np.int32)
+        count = 0
+        for i in range(len(status)):
+            if status[i] != 0:
+                continue
+            ready = True
+            for j in range(indptr[i], indptr[i + 1]):
+                dep = indices[j]
+                if dep < 0 or status[dep] != 1:
+                    ready = False
+                    break
+            if ready:
+                out[count] = i
+                count += 1
+        return out[:count]
+
+else:
+    ready_steps = None
@@ -0,0 +1,65 @@
+"""
+Accelerated traversal helpers for tree-of-thoughts planning.
+
+This module holds the Numba-compiled kernels used to extract the best path
+from a thought tree. Nodes are represented structure-of-arrays style
+(parallel parent-index and score arrays) so the traversal runs over flat
+int32/float32 buffers instead of chasing Python object pointers. Both
+numba and numpy are optional; callers fall back to pure Python when
+``extract_path`` is None.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # pragma: no cover - optional accelerators
+    np = None
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def extract_path(parent_idx, best):
+        """
+        Walk parent indices from a leaf back to the root.
+
+        Args:
+            parent_idx: int32 array where parent_idx[i] is the index of
+                node i's parent, and -1 marks the root.
+            best: Index of the best leaf node.
+
+        Returns:
+            int32 array of node indices from the root's child down to the
+            leaf, excluding the root itself.
+        """
+        length = 0
+        node = best
+        while node != -1 and parent_idx[node] != -1:
+            length += 1
+            node = parent_idx[node]
+
+        path = np.empty(length, dtype=np.int32)
+        node = best
+        for i in range(length - 1, -1, -1):
+            path[i] = node
+            node = parent_idx[node]
+        return path
+
+else:
+    extract_path = None
+
+
+def as_parent_array(parent_indices):
+    """
+    Convert a Python list of parent indices to an int32 numpy array.
+
+    Args:
+        parent_indices: List of parent indices (-1 for the root).
+
+    Returns:
+        numpy int32 array, or None if numpy is unavailable.
+    """
+    if np is None:
+        return None
+    return np.asarray(parent_indices, dtype=np.int32)
@@ -0,0 +1,164 @@
+"""
+LLM response cache for the Planning Module component.
+
+This module implements a small caching layer for planning LLM calls so that
+re-planning the same task (or exploring alternatives over an identical
+context) does not pay the network and token-generation latency again.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+class MemoryCacheBackend:
+    """
+    In-process cache backend with LRU eviction and per-entry TTL.
+
+    Any object exposing the same ``get``/``set`` interface (e.g. a thin
+    Redis wrapper) can be used as a backend for LLMCache instead.
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 3600.0):
+        """
+        Initialize the MemoryCacheBackend.
+
+        Args:
+            max_size: Maximum number of cached completions to retain.
+            ttl_seconds: Seconds after which a cached completion expires.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached completion.
+
+        Args:
+            key: Cache key produced by LLMCache.make_key.
+
+        Returns:
+            Optional[str]: The cached completion, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, completion = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return completion
+
+    def set(self, key: str, completion: str) -> None:
+        """
+        Store a completion in the cache.
+
+        Args:
+            key: Cache key produced by LLMCache.make_key.
+            completion: The LLM completion text to cache.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, completion)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached completions."""
+        with self._lock:
+            self._entries.clear()
+
+
+class LLMCache:
+    """
+    Content-addressed cache for planning LLM completions.
+
+    Keys are derived from everything that determines the completion: the
+    model, the full prompt, the tool set, and the sampling temperature.
+    """
+
+    def __init__(self, backend=None):
+        """
+        Initialize the LLMCache.
+
+        Args:
+            backend: Cache backend with get/set methods. Defaults to an
+                in-process MemoryCacheBackend.
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def make_key(
+        prompt: str,
+        model: Optional[str] = None,
+        tool_ids: Optional[List[str]] = None,
+        temperature: float = 0.0
+    ) -> str:
+        """
+        Build a deterministic cache key for a planning request.
+
+        Args:
+            prompt: The full planning prompt.
+            model: Optional model identifier.
+            tool_ids: Optional list of tool IDs available to the planner.
+            temperature: Sampling temperature of the request.
+
+        Returns:
+            str: Hex digest uniquely identifying the request.
+        """
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "tool_ids": sorted(tool_ids) if tool_ids else [],
+            "temperature": temperature
+        }
+        if orjson is not None:
+            serialized = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        else:
+            serialized = json.dumps(payload, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(serialized).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached completion, tolerating backend failures.
+
+        Args:
+            key: Cache key produced by make_key.
+
+        Returns:
+            Optional[str]: The cached completion, or None on a miss.
+        """
+        try:
+            return self.backend.get(key)
+        except Exception as e:
+            self.logger.debug(f"LLM cache read failed: {str(e)}")
+            return None
+
+    def set(self, key: str, completion: str) -> None:
+        """
+        Store a completion, tolerating backend failures.
+
+        Args:
+            key: Cache key produced by make_key.
+            completion: The LLM completion text to cache.
+        """
+        try:
+            self.backend.set(key, completion)
+        except Exception as e:
+            self.logger.debug(f"LLM cache write failed: {str(e)}")
@@ -0,0 +1,283 @@
+"""
+Models for the Planning Module component.
+
+This module defines the data structures used by the Planning Module component.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from planning import _plan_graph
+
+
+class PlanningStrategy(Enum):
+    """Strategies for generating plans."""
+    CHAIN_OF_THOUGHT = "chain_of_thought"
+    TREE_OF_THOUGHTS = "tree_of_thoughts"
+    REACT = "react"
+    HIERARCHICAL = "hierarchical"
+    GOAL_DECOMPOSITION = "goal_decomposition"
+
+
+class PlanStatus(Enum):
+    """Status of a plan."""
+    CREATED = "created"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class StepStatus(Enum):
+    """Status of a plan step."""
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+class PlanStep:
+    """A step in an execution plan."""
+    __slots__ = (
+        "step_id", "description", "action", "expected_outcome",
+        "verification_method", "dependencies", "status", "result"
+    )
+
+    def __init__(
+        self,
+        step_id: str,
+        description: str,
+        action: Dict[str, Any],
+        expected_outcome: str,
+        verification_method: Dict[str, Any],
+        dependencies: List[str],
+        status: StepStatus = StepStatus.PENDING,
+        result: Optional[Dict[str, Any]] = None
+    ):
+        self.step_id = step_id
+        self.description = description
+        self.action = action
+        self.expected_outcome = expected_outcome
+        self.verification_method = verification_method
+        self.dependencies = dependencies
+        self.status = status
+        self.result = result
+
+
+class Plan:
+    """An execution plan for a task."""
+    __slots__ = (
+        "plan_id", "task_id", "name", "description", "steps", "strategy",
+        "status", "metadata", "created_at", "updated_at", "_steps_by_id",
+        "_dep_csr"
+    )
+
+    def __init__(
+        self,
+        plan_id: str,
+        task_id: str,
+        name: str,
+        description: str,
+        steps: List[PlanStep],
+        strategy: PlanningStrategy,
+        status: PlanStatus = PlanStatus.CREATED,
+        metadata: Optional[Dict[str, Any]] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None
+    ):
+        self.plan_id = plan_id
+        self.task_id = task_id
+        self.name = name
+        self.description = description
+        self.steps = steps
+        self.strategy = strategy
+        self.status = status
+        self.metadata = metadata or {}
+        self.created_at = created_at or datetime.now()
+        self.updated_at = updated_at or self.created_at
+        self._steps_by_id = {step.step_id: step for step in self.steps}
+        self._dep_csr = None
+
+    @property
+    def dep_csr(self):
+        """
+        CSR adjacency view of the step dependency graph.
+
+        Built lazily on first access and invalidated when steps are added.
+
+        Returns:
+            Tuple of (indptr, indices) int32 arrays, or None if numpy is
+            unavailable.
+        """
+        if self._dep_csr is None:
+            self._dep_csr = _plan_graph.build_csr(self.steps)
+        return self._dep_csr
+
+    def ready_step_indices(self) -> List[int]:
+        """
+        Find pending steps whose dependencies are all completed.
+
+        Uses the compiled CSR kernel when available, otherwise falls back
+        to resolving step IDs in Python.
+
+        Returns:
+            List[int]: Indices into self.steps of the ready steps.
+        """
+        csr = self.dep_csr
+        if csr is not None and _plan_graph.ready_steps is not None:
+            status_codes = [
+                0 if step.status == StepStatus.PENDING
+                else 1 if step.status == StepStatus.COMPLETED
+                else 2
+                for step in self.steps
+            ]
+            status_array = _plan_graph.as_status_array(status_codes)
+            indptr, indices = csr
+            return [int(i) for i in _plan_graph.ready_steps(status_array, indptr, indices)]
+
+        ready = []
+        for i, step in enumerate(self.steps):
+            if step.status != StepStatus.PENDING:
+                continue
+            satisfied = True
+            for dep_id in step.dependencies:
+                dep = self._steps_by_id.get(dep_id)
+                if dep is None or dep.status != StepStatus.COMPLETED:
+                    satisfied = False
+                    break
+            if satisfied:
+                ready.append(i)
+        return ready
+
+    def get_step(self, step_id: str) -> Optional[PlanStep]:
+        """
+        Look up a step by ID in O(1).
+
+        Args:
+            step_id: ID of the step to look up.
+
+        Returns:
+            Optional[PlanStep]: The step if found, None otherwise.
+        """
+        return self._steps_by_id.get(step_id)
+
+    def add_step(self, step: PlanStep) -> None:
+        """
+        Append a step, keeping the step-ID index in sync.
+
+        Bumps updated_at so serialization caches keyed on it are
+        invalidated along with the dependency graph.
+
+        Args:
+            step: The step to add.
+        """
+        self.steps.append(step)
+        self._steps_by_id[step.step_id] = step
+        self._dep_csr = None
+        self.updated_at = datetime.now()
+
+
+class PlanEvaluation:
+    """An evaluation of a plan's quality."""
+    def __init__(
+        self,
+        plan_id: str,
+        score: float,
+        strengths: List[str],
+        weaknesses: List[str],
+        improvement_suggestions: List[str]
+    ):
+        self.plan_id = plan_id
+        self.score = score
+        self.strengths = strengths
+        self.weaknesses = weaknesses
+        self.improvement_suggestions = improvement_suggestions
+
+
+class PlanningTask:
+    """A task that requires planning."""
+    def __init__(
+        self,
+        task_id: str,
+        description: str,
+        requirements: List[str],
+        constraints: List[str],
+        priority: int = 1,
+        deadline: Optional[datetime] = None
+    ):
+        self.task_id = task_id
+        self.description = description
+        self.requirements = requirements
+        self.constraints = constraints
+        self.priority = priority
+        self.deadline = deadline
+
+
+class PlanningContext:
+    """Context information for generating a plan."""
+    def __init__(
+        self,
+        user_request: str,
+        available_tools: List[Dict[str, Any]],
+        constraints: Dict[str, Any],
+        previous_plans: List[Plan],
+        relevant_knowledge: Dict[str, Any]
+    ):
+        self.user_request = user_request
+        self.available_tools = available_tools
+        self.constraints = constraints
+        self.previous_plans = previous_plans
+        self.relevant_knowledge = relevant_knowledge
+
+
+class PlanningResult:
+    """The result of a planning operation."""
+    def __init__(
+        self,
+        success: bool,
+        plan: Optional[Plan],
+        error: Optional[str],
+        alternatives: List[Plan],
+        reasoning: str
+    ):
+        self.success = success
+        self.plan = plan
+        self.error = error
+        self.alternatives = alternatives
+        self.reasoning = reasoning
+
+
+class ThoughtNode:
+    """A node in a tree of thoughts."""
+    __slots__ = ("node_id", "content", "parent_id", "children", "score")
+
+    def __init__(
+        self,
+        node_id: str,
+        content: str,
+        parent_id: Optional[str] = None,
+        children: Optional[List[str]] = None,
+        score: float = 0.0
+    ):
+        self.node_id = node_id
+        self.content = content
+        self.parent_id = parent_id
+        self.children = children or []
+        self.score = score
+
+
+class ThoughtTree:
+    """A tree of thoughts explored during planning."""
+    def __init__(
+        self,
+        tree_id: str,
+        nodes: Dict[str, ThoughtNode],
+        root_id: str,
+        best_path: List[str]
+    ):
+        self.tree_id = tree_id
+        self.nodes = nodes
+        self.root_id = root_id
+        self.best_path = best_path
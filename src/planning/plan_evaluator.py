@@ -5,27 +5,373 @@ This module implements the Plan Evaluator which evaluates plans for quality,
 feasibility, and effectiveness.
 """
 
+import asyncio
+import hashlib
+import heapq
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import re
+import threading
+import types
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+# Loaded lazily; score aggregation only benefits from numpy on large batches
+np = None
+
+# Batch size above which numpy aggregation beats the pure-Python loop
+_NUMPY_AGGREGATION_THRESHOLD = 64
+
+
+def _load_numpy():
+    """
+    Import numpy on first use.
+
+    Returns:
+        The numpy module, or None if it is not installed.
+    """
+    global np
+    if np is None:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            pass
+    return np
 
 from planning.models import Plan, PlanEvaluation
 
+# Captures the score and the three bulleted sections of a well-formed
+# evaluation response in one C-level scan
+_EVAL_RE = re.compile(
+    r"score:\s*(?P<score>[\d.]+\s*%?)"
+    r"(?:.*?strengths:?\s*(?P<strengths>.*?)"
+    r"(?:weaknesses:?\s*(?P<weaknesses>.*?))?"
+    r"(?:(?:improvement[^\n]*?|suggestions):\s*(?P<suggestions>.*))?)?$",
+    re.S | re.I
+)
+
+# One bulleted item per line within a section
+_BULLET_RE = re.compile(r"^\s*-\s*(.+?)\s*$", re.M)
+
+# Default criteria weights, shared read-only so evaluate_plan does not
+# rebuild the same dict on every call
+_DEFAULT_CRITERIA = types.MappingProxyType({
+    "completeness": 0.25,  # Does the plan cover all aspects of the task?
+    "feasibility": 0.25,   # Is the plan feasible to execute?
+    "efficiency": 0.2,     # Is the plan efficient?
+    "robustness": 0.15,    # Does the plan handle potential issues?
+    "clarity": 0.15        # Is the plan clear and understandable?
+})
+
+# Descriptions of the known evaluation criteria; unknown criteria get a
+# generic description, so adding a criterion is a dict entry away
+_CRITERION_DESCRIPTIONS = {
+    "completeness": "Does the plan cover all aspects of the task?",
+    "feasibility": "Is the plan feasible to execute?",
+    "efficiency": "Is the plan efficient in terms of steps and resources?",
+    "robustness": "Does the plan handle potential issues and edge cases?",
+    "clarity": "Is the plan clear, specific, and understandable?"
+}
+
+# Static evaluation instructions, criteria-set filled in once per set. Sent
+# as the system prompt so provider-side prompt caching can bill the shared
+# prefix at the cached rate and skip re-processing it
+_EVAL_SYSTEM_TEMPLATE = """You evaluate execution plans against weighted criteria.
+
+{criteria_text}
+
+Provide a detailed evaluation including:
+1. Overall score (0-100)
+2. At least 3 strengths of the plan
+3. At least 3 weaknesses or areas for improvement
+4. Specific suggestions to improve the plan
+
+Format your response as follows:
+
+Score: [0-100]
+
+Strengths:
+- [Strength 1]
+- [Strength 2]
+- [Strength 3]
+
+Weaknesses:
+- [Weakness 1]
+- [Weakness 2]
+- [Weakness 3]
+
+Improvement Suggestions:
+- [Suggestion 1]
+- [Suggestion 2]
+- [Suggestion 3]
+"""
+
+
+class DiskLLMCache:
+    """
+    Sharded on-disk cache for LLM responses.
+
+    Responses are stored under <cache_dir>/<first two key chars>/<key>.json,
+    so hits survive process restarts — repeated CLI runs and test suites pay
+    for each unique evaluation once. Writes are atomic (write-then-rename),
+    and all I/O errors degrade to cache misses.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the disk cache.
+
+        Args:
+            cache_dir: Directory to store cached responses in.
+        """
+        self.cache_dir = cache_dir
+        self.logger = logging.getLogger(__name__)
+
+    def _entry_path(self, key: str) -> str:
+        """
+        Compute the sharded file path for a cache key.
+
+        Args:
+            key: SHA-256 hex cache key.
+
+        Returns:
+            str: Path of the cache entry file.
+        """
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response on disk.
+
+        Args:
+            key: SHA-256 hex cache key.
+
+        Returns:
+            Optional[str]: The cached response text, or None on miss.
+        """
+        try:
+            with open(self._entry_path(key), "rb") as f:
+                data = f.read()
+            entry = orjson.loads(data) if orjson is not None else json.loads(data)
+            return entry.get("response")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug(f"Disk cache read failed for {key}: {str(e)}")
+            return None
+
+    def set(self, key: str, response: str) -> None:
+        """
+        Atomically store a response on disk.
+
+        Args:
+            key: SHA-256 hex cache key.
+            response: The response text to cache.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            entry = {"response": response}
+            data = orjson.dumps(entry) if orjson is not None else json.dumps(entry).encode()
+
+            # Write to a temp file and rename so readers never see a
+            # partial entry
+            tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, entry_path)
+        except Exception as e:
+            self.logger.debug(f"Disk cache write failed for {key}: {str(e)}")
+
+
+class LLMResponseCache:
+    """
+    Thread-safe exact-match cache for LLM responses.
+
+    Keys are content-addressed: a SHA-256 hash over the full request payload
+    (prompt, temperature, max_tokens, model params), so identical requests —
+    common at the low temperatures used for evaluation — skip the LLM call.
+    """
+
+    def __init__(self, max_size: int = 256, disk_cache: Optional[DiskLLMCache] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of in-memory responses (LRU eviction).
+            disk_cache: Optional persistent L2 consulted on memory misses
+                        and written through on stores.
+        """
+        self.max_size = max_size
+        self.disk_cache = disk_cache
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """
+        Compute the content-addressed cache key for a request payload.
+
+        Args:
+            request: The LLM request payload.
+
+        Returns:
+            str: Hex digest identifying the request.
+        """
+        if orjson is not None:
+            payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS, default=str)
+        else:
+            payload = json.dumps(request, sort_keys=True, default=str).encode()
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key.
+
+        Returns:
+            Optional[str]: The cached response text, or None on miss.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        # Fall through to the persistent L2 and promote hits to memory
+        if self.disk_cache is not None:
+            response = self.disk_cache.get(key)
+            if response is not None:
+                self._store_in_memory(key, response)
+                return response
+
+        return None
+
+    def set(self, key: str, response: str) -> None:
+        """
+        Store a response, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key from make_key.
+            response: The response text to cache.
+        """
+        self._store_in_memory(key, response)
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, response)
+
+    def _store_in_memory(self, key: str, response: str) -> None:
+        """
+        Store a response in the in-memory LRU only.
+
+        Args:
+            key: Cache key from make_key.
+            response: The response text to cache.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            elif len(self._entries) >= self.max_size:
+                self._entries.popitem(last=False)
+            self._entries[key] = response
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
 
 class PlanEvaluator:
     """
     Evaluates plans for quality, feasibility, and effectiveness.
     """
 
-    def __init__(self, llm_service):
+    def __init__(
+        self,
+        llm_service,
+        max_concurrency: int = 8,
+        evaluator_model: Optional[str] = None,
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize the PlanEvaluator.
 
         Args:
             llm_service: Service for calling the LLM.
+            max_concurrency: Maximum number of concurrent LLM evaluation calls.
+                             Tune per provider rate-limit tier.
+            evaluator_model: Model to route evaluation calls to. Structured
+                             scoring is an easy task, so a smaller, cheaper
+                             model than the planner's is usually sufficient.
+                             None keeps the service default.
+            cache_dir: Directory for the persistent response cache. Defaults
+                       to ~/.cache/personal-ai-agent/plan_eval when the
+                       PLAN_EVAL_CACHE environment variable is set to 1;
+                       otherwise responses are cached in memory only.
         """
         self.llm_service = llm_service
+        self.max_concurrency = max_concurrency
+        self.evaluator_model = evaluator_model
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        if cache_dir is None and os.environ.get("PLAN_EVAL_CACHE") == "1":
+            cache_dir = os.path.expanduser("~/.cache/personal-ai-agent/plan_eval")
+        disk_cache = DiskLLMCache(cache_dir) if cache_dir else None
+        self._response_cache = LLMResponseCache(disk_cache=disk_cache)
+        # Parsed evaluations keyed by plan structure, so cosmetically
+        # different plans with identical semantics share one evaluation
+        self._signature_cache: OrderedDict = OrderedDict()
+        self._signature_cache_size = 128
+        # Completed evaluations memoized per plan ID, so callers combining
+        # compare_plans and identify_improvement_areas pay for one evaluation
+        self._eval_cache: Dict[str, Any] = {}
+        # Rendered system prompts per criteria set
+        self._system_prompt_cache: Dict[tuple, str] = {}
         self.logger = logging.getLogger(__name__)
 
+    def invalidate(self, plan_id: str) -> None:
+        """
+        Drop the memoized evaluation for a plan.
+
+        Args:
+            plan_id: ID of the plan whose evaluation should be discarded.
+        """
+        self._eval_cache.pop(plan_id, None)
+
+    def _eval_cache_stamp(self, plan: Plan, criteria: Dict[str, float]) -> tuple:
+        """
+        Build the freshness stamp for the per-plan evaluation cache.
+
+        Args:
+            plan: The plan being evaluated.
+            criteria: Evaluation criteria and weights.
+
+        Returns:
+            tuple: Stamp that changes whenever the plan or criteria change.
+        """
+        return (plan.updated_at, tuple(sorted(criteria.items())))
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore bounding concurrent LLM calls, creating it lazily.
+
+        Lazy creation keeps the semaphore off the constructor path, which may
+        run outside any event loop.
+
+        Returns:
+            asyncio.Semaphore: The shared evaluation semaphore.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
     def evaluate_plan(self, plan: Plan, evaluation_criteria: Dict[str, float] = None) -> PlanEvaluation:
         """
         Evaluate a plan based on specified criteria.
@@ -41,71 +387,353 @@ class PlanEvaluator:
         self.logger.info(f"Evaluating plan: {plan.plan_id}")
         
         # Use default criteria if none provided
-        if not evaluation_criteria:
-            evaluation_criteria = {
-                "completeness": 0.25,  # Does the plan cover all aspects of the task?
-                "feasibility": 0.25,   # Is the plan feasible to execute?
-                "efficiency": 0.2,     # Is the plan efficient?
-                "robustness": 0.15,    # Does the plan handle potential issues?
-                "clarity": 0.15        # Is the plan clear and understandable?
-            }
-        
-        # Prepare prompt for evaluation
+        evaluation_criteria = evaluation_criteria or _DEFAULT_CRITERIA
+
+        # Return the memoized result if this exact plan was already evaluated
+        stamp = self._eval_cache_stamp(plan, evaluation_criteria)
+        memoized = self._eval_cache.get(plan.plan_id)
+        if memoized is not None and memoized[0] == stamp:
+            return memoized[1]
+
+        # Reuse evaluations of structurally identical plans
+        signature = self._plan_signature(plan, evaluation_criteria)
+        cached_evaluation = self._get_cached_evaluation(signature, plan.plan_id)
+        if cached_evaluation is not None:
+            self._eval_cache[plan.plan_id] = (stamp, cached_evaluation)
+            return cached_evaluation
+
+        # Prepare prompt for evaluation; static instructions go in the
+        # system prompt so provider prompt caching can reuse them
+        system_prompt = self._evaluation_system_prompt(evaluation_criteria)
         prompt = self._create_evaluation_prompt(plan, evaluation_criteria)
-        
+
         # Call LLM for evaluation
-        evaluation_response = self._call_llm_for_evaluation(prompt)
-        
+        evaluation_response = self._call_llm_for_evaluation(prompt, system_prompt)
+
         # Parse evaluation from LLM response
         evaluation_result = self._parse_evaluation(evaluation_response, plan.plan_id)
-        
+        self._store_cached_evaluation(signature, evaluation_result)
+        self._eval_cache[plan.plan_id] = (stamp, evaluation_result)
+
+        self.logger.info(f"Plan evaluation completed with score: {evaluation_result.score}")
+        return evaluation_result
+
+    async def evaluate_plan_async(self, plan: Plan, evaluation_criteria: Dict[str, float] = None) -> PlanEvaluation:
+        """
+        Evaluate a plan asynchronously based on specified criteria.
+
+        Args:
+            plan: The plan to evaluate.
+            evaluation_criteria: Dictionary of criteria and their weights.
+                                If None, default criteria are used.
+
+        Returns:
+            PlanEvaluation: The evaluation result.
+        """
+        self.logger.info(f"Evaluating plan: {plan.plan_id}")
+
+        # Use default criteria if none provided
+        evaluation_criteria = evaluation_criteria or _DEFAULT_CRITERIA
+
+        # Return the memoized result if this exact plan was already evaluated
+        stamp = self._eval_cache_stamp(plan, evaluation_criteria)
+        memoized = self._eval_cache.get(plan.plan_id)
+        if memoized is not None and memoized[0] == stamp:
+            return memoized[1]
+
+        # Reuse evaluations of structurally identical plans
+        signature = self._plan_signature(plan, evaluation_criteria)
+        cached_evaluation = self._get_cached_evaluation(signature, plan.plan_id)
+        if cached_evaluation is not None:
+            self._eval_cache[plan.plan_id] = (stamp, cached_evaluation)
+            return cached_evaluation
+
+        # Prepare prompt for evaluation; static instructions go in the
+        # system prompt so provider prompt caching can reuse them
+        system_prompt = self._evaluation_system_prompt(evaluation_criteria)
+        prompt = self._create_evaluation_prompt(plan, evaluation_criteria)
+
+        # Call LLM for evaluation, bounded by the concurrency limit so large
+        # fan-outs do not trip provider rate limits
+        async with self._get_semaphore():
+            evaluation_response = await self._call_llm_for_evaluation_async(prompt, system_prompt)
+
+        # Parse evaluation from LLM response
+        evaluation_result = self._parse_evaluation(evaluation_response, plan.plan_id)
+        self._store_cached_evaluation(signature, evaluation_result)
+        self._eval_cache[plan.plan_id] = (stamp, evaluation_result)
+
         self.logger.info(f"Plan evaluation completed with score: {evaluation_result.score}")
         return evaluation_result
 
-    def compare_plans(self, plans: List[Plan]) -> Dict[str, Any]:
+    def compare_plans(self, plans: List[Plan], top_k: Optional[int] = None) -> Dict[str, Any]:
         """
         Compare multiple plans and identify the best one.
 
         Args:
             plans: List of plans to compare.
+            top_k: If set, rankings contain only the k best plans, selected
+                   in O(N log k) instead of a full sort.
 
         Returns:
             Dict[str, Any]: Comparison results with rankings and recommendations.
         """
         self.logger.info(f"Comparing {len(plans)} plans")
-        
-        # Evaluate each plan
-        evaluations = []
-        for plan in plans:
-            evaluation = self.evaluate_plan(plan)
-            evaluations.append({
-                "plan_id": plan.plan_id,
-                "plan_name": plan.name,
-                "score": evaluation.score,
-                "strengths": evaluation.strengths,
-                "weaknesses": evaluation.weaknesses
-            })
-        
-        # Rank plans by score
-        ranked_plans = sorted(evaluations, key=lambda x: x["score"], reverse=True)
-        
+
+        # Evaluate all plans in one batched LLM request where possible
+        results = self._evaluate_plans_batched(plans)
+        evaluations = [
+            self._summarize_evaluation(plan, evaluation)
+            for plan, evaluation in zip(plans, results)
+        ]
+
+        comparison_result = self._build_comparison_result(evaluations, top_k)
+
+        self.logger.info(f"Plan comparison completed, best plan: {comparison_result['best_plan_id']}")
+        return comparison_result
+
+    async def compare_plans_async(self, plans: List[Plan], top_k: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Compare multiple plans concurrently and identify the best one.
+
+        Evaluations are fanned out with asyncio.gather so the wall time is
+        bounded by the slowest LLM call instead of the sum of all of them.
+
+        Args:
+            plans: List of plans to compare.
+            top_k: If set, rankings contain only the k best plans, selected
+                   in O(N log k) instead of a full sort.
+
+        Returns:
+            Dict[str, Any]: Comparison results with rankings and recommendations.
+        """
+        self.logger.info(f"Comparing {len(plans)} plans concurrently")
+
+        # Evaluate all plans in parallel
+        results = await asyncio.gather(*[self.evaluate_plan_async(plan) for plan in plans])
+        evaluations = [
+            self._summarize_evaluation(plan, evaluation)
+            for plan, evaluation in zip(plans, results)
+        ]
+
+        comparison_result = self._build_comparison_result(evaluations, top_k)
+
+        self.logger.info(f"Plan comparison completed, best plan: {comparison_result['best_plan_id']}")
+        return comparison_result
+
+    async def check_plan_feasibility_async(self, plan: Plan, constraints: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Check plan feasibility with the assessment sections expanded in parallel.
+
+        Instead of one long generation covering all four sections, each
+        section is requested by its own focused prompt and the calls run
+        concurrently, so critical-path latency drops to the slowest section.
+
+        Args:
+            plan: The plan to check.
+            constraints: Dictionary of constraints to consider.
+
+        Returns:
+            Dict[str, Any]: Feasibility assessment.
+        """
+        self.logger.info(f"Checking feasibility of plan: {plan.plan_id}")
+
+        # Default constraints if none provided
+        if not constraints:
+            constraints = {
+                "time_limit": None,
+                "resource_limits": {},
+                "tool_availability": []
+            }
+
+        sections = [
+            ("score", "Provide only the overall feasibility score (0-100%), as 'Feasibility Score: <value>'."),
+            ("issues", "List only the specific issues that might make the plan infeasible, one per line as '- <issue>'."),
+            ("suggestions", "List only suggestions to address feasibility issues, one per line as '- <suggestion>'."),
+            ("fit", "State only whether the plan can be executed within the given constraints, and why.")
+        ]
+
+        async def expand_section(instruction: str) -> str:
+            prompt = self._create_feasibility_section_prompt(plan, constraints, instruction)
+            async with self._get_semaphore():
+                return await self._call_llm_for_evaluation_async(prompt)
+
+        responses = await asyncio.gather(
+            *[expand_section(instruction) for _, instruction in sections]
+        )
+
+        # Reassemble the focused answers into the canonical section layout
+        # that _parse_feasibility understands
+        combined_response = (
+            f"Feasibility Score: {responses[0].strip()}\n\n"
+            f"Issues:\n{responses[1].strip()}\n\n"
+            f"Suggestions:\n{responses[2].strip()}\n\n"
+            f"Constraints:\n{responses[3].strip()}\n"
+        )
+        feasibility_result = self._parse_feasibility(combined_response)
+
+        self.logger.info(f"Feasibility check completed with score: {feasibility_result['score']}%")
+        return feasibility_result
+
+    def _create_feasibility_section_prompt(
+        self, plan: Plan, constraints: Dict[str, Any], instruction: str
+    ) -> str:
+        """
+        Create a focused prompt for a single feasibility assessment section.
+
+        Args:
+            plan: The plan to check.
+            constraints: The constraints to consider.
+            instruction: Section-specific output instruction.
+
+        Returns:
+            str: The section prompt.
+        """
+        return f"""
+        Assess the feasibility of this plan given the following constraints:
+
+        Plan Name: {plan.name}
+        Plan Description: {plan.description}
+
+        Steps:
+        {self._format_plan_steps(plan)}
+
+        Constraints:
+        {self._format_constraints(constraints)}
+
+        {instruction}
+        """
+
+    def _evaluate_plans_batched(self, plans: List[Plan]) -> List[PlanEvaluation]:
+        """
+        Evaluate plans with default criteria, batching LLM calls.
+
+        Cached evaluations are served directly; the remaining prompts are
+        sent to the LLM service as one batched request, amortizing HTTP and
+        queueing overhead across all plans.
+
+        Args:
+            plans: The plans to evaluate.
+
+        Returns:
+            List[PlanEvaluation]: Evaluations in the same order as plans.
+        """
+        criteria = _DEFAULT_CRITERIA
+
+        results: List[Optional[PlanEvaluation]] = [None] * len(plans)
+        pending: List[int] = []
+        pending_keys: List[tuple] = []
+
+        for i, plan in enumerate(plans):
+            stamp = self._eval_cache_stamp(plan, criteria)
+            memoized = self._eval_cache.get(plan.plan_id)
+            if memoized is not None and memoized[0] == stamp:
+                results[i] = memoized[1]
+                continue
+
+            signature = self._plan_signature(plan, criteria)
+            cached_evaluation = self._get_cached_evaluation(signature, plan.plan_id)
+            if cached_evaluation is not None:
+                self._eval_cache[plan.plan_id] = (stamp, cached_evaluation)
+                results[i] = cached_evaluation
+                continue
+
+            pending.append(i)
+            pending_keys.append((stamp, signature))
+
+        if pending:
+            system_prompt = self._evaluation_system_prompt(criteria)
+            prompts = [
+                self._create_evaluation_prompt(plans[i], criteria) for i in pending
+            ]
+            responses = self._call_llm_for_evaluation(prompts, system_prompt)
+
+            for i, (stamp, signature), response in zip(pending, pending_keys, responses):
+                plan = plans[i]
+                evaluation = self._parse_evaluation(response, plan.plan_id)
+                self._store_cached_evaluation(signature, evaluation)
+                self._eval_cache[plan.plan_id] = (stamp, evaluation)
+                results[i] = evaluation
+
+        return results
+
+    def _summarize_evaluation(self, plan: Plan, evaluation: PlanEvaluation) -> Dict[str, Any]:
+        """
+        Build the comparison summary entry for a single plan evaluation.
+
+        Args:
+            plan: The evaluated plan.
+            evaluation: The evaluation result.
+
+        Returns:
+            Dict[str, Any]: Summary entry used for ranking.
+        """
+        return {
+            "plan_id": plan.plan_id,
+            "plan_name": plan.name,
+            "score": evaluation.score,
+            "strengths": evaluation.strengths,
+            "weaknesses": evaluation.weaknesses
+        }
+
+    def _build_comparison_result(
+        self, evaluations: List[Dict[str, Any]], top_k: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the comparison result from per-plan evaluation summaries.
+
+        Args:
+            evaluations: Evaluation summaries for each plan.
+            top_k: If set, keep only the k best plans in the rankings.
+
+        Returns:
+            Dict[str, Any]: Comparison results with rankings and recommendations.
+        """
+        # Rank plans by score; callers that only need the best few get an
+        # O(N log k) selection instead of a full sort
+        if top_k is not None:
+            ranked_plans = heapq.nlargest(top_k, evaluations, key=lambda x: x["score"])
+        else:
+            ranked_plans = sorted(evaluations, key=lambda x: x["score"], reverse=True)
+
         # Identify best plan
         best_plan = ranked_plans[0] if ranked_plans else None
-        
-        # Prepare comparison result
-        comparison_result = {
+
+        # Aggregate scores: one vectorized pass for large batches (beam
+        # search planners can produce hundreds of candidates), a fused
+        # Python loop for small ones where numpy overhead dominates
+        if len(evaluations) >= _NUMPY_AGGREGATION_THRESHOLD and _load_numpy() is not None:
+            scores = np.fromiter(
+                (e["score"] for e in evaluations),
+                dtype=np.float32,
+                count=len(evaluations)
+            )
+            score_min = float(scores.min())
+            score_max = float(scores.max())
+            score_avg = float(scores.mean())
+        else:
+            score_min = float("inf")
+            score_max = float("-inf")
+            score_total = 0.0
+            for evaluation in evaluations:
+                score = evaluation["score"]
+                score_total += score
+                if score < score_min:
+                    score_min = score
+                if score > score_max:
+                    score_max = score
+            score_avg = score_total / len(evaluations) if evaluations else 0
+
+        return {
             "rankings": ranked_plans,
             "best_plan_id": best_plan["plan_id"] if best_plan else None,
             "score_range": {
-                "min": min(e["score"] for e in evaluations) if evaluations else 0,
-                "max": max(e["score"] for e in evaluations) if evaluations else 0,
-                "avg": sum(e["score"] for e in evaluations) / len(evaluations) if evaluations else 0
+                "min": score_min if evaluations else 0,
+                "max": score_max if evaluations else 0,
+                "avg": score_avg
             },
             "recommendation": self._generate_recommendation(ranked_plans) if ranked_plans else "No plans to compare"
         }
-        
-        self.logger.info(f"Plan comparison completed, best plan: {comparison_result['best_plan_id']}")
-        return comparison_result
 
     def identify_improvement_areas(self, plan: Plan) -> List[Dict[str, Any]]:
         """
@@ -217,74 +845,132 @@ class PlanEvaluator:
         self.logger.info(f"Feasibility check completed with score: {feasibility_result['score']}%")
         return feasibility_result
 
+    def _plan_signature(self, plan: Plan, criteria: Dict[str, float]) -> str:
+        """
+        Compute a canonical signature for a plan and its evaluation criteria.
+
+        Step ordering and whitespace differences do not change the signature,
+        so near-duplicate plans map to the same cached evaluation.
+
+        Args:
+            plan: The plan to fingerprint.
+            criteria: Evaluation criteria and weights.
+
+        Returns:
+            str: Hex digest identifying the plan structure.
+        """
+        structure = {
+            "steps": sorted(
+                (step.description.strip(), step.action.get("type", "unknown"))
+                for step in plan.steps
+            ),
+            "criteria": sorted(criteria.items())
+        }
+        if orjson is not None:
+            payload = orjson.dumps(structure, option=orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(structure, sort_keys=True).encode()
+        return hashlib.sha256(payload).hexdigest()
+
+    def _get_cached_evaluation(self, signature: str, plan_id: str) -> Optional[PlanEvaluation]:
+        """
+        Look up a cached evaluation by plan signature.
+
+        Args:
+            signature: Signature from _plan_signature.
+            plan_id: ID of the plan being evaluated.
+
+        Returns:
+            Optional[PlanEvaluation]: The cached evaluation rebound to the
+                                      requesting plan's ID, or None on miss.
+        """
+        cached = self._signature_cache.get(signature)
+        if cached is None:
+            return None
+
+        self._signature_cache.move_to_end(signature)
+
+        # Rebind to the requesting plan's ID; the cached entry may have been
+        # produced for a structurally identical plan with a different ID
+        return PlanEvaluation(
+            plan_id=plan_id,
+            score=cached.score,
+            strengths=list(cached.strengths),
+            weaknesses=list(cached.weaknesses),
+            improvement_suggestions=list(cached.improvement_suggestions)
+        )
+
+    def _store_cached_evaluation(self, signature: str, evaluation: PlanEvaluation) -> None:
+        """
+        Store an evaluation in the signature cache, evicting the oldest entry.
+
+        Args:
+            signature: Signature from _plan_signature.
+            evaluation: The parsed evaluation to cache.
+        """
+        if signature in self._signature_cache:
+            self._signature_cache.move_to_end(signature)
+        elif len(self._signature_cache) >= self._signature_cache_size:
+            self._signature_cache.popitem(last=False)
+        self._signature_cache[signature] = evaluation
+
+    def _evaluation_system_prompt(self, criteria: Dict[str, float]) -> str:
+        """
+        Get the static system prompt for an evaluation criteria set.
+
+        The rendered block is memoized per criteria set, and because it is
+        identical across plans it forms a stable prefix that provider prompt
+        caches can reuse.
+
+        Args:
+            criteria: Evaluation criteria and weights.
+
+        Returns:
+            str: The system prompt.
+        """
+        cache_key = tuple(sorted(criteria.items()))
+        cached = self._system_prompt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Format criteria via the description table
+        criteria_text = "Evaluation Criteria:\n" + "".join(
+            "- {} ({:.0f}%): {}\n".format(
+                criterion.capitalize(),
+                weight * 100,
+                _CRITERION_DESCRIPTIONS.get(criterion, f"Evaluate the plan's {criterion}.")
+            )
+            for criterion, weight in criteria.items()
+        )
+
+        system_prompt = _EVAL_SYSTEM_TEMPLATE.format(criteria_text=criteria_text)
+        self._system_prompt_cache[cache_key] = system_prompt
+        return system_prompt
+
     def _create_evaluation_prompt(self, plan: Plan, criteria: Dict[str, float]) -> str:
         """
-        Create a prompt for plan evaluation.
+        Create the plan-specific part of an evaluation prompt.
+
+        The static instructions and criteria live in the system prompt (see
+        _evaluation_system_prompt); only the per-plan content varies here.
 
         Args:
             plan: The plan to evaluate.
-            criteria: Evaluation criteria and weights.
+            criteria: Evaluation criteria and weights (rendered into the
+                      system prompt, kept for signature stability).
 
         Returns:
             str: The evaluation prompt.
         """
-        # Format criteria
-        criteria_text = "Evaluation Criteria:\n"
-        for criterion, weight in criteria.items():
-            criteria_text += f"- {criterion.capitalize()} ({weight*100:.0f}%): "
-            
-            if criterion == "completeness":
-                criteria_text += "Does the plan cover all aspects of the task?\n"
-            elif criterion == "feasibility":
-                criteria_text += "Is the plan feasible to execute?\n"
-            elif criterion == "efficiency":
-                criteria_text += "Is the plan efficient in terms of steps and resources?\n"
-            elif criterion == "robustness":
-                criteria_text += "Does the plan handle potential issues and edge cases?\n"
-            elif criterion == "clarity":
-                criteria_text += "Is the plan clear, specific, and understandable?\n"
-            else:
-                criteria_text += f"Evaluate the plan's {criterion}.\n"
-        
-        # Create prompt
-        prompt = f"""
+        return f"""
         Evaluate the following plan based on the specified criteria:
-        
+
         Plan Name: {plan.name}
         Plan Description: {plan.description}
-        
+
         Steps:
         {self._format_plan_steps(plan)}
-        
-        {criteria_text}
-        
-        Provide a detailed evaluation including:
-        1. Overall score (0-100)
-        2. At least 3 strengths of the plan
-        3. At least 3 weaknesses or areas for improvement
-        4. Specific suggestions to improve the plan
-        
-        Format your response as follows:
-        
-        Score: [0-100]
-        
-        Strengths:
-        - [Strength 1]
-        - [Strength 2]
-        - [Strength 3]
-        
-        Weaknesses:
-        - [Weakness 1]
-        - [Weakness 2]
-        - [Weakness 3]
-        
-        Improvement Suggestions:
-        - [Suggestion 1]
-        - [Suggestion 2]
-        - [Suggestion 3]
         """
-        
-        return prompt
 
     def _format_plan_steps(self, plan: Plan) -> str:
         """
@@ -296,32 +982,34 @@ class PlanEvaluator:
         Returns:
             str: Formatted plan steps.
         """
-        steps_text = ""
+        # Accumulate parts and join once; += in a loop copies the string
+        # each iteration, which is quadratic for large plans
+        parts = []
         for i, step in enumerate(plan.steps):
-            steps_text += f"{i+1}. {step.description}\n"
-            
+            parts.append(f"{i+1}. {step.description}\n")
+
             # Add action details if available
             action_type = step.action.get("type", "unknown")
             if action_type != "unknown":
-                steps_text += f"   Action: {action_type}"
-                
+                parts.append(f"   Action: {action_type}")
+
                 if action_type == "tool_call" and "tool_id" in step.action:
-                    steps_text += f" - {step.action.get('tool_id')}"
-                
-                steps_text += "\n"
-            
+                    parts.append(f" - {step.action.get('tool_id')}")
+
+                parts.append("\n")
+
             # Add expected outcome if available
             if step.expected_outcome:
-                steps_text += f"   Expected Outcome: {step.expected_outcome}\n"
-            
+                parts.append(f"   Expected Outcome: {step.expected_outcome}\n")
+
             # Add dependencies if available
             if step.dependencies:
                 deps = ", ".join(step.dependencies)
-                steps_text += f"   Dependencies: {deps}\n"
-            
-            steps_text += "\n"
-        
-        return steps_text
+                parts.append(f"   Dependencies: {deps}\n")
+
+            parts.append("\n")
+
+        return "".join(parts)
 
     def _format_constraints(self, constraints: Dict[str, Any]) -> str:
         """
@@ -333,68 +1021,325 @@ class PlanEvaluator:
         Returns:
             str: Formatted constraints.
         """
-        constraints_text = ""
-        
+        parts = []
+
         # Time limit
         if constraints.get("time_limit"):
-            constraints_text += f"- Time Limit: {constraints['time_limit']}\n"
-        
+            parts.append(f"- Time Limit: {constraints['time_limit']}\n")
+
         # Resource limits
         if constraints.get("resource_limits"):
-            constraints_text += "- Resource Limits:\n"
+            parts.append("- Resource Limits:\n")
             for resource, limit in constraints["resource_limits"].items():
-                constraints_text += f"  - {resource}: {limit}\n"
-        
+                parts.append(f"  - {resource}: {limit}\n")
+
         # Tool availability
         if constraints.get("tool_availability"):
-            constraints_text += "- Available Tools:\n"
+            parts.append("- Available Tools:\n")
             for tool in constraints["tool_availability"]:
-                constraints_text += f"  - {tool}\n"
-        
+                parts.append(f"  - {tool}\n")
+
         # Other constraints
         for key, value in constraints.items():
             if key not in ["time_limit", "resource_limits", "tool_availability"]:
-                constraints_text += f"- {key}: {value}\n"
-        
-        return constraints_text
+                parts.append(f"- {key}: {value}\n")
 
-    def _call_llm_for_evaluation(self, prompt: str) -> str:
+        return "".join(parts)
+
+    def _build_evaluation_request(
+        self, prompt: Union[str, List[str]], system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        Call the LLM service for evaluation.
+        Build the LLM request payload for an evaluation prompt.
 
         Args:
-            prompt: The evaluation prompt.
+            prompt: A single prompt, or a list of prompts for a batched call.
+            system_prompt: Static instruction block sent as the system
+                           message so provider prompt caching applies.
 
         Returns:
-            str: The LLM response.
+            Dict[str, Any]: The request payload.
         """
-        # This is a simplified implementation
-        # In a real system, this would call the actual LLM service
-        
-        # Create request for LLM service
-        request = {
+        model_params = {"evaluation_mode": True}
+        if self.evaluator_model is not None:
+            # Route evaluations to the dedicated (typically smaller) model
+            model_params["model"] = self.evaluator_model
+
+        return {
             "prompt": prompt,
+            "system_prompt": system_prompt,
             "temperature": 0.1,  # Low temperature for evaluation
             "max_tokens": 1000,
             "stop_sequences": [],
-            "model_params": {"evaluation_mode": True}
+            "stream": True,  # Services that support it may return an iterator
+            "model_params": model_params
         }
-        
+
+    def _call_llm_for_evaluation(
+        self, prompt: Union[str, List[str]], system_prompt: Optional[str] = None
+    ) -> Union[str, List[str]]:
+        """
+        Call the LLM service for evaluation.
+
+        Args:
+            prompt: The evaluation prompt, or a list of prompts to send as a
+                    single batched request.
+            system_prompt: Optional static instruction block for the request.
+
+        Returns:
+            Union[str, List[str]]: The response text, or one response per
+                                   prompt when a list was given.
+        """
+        # This is a simplified implementation
+        # In a real system, this would call the actual LLM service
+
+        if isinstance(prompt, list):
+            return self._call_llm_for_evaluation_batch(prompt, system_prompt)
+
+        # Create request for LLM service
+        request = self._build_evaluation_request(prompt, system_prompt)
+
+        # Check the response cache first; at this temperature identical
+        # requests produce interchangeable responses
+        cache_key = LLMResponseCache.make_key(request)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Call LLM service
         response = self.llm_service(request)
-        
-        # Extract text from response
+
+        # Extract text from response; streaming services return an iterator
+        # of chunks that is parsed incrementally with early exit
         if isinstance(response, dict) and "text" in response:
-            return response["text"]
+            text = response["text"]
         elif isinstance(response, str):
-            return response
+            text = response
+        elif hasattr(response, "__iter__") and not isinstance(response, (dict, list)):
+            text = self._collect_stream_response(response)
+        else:
+            text = str(response)
+
+        self._response_cache.set(cache_key, text)
+        return text
+
+    def _collect_stream_response(self, stream: Any) -> str:
+        """
+        Consume a streamed LLM response, stopping once the evaluation is complete.
+
+        Chunks are fed through a line-based tracker mirroring the sections
+        _parse_evaluation extracts; as soon as a score, three strengths,
+        three weaknesses, and three suggestions have arrived, the stream is
+        closed — typically well before max_tokens — saving tokens and
+        letting parsing start without waiting for the full completion.
+
+        Args:
+            stream: Iterator of response chunks (strings or dicts with a
+                    'text' field).
+
+        Returns:
+            str: The consumed response text.
+        """
+        collected = []
+        buffer = ""
+        have_score = False
+        counts = {"strengths": 0, "weaknesses": 0, "suggestions": 0}
+        current_section = None
+
+        def track_line(line: str) -> None:
+            nonlocal have_score, current_section
+            line = line.strip()
+            if not line:
+                return
+            lower_line = line.lower()
+            if lower_line.startswith("score:"):
+                have_score = True
+            elif lower_line.startswith("strengths"):
+                current_section = "strengths"
+            elif lower_line.startswith("weaknesses"):
+                current_section = "weaknesses"
+            elif lower_line.startswith("improvement") or lower_line.startswith("suggestions"):
+                current_section = "suggestions"
+            elif line.startswith("-") and current_section:
+                counts[current_section] += 1
+
+        try:
+            for chunk in stream:
+                if isinstance(chunk, dict):
+                    chunk = chunk.get("text", "")
+                if not chunk:
+                    continue
+                collected.append(chunk)
+
+                buffer += chunk
+                while "\n" in buffer:
+                    line, buffer = buffer.split("\n", 1)
+                    track_line(line)
+
+                if have_score and all(count >= 3 for count in counts.values()):
+                    break
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
+        return "".join(collected)
+
+    def _call_llm_for_evaluation_batch(
+        self, prompts: List[str], system_prompt: Optional[str] = None
+    ) -> List[str]:
+        """
+        Send multiple evaluation prompts as one batched LLM request.
+
+        Prompts already cached under their single-request keys are served
+        from the cache; only the misses go over the wire, in a single
+        round-trip that amortizes TLS/HTTP/queueing overhead.
+
+        Args:
+            prompts: The evaluation prompts.
+
+        Returns:
+            List[str]: One response per prompt, in prompt order.
+        """
+        keys = [
+            LLMResponseCache.make_key(self._build_evaluation_request(p, system_prompt))
+            for p in prompts
+        ]
+        texts = [self._response_cache.get(key) for key in keys]
+
+        misses = [i for i, text in enumerate(texts) if text is None]
+        if not misses:
+            return texts
+
+        request = self._build_evaluation_request(
+            [prompts[i] for i in misses], system_prompt
+        )
+        response = self.llm_service(request)
+        completions = self._extract_batch_completions(response, len(misses))
+
+        if completions is None:
+            # Service does not support batched prompts; fall back to
+            # individual calls
+            completions = [
+                self._call_llm_for_evaluation(prompts[i], system_prompt) for i in misses
+            ]
+
+        for i, text in zip(misses, completions):
+            self._response_cache.set(keys[i], text)
+            texts[i] = text
+
+        return texts
+
+    @staticmethod
+    def _extract_batch_completions(response: Any, count: int) -> Optional[List[str]]:
+        """
+        Extract per-prompt completions from a batched LLM response.
+
+        Args:
+            response: The raw service response.
+            count: Number of prompts that were sent.
+
+        Returns:
+            Optional[List[str]]: Completions matched back to prompt order via
+                                 the index field, or None if the response does
+                                 not look batched.
+        """
+        if isinstance(response, dict) and isinstance(response.get("choices"), list):
+            choices = response["choices"]
+        elif isinstance(response, list):
+            choices = response
         else:
-            return str(response)
+            return None
+
+        if len(choices) != count:
+            return None
+
+        # Completions are matched via their index field: response order is
+        # not guaranteed to follow prompt order
+        completions = [""] * count
+        for position, choice in enumerate(choices):
+            if isinstance(choice, dict):
+                index = choice.get("index", position)
+                text = choice.get("text", "")
+            else:
+                index = position
+                text = str(choice)
+            if 0 <= index < count:
+                completions[index] = text
+
+        return completions
+
+    async def _call_llm_for_evaluation_async(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> str:
+        """
+        Call the LLM service for evaluation without blocking the event loop.
+
+        The configured LLM service is a synchronous callable, so the call is
+        offloaded to a worker thread; concurrent evaluations overlap their I/O.
+
+        Args:
+            prompt: The evaluation prompt.
+            system_prompt: Optional static instruction block for the request.
+
+        Returns:
+            str: The LLM response.
+        """
+        return await asyncio.to_thread(
+            self._call_llm_for_evaluation, prompt, system_prompt
+        )
 
     def _parse_evaluation(self, response: str, plan_id: str) -> PlanEvaluation:
         """
         Parse an evaluation from an LLM response.
 
+        Well-formed responses are parsed with a single compiled-regex pass;
+        anything the regex cannot handle falls back to the line-by-line
+        parser, so malformed responses behave as before.
+
+        Args:
+            response: The LLM response.
+            plan_id: ID of the evaluated plan.
+
+        Returns:
+            PlanEvaluation: The parsed evaluation.
+        """
+        match = _EVAL_RE.search(response)
+        if match:
+            return PlanEvaluation(
+                plan_id=plan_id,
+                score=self._parse_score_text(match.group("score")),
+                strengths=_BULLET_RE.findall(match.group("strengths") or ""),
+                weaknesses=_BULLET_RE.findall(match.group("weaknesses") or ""),
+                improvement_suggestions=_BULLET_RE.findall(match.group("suggestions") or "")
+            )
+
+        return self._parse_evaluation_lines(response, plan_id)
+
+    @staticmethod
+    def _parse_score_text(score_text: str) -> float:
+        """
+        Convert a score string to a normalized score in [0, 1].
+
+        Args:
+            score_text: Score text, optionally with a percent sign.
+
+        Returns:
+            float: The normalized score; 0.5 if the text is not numeric.
+        """
+        try:
+            score = float(score_text.replace("%", "").strip()) / 100.0
+        except ValueError:
+            # Default to middle score if parsing fails
+            score = 0.5
+
+        # Ensure score is in range [0, 1]
+        return max(0.0, min(1.0, score))
+
+    def _parse_evaluation_lines(self, response: str, plan_id: str) -> PlanEvaluation:
+        """
+        Line-by-line fallback parser for evaluation responses.
+
         Args:
             response: The LLM response.
             plan_id: ID of the evaluated plan.
@@ -423,19 +1368,7 @@ class PlanEvaluator:
             
             if lower_line.startswith("score:"):
                 # Extract score
-                score_text = line.split(":", 1)[1].strip()
-                try:
-                    # Handle percentage or raw score
-                    if "%" in score_text:
-                        score = float(score_text.replace("%", "")) / 100.0
-                    else:
-                        score = float(score_text) / 100.0
-                except ValueError:
-                    # Default to middle score if parsing fails
-                    score = 0.5
-                
-                # Ensure score is in range [0, 1]
-                score = max(0.0, min(1.0, score))
+                score = self._parse_score_text(line.split(":", 1)[1])
             
             elif lower_line.startswith("strengths:") or lower_line == "strengths":
                 current_section = "strengths"
@@ -450,4 +1383,114 @@ class PlanEvaluator:
                 if current_section == "strengths":
                     strengths.append(item)
                 elif current_section == "weaknesses":
-        <response clipped><NOTE>To save on context only part of this file has been shown to you. You should retry this tool after you have searched inside the file with `grep -n` in order to find the line numbers of what you are looking for.</NOTE>
\ No newline at end of file
+                    weaknesses.append(item)
+                elif current_section == "suggestions":
+                    suggestions.append(item)
+
+        # Create evaluation result
+        return PlanEvaluation(
+            plan_id=plan_id,
+            score=score,
+            strengths=strengths,
+            weaknesses=weaknesses,
+            improvement_suggestions=suggestions
+        )
+
+    def _generate_recommendation(self, ranked_plans: List[Dict[str, Any]]) -> str:
+        """
+        Generate a recommendation based on ranked plan evaluations.
+
+        Args:
+            ranked_plans: Plan evaluations sorted by score, best first.
+
+        Returns:
+            str: A recommendation for which plan to use.
+        """
+        best_plan = ranked_plans[0]
+
+        recommendation = f"Use plan '{best_plan['plan_name']}' (score: {best_plan['score']:.2f})."
+
+        # Mention the runner-up if scores are close
+        if len(ranked_plans) > 1:
+            second_plan = ranked_plans[1]
+            if best_plan["score"] - second_plan["score"] < 0.05:
+                recommendation += (
+                    f" Plan '{second_plan['plan_name']}' scored nearly as well "
+                    f"({second_plan['score']:.2f}) and may be a viable alternative."
+                )
+
+        # Highlight key strengths of the best plan
+        if best_plan.get("strengths"):
+            recommendation += f" Key strength: {best_plan['strengths'][0]}"
+
+        return recommendation
+
+    def _parse_feasibility(self, response: str) -> Dict[str, Any]:
+        """
+        Parse a feasibility assessment from an LLM response.
+
+        Args:
+            response: The LLM response.
+
+        Returns:
+            Dict[str, Any]: The parsed feasibility assessment.
+        """
+        lines = response.strip().split('\n')
+
+        # Default values
+        score = 50.0
+        issues = []
+        suggestions = []
+        feasible_within_constraints = True
+
+        # Current section being parsed
+        current_section = None
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            lower_line = line.lower()
+
+            if "feasibility score" in lower_line or lower_line.startswith("score"):
+                # Extract score from the line
+                score_text = line.split(":", 1)[1].strip() if ":" in line else line
+                digits = "".join(c for c in score_text if c.isdigit() or c == ".")
+                try:
+                    score = float(digits)
+                except ValueError:
+                    score = 50.0
+
+                # Ensure score is in range [0, 100]
+                score = max(0.0, min(100.0, score))
+
+            elif "issue" in lower_line and (lower_line.endswith(":") or len(line) < 50):
+                current_section = "issues"
+            elif "suggestion" in lower_line and (lower_line.endswith(":") or len(line) < 50):
+                current_section = "suggestions"
+            elif "constraint" in lower_line and (lower_line.endswith(":") or len(line) < 60):
+                current_section = "constraints"
+
+                # Check for a yes/no answer on the same line
+                if "cannot" in lower_line or "not feasible" in lower_line or " no" in lower_line:
+                    feasible_within_constraints = False
+            elif line.startswith("-") and current_section:
+                # Extract item from bullet point
+                item = line[1:].strip()
+
+                if current_section == "issues":
+                    issues.append(item)
+                elif current_section == "suggestions":
+                    suggestions.append(item)
+                elif current_section == "constraints":
+                    if "cannot" in item.lower() or "not feasible" in item.lower():
+                        feasible_within_constraints = False
+
+        return {
+            "score": score,
+            "issues": issues,
+            "suggestions": suggestions,
+            "feasible_within_constraints": feasible_within_constraints,
+            "feasible": score >= 50.0 and feasible_within_constraints
+        }
\ No newline at end of file
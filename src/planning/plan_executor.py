@@ -5,10 +5,22 @@ This module implements the Plan Executor which executes plans by coordinating
 with the Agent Core and Tool Manager.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Callable
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 from planning.models import Plan, PlanStep, StepStatus, PlanStatus
 
 
@@ -17,18 +29,122 @@ class PlanExecutor:
     Executes plans by coordinating with the Agent Core and Tool Manager.
     """
 
-    def __init__(self, tool_manager, event_processor):
+    def __init__(self, tool_manager, event_processor, max_workers: int = 32):
         """
         Initialize the PlanExecutor.
 
         Args:
             tool_manager: The tool manager for executing tool calls.
             event_processor: The event processor for logging events.
+            max_workers: Size of the thread pool that runs blocking tool
+                         SDK calls during concurrent execution.
         """
         self.tool_manager = tool_manager
         self.event_processor = event_processor
+        self.max_workers = max_workers
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        # Results of deterministic tool calls, keyed by (tool, parameters)
+        # hash; entries carry an expiry so stale data ages out
+        self._tool_cache: OrderedDict = OrderedDict()
+        self._tool_cache_size = 512
+        self._tool_cache_ttl = 300.0
+        self._tool_cache_lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
 
+    @staticmethod
+    def _build_step_index(plan: Plan) -> tuple:
+        """
+        Build lookup structures for a plan's dependency graph.
+
+        Args:
+            plan: The plan to index.
+
+        Returns:
+            tuple: (step_by_id, dependents) where step_by_id maps step IDs to
+                   steps and dependents maps step IDs to the IDs of steps
+                   that depend on them.
+        """
+        step_by_id = {step.step_id: step for step in plan.steps}
+        dependents: Dict[str, List[str]] = {}
+        for step in plan.steps:
+            for dep_id in step.dependencies:
+                dependents.setdefault(dep_id, []).append(step.step_id)
+        return step_by_id, dependents
+
+    def _is_cacheable_tool(self, tool_id: str) -> bool:
+        """
+        Check whether a tool's results may be cached.
+
+        Tools opt in by carrying a truthy 'cacheable' attribute in the tool
+        registry; anything else (side-effecting shell commands, messages) is
+        always re-executed.
+
+        Args:
+            tool_id: The ID of the tool.
+
+        Returns:
+            bool: True if results for this tool can be reused.
+        """
+        get_tool = getattr(self.tool_manager, "get_tool", None)
+        if get_tool is None:
+            return False
+        return bool(getattr(get_tool(tool_id), "cacheable", False))
+
+    @staticmethod
+    def _tool_cache_key(tool_id: str, parameters: Dict[str, Any]) -> str:
+        """
+        Compute the content-addressed cache key for a tool call.
+
+        Args:
+            tool_id: The ID of the tool.
+            parameters: The tool call parameters.
+
+        Returns:
+            str: Hex digest identifying the call.
+        """
+        call = {"tool": tool_id, "params": parameters}
+        if orjson is not None:
+            payload = orjson.dumps(call, option=orjson.OPT_SORT_KEYS, default=str)
+        else:
+            payload = json.dumps(call, sort_keys=True, default=str).encode()
+        return hashlib.sha256(payload).hexdigest()
+
+    def _tool_cache_get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached tool result, dropping it if expired.
+
+        Args:
+            key: Cache key from _tool_cache_key.
+
+        Returns:
+            Optional[Any]: The cached result, or None on miss.
+        """
+        with self._tool_cache_lock:
+            entry = self._tool_cache.get(key)
+            if entry is None:
+                return None
+            expiry, result = entry
+            if time.monotonic() >= expiry:
+                del self._tool_cache[key]
+                return None
+            self._tool_cache.move_to_end(key)
+            return result
+
+    def _tool_cache_set(self, key: str, result: Any) -> None:
+        """
+        Store a tool result with a TTL, evicting the oldest entry if full.
+
+        Args:
+            key: Cache key from _tool_cache_key.
+            result: The tool result to cache.
+        """
+        with self._tool_cache_lock:
+            if key in self._tool_cache:
+                self._tool_cache.move_to_end(key)
+            elif len(self._tool_cache) >= self._tool_cache_size:
+                self._tool_cache.popitem(last=False)
+            self._tool_cache[key] = (time.monotonic() + self._tool_cache_ttl, result)
+
     def execute_plan(self, plan: Plan) -> Dict[str, Any]:
         """
         Execute a plan.
@@ -41,14 +157,18 @@ class PlanExecutor:
         """
         self.logger.info(f"Starting execution of plan: {plan.plan_id}")
         
+        # Single wall-clock stamp; durations come from the monotonic clock
+        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
+
         # Update plan status
         plan.status = PlanStatus.IN_PROGRESS
-        plan.updated_at = datetime.now()
+        plan.updated_at = start_time
         
         # Track execution results
         execution_results = {
             "plan_id": plan.plan_id,
-            "start_time": datetime.now(),
+            "start_time": start_time,
             "end_time": None,
             "success": False,
             "steps_completed": 0,
@@ -57,10 +177,14 @@ class PlanExecutor:
         }
         
         try:
+            # Index the dependency graph once instead of scanning the step
+            # list for every dependency check
+            step_by_id, dependents = self._build_step_index(plan)
+
             # Execute each step in order
             for step in plan.steps:
                 # Check if dependencies are satisfied
-                if not self._check_dependencies(step, plan, execution_results):
+                if not self._check_dependencies(step, step_by_id, execution_results):
                     step.status = StepStatus.SKIPPED
                     execution_results["step_results"][step.step_id] = {
                         "status": "skipped",
@@ -83,7 +207,7 @@ class PlanExecutor:
                 execution_results["step_results"][step.step_id] = step_result
                 
                 # If step failed and it's critical, stop execution
-                if not step_result["success"] and self._is_critical_step(step, plan):
+                if not step_result["success"] and self._is_critical_step(step, dependents):
                     self.logger.warning(f"Critical step {step.step_id} failed, stopping execution")
                     plan.status = PlanStatus.FAILED
                     break
@@ -104,13 +228,203 @@ class PlanExecutor:
             execution_results["success"] = False
             execution_results["error"] = str(e)
         
-        # Update final timestamps
-        plan.updated_at = datetime.now()
-        execution_results["end_time"] = datetime.now()
+        # Update final timestamps from the monotonic duration
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        end_time = start_time + timedelta(milliseconds=duration_ms)
+        plan.updated_at = end_time
+        execution_results["end_time"] = end_time
+        execution_results["duration_ms"] = duration_ms
         
         self.logger.info(f"Plan execution completed with status: {plan.status}")
         return execution_results
 
+    async def execute_plan_async(self, plan: Plan) -> Dict[str, Any]:
+        """
+        Execute a plan, running independent steps concurrently.
+
+        Steps are scheduled by dependency level: each wave gathers every step
+        whose dependencies are completed and executes them in parallel, so
+        wide DAGs no longer serialize independent tool calls.
+
+        Args:
+            plan: The plan to execute.
+
+        Returns:
+            Dict[str, Any]: The result of the execution.
+        """
+        self.logger.info(f"Starting concurrent execution of plan: {plan.plan_id}")
+
+        # Single wall-clock stamp; durations come from the monotonic clock
+        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
+
+        # Update plan status
+        plan.status = PlanStatus.IN_PROGRESS
+        plan.updated_at = start_time
+
+        # Track execution results
+        execution_results = {
+            "plan_id": plan.plan_id,
+            "start_time": start_time,
+            "end_time": None,
+            "success": False,
+            "steps_completed": 0,
+            "steps_failed": 0,
+            "step_results": {}
+        }
+
+        try:
+            # Index the dependency graph once instead of scanning the step
+            # list for every dependency check
+            step_by_id, dependents = self._build_step_index(plan)
+
+            remaining = list(plan.steps)
+            stop = False
+
+            while remaining and not stop:
+                ready = []
+                waiting = []
+
+                for step in remaining:
+                    if self._check_dependencies(step, step_by_id, execution_results):
+                        ready.append(step)
+                    elif self._dependencies_unsatisfiable(step, step_by_id):
+                        step.status = StepStatus.SKIPPED
+                        execution_results["step_results"][step.step_id] = {
+                            "status": "skipped",
+                            "reason": "Dependencies not satisfied"
+                        }
+                    else:
+                        waiting.append(step)
+
+                if not ready:
+                    # Remaining steps can never become ready (e.g. a
+                    # dependency cycle); skip them rather than spin
+                    for step in waiting:
+                        step.status = StepStatus.SKIPPED
+                        execution_results["step_results"][step.step_id] = {
+                            "status": "skipped",
+                            "reason": "Dependencies not satisfied"
+                        }
+                    break
+
+                # Execute the whole wave concurrently
+                results = await asyncio.gather(
+                    *[self._execute_step_async(step, plan) for step in ready]
+                )
+
+                for step, step_result in zip(ready, results):
+                    # Update step status
+                    if step_result["success"]:
+                        step.status = StepStatus.COMPLETED
+                        execution_results["steps_completed"] += 1
+                    else:
+                        step.status = StepStatus.FAILED
+                        execution_results["steps_failed"] += 1
+
+                    # Store step result
+                    execution_results["step_results"][step.step_id] = step_result
+
+                    # If a critical step failed, stop after this wave
+                    if not step_result["success"] and self._is_critical_step(step, dependents):
+                        self.logger.warning(f"Critical step {step.step_id} failed, stopping execution")
+                        plan.status = PlanStatus.FAILED
+                        stop = True
+
+                remaining = waiting
+
+            # Update plan status if not already failed
+            if plan.status != PlanStatus.FAILED:
+                if execution_results["steps_failed"] > 0:
+                    plan.status = PlanStatus.FAILED
+                else:
+                    plan.status = PlanStatus.COMPLETED
+
+            # Update execution results
+            execution_results["success"] = (plan.status == PlanStatus.COMPLETED)
+
+        except Exception as e:
+            self.logger.error(f"Error executing plan: {str(e)}")
+            plan.status = PlanStatus.FAILED
+            execution_results["success"] = False
+            execution_results["error"] = str(e)
+
+        # Update final timestamps from the monotonic duration
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        end_time = start_time + timedelta(milliseconds=duration_ms)
+        plan.updated_at = end_time
+        execution_results["end_time"] = end_time
+        execution_results["duration_ms"] = duration_ms
+
+        self.logger.info(f"Plan execution completed with status: {plan.status}")
+        return execution_results
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        """
+        Get the executor's thread pool, creating it lazily.
+
+        A dedicated, explicitly sized pool keeps blocking tool SDK calls
+        from exhausting the event loop's shared default executor.
+
+        Returns:
+            ThreadPoolExecutor: The pool for blocking tool calls.
+        """
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="plan-executor"
+            )
+        return self._thread_pool
+
+    async def _execute_step_async(self, step: PlanStep, plan: Plan) -> Dict[str, Any]:
+        """
+        Execute a single plan step without blocking the event loop.
+
+        Tool SDKs invoked by steps are synchronous (requests, subprocess,
+        browser drivers), so the step runs in the executor's bounded thread
+        pool; steps in the same wave overlap their I/O while the event loop
+        stays free to dispatch further waves.
+
+        Args:
+            step: The step to execute.
+            plan: The parent plan.
+
+        Returns:
+            Dict[str, Any]: The result of the step execution.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_thread_pool(), self._execute_step, step, plan
+        )
+
+    def shutdown(self) -> None:
+        """Shut down the thread pool used for concurrent step execution."""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False)
+            self._thread_pool = None
+
+    def _dependencies_unsatisfiable(self, step: PlanStep, step_by_id: Dict[str, PlanStep]) -> bool:
+        """
+        Check whether a step's dependencies can no longer be satisfied.
+
+        Args:
+            step: The step to check.
+            step_by_id: Index of the plan's steps by step ID.
+
+        Returns:
+            bool: True if some dependency is missing, failed, or skipped.
+        """
+        for dep_id in step.dependencies:
+            dep_step = step_by_id.get(dep_id)
+
+            if not dep_step:
+                return True
+
+            if dep_step.status in (StepStatus.FAILED, StepStatus.SKIPPED):
+                return True
+
+        return False
+
     def _execute_step(self, step: PlanStep, plan: Plan) -> Dict[str, Any]:
         """
         Execute a single plan step.
@@ -127,10 +441,15 @@ class PlanExecutor:
         # Update step status
         step.status = StepStatus.IN_PROGRESS
         
+        # Single wall-clock stamp; the duration comes from the monotonic
+        # clock so it is immune to wall-clock adjustments
+        step_start = datetime.now()
+        step_start_ns = time.perf_counter_ns()
+
         # Prepare result structure
         step_result = {
             "step_id": step.step_id,
-            "start_time": datetime.now(),
+            "start_time": step_start,
             "end_time": None,
             "success": False,
             "action_taken": None,
@@ -146,26 +465,39 @@ class PlanExecutor:
                 # Execute tool call
                 tool_id = step.action.get("tool_id")
                 parameters = step.action.get("parameters", {})
-                
-                # Create tool call
-                tool_call = self.tool_manager.create_tool_call(tool_id, parameters)
-                
+
                 # Log action
                 step_result["action_taken"] = {
                     "type": "tool_call",
                     "tool_id": tool_id,
                     "parameters": parameters
                 }
-                
-                # Execute tool
-                tool_result = self.tool_manager.execute_tool(tool_call)
-                
-                # Store result
-                step_result["success"] = tool_result.success
-                step_result["result"] = tool_result.result
-                
-                if not tool_result.success:
-                    step_result["error"] = tool_result.error
+
+                # Serve deterministic tools from the result cache
+                cache_key = None
+                cached_result = None
+                if self._is_cacheable_tool(tool_id):
+                    cache_key = self._tool_cache_key(tool_id, parameters)
+                    cached_result = self._tool_cache_get(cache_key)
+
+                if cached_result is not None:
+                    step_result["success"] = True
+                    step_result["result"] = cached_result
+                else:
+                    # Create tool call
+                    tool_call = self.tool_manager.create_tool_call(tool_id, parameters)
+
+                    # Execute tool
+                    tool_result = self.tool_manager.execute_tool(tool_call)
+
+                    # Store result
+                    step_result["success"] = tool_result.success
+                    step_result["result"] = tool_result.result
+
+                    if not tool_result.success:
+                        step_result["error"] = tool_result.error
+                    elif cache_key is not None:
+                        self._tool_cache_set(cache_key, tool_result.result)
             
             elif action_type == "goal" or action_type == "subgoal":
                 # This is a goal/subgoal step, mark as successful if all substeps are completed
@@ -200,8 +532,10 @@ class PlanExecutor:
             step_result["success"] = False
             step_result["error"] = str(e)
         
-        # Update final timestamp
-        step_result["end_time"] = datetime.now()
+        # Update final timestamp from the monotonic duration
+        step_duration_ms = (time.perf_counter_ns() - step_start_ns) / 1e6
+        step_result["end_time"] = step_start + timedelta(milliseconds=step_duration_ms)
+        step_result["duration_ms"] = step_duration_ms
         
         # Store result in step
         step.result = step_result
@@ -209,13 +543,13 @@ class PlanExecutor:
         self.logger.info(f"Step {step.step_id} execution completed with success={step_result['success']}")
         return step_result
 
-    def _check_dependencies(self, step: PlanStep, plan: Plan, execution_results: Dict[str, Any]) -> bool:
+    def _check_dependencies(self, step: PlanStep, step_by_id: Dict[str, PlanStep], execution_results: Dict[str, Any]) -> bool:
         """
         Check if all dependencies of a step are satisfied.
 
         Args:
             step: The step to check.
-            plan: The parent plan.
+            step_by_id: Index of the plan's steps by step ID.
             execution_results: The current execution results.
 
         Returns:
@@ -226,7 +560,7 @@ class PlanExecutor:
         
         for dep_id in step.dependencies:
             # Find the dependency step
-            dep_step = next((s for s in plan.steps if s.step_id == dep_id), None)
+            dep_step = step_by_id.get(dep_id)
             
             if not dep_step:
                 self.logger.warning(f"Dependency {dep_id} not found for step {step.step_id}")
@@ -236,28 +570,31 @@ class PlanExecutor:
             if dep_step.status != StepStatus.COMPLETED:
                 return False
             
-            # Double-check in execution results
-            if dep_id in execution_results["step_results"]:
-                if execution_results["step_results"][dep_id]["status"] != "completed":
+            # Double-check in execution results; executed steps record a
+            # success flag rather than a status string
+            dep_result = execution_results["step_results"].get(dep_id)
+            if dep_result is not None:
+                if dep_result.get("status", "completed") != "completed":
+                    return False
+                if not dep_result.get("success", True):
                     return False
         
         return True
 
-    def _is_critical_step(self, step: PlanStep, plan: Plan) -> bool:
+    def _is_critical_step(self, step: PlanStep, dependents: Dict[str, List[str]]) -> bool:
         """
         Determine if a step is critical for the plan.
 
         Args:
             step: The step to check.
-            plan: The parent plan.
+            dependents: Map of step IDs to the IDs of steps depending on them.
 
         Returns:
             bool: True if the step is critical, False otherwise.
         """
         # Check if other steps depend on this step
-        for other_step in plan.steps:
-            if step.step_id in other_step.dependencies:
-                return True
+        if dependents.get(step.step_id):
+            return True
         
         # Check if this is a high-level goal step
         if step.action.get("type") == "goal":
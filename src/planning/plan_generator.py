@@ -5,30 +5,148 @@ This module implements the Plan Generator which creates execution plans
 based on user requests and available tools.
 """
 
+import functools
+import logging
+import re
+import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional
 
+from planning import _tot_traversal
+from planning.llm_cache import LLMCache
 from planning.models import (
     Plan, PlanStep, PlanningStrategy, PlanStatus, StepStatus,
     PlanningContext, PlanningResult, ThoughtNode, ThoughtTree
 )
 
+# Loaded lazily; top-k pruning only benefits from numpy on wide beams
+np = None
+
+# Candidate count above which numpy argpartition beats a Python sort
+_NUMPY_TOPK_THRESHOLD = 32
+
+
+def _load_numpy():
+    """
+    Import numpy on first use.
+
+    Returns:
+        The numpy module, or None if it is not installed.
+    """
+    global np
+    if np is None:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            pass
+    return np
+
+
+# Sampling temperature for all planning calls; kept low so identical
+# contexts produce cacheable completions
+_PLANNING_TEMPERATURE = 0.2
+
+# Self-evaluation ratings mapped to value estimates for beam search
+_RATING_VALUES = {"sure": 1.0, "maybe": 0.5, "impossible": 0.0}
+
+# Compiled response parsers: each response is scanned in one linear pass
+# instead of per-line string tests
+_REACT_RE = re.compile(
+    r"Thought:\s*(?P<thought>.+?)\n\s*Action:\s*(?P<action>[^\n]+?)"
+    r"(?:\n\s*Observation:\s*(?P<observation>.+?))?"
+    r"(?=\n\s*Thought:|\Z)",
+    re.S
+)
+_STEP_LINE_RE = re.compile(
+    r"^\s*(?:[-*]\s*|\d{1,3}\.\s*|Step\s*\d*\s*:\s*)(?P<text>.+?)\s*$",
+    re.M | re.I
+)
+_GOAL_LINE_RE = re.compile(
+    r"^\s*(?:[-*]\s*|\d{1,3}\.\s*|Goals?\s*\d*\s*:\s*)(?P<text>.+?)\s*$",
+    re.M | re.I
+)
+_DECOMP_LINE_RE = re.compile(
+    r"^\s*(?:(?P<kind>Goal|Subgoal|Action)s?\s*\d*\s*:\s*|(?P<bullet>[-*])\s*)(?P<text>.+?)\s*$",
+    re.M | re.I
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_planning_prompt(
+    user_request: str,
+    tools: tuple,
+    constraints: tuple,
+    knowledge: tuple,
+    strategy_name: str,
+    instruction: str
+) -> str:
+    """
+    Render a planning prompt from hashable context fields.
+
+    Pure function memoized with lru_cache: retries, evaluation passes, and
+    the hierarchical sub-plan loop re-request identical prompts, and the
+    stable text also lets prefix-caching LLM backends reuse their KV cache.
+
+    Args:
+        user_request: The user's request text.
+        tools: Tuple of (name, description) pairs for available tools.
+        constraints: Tuple of (key, value) string pairs.
+        knowledge: Tuple of (key, value) string pairs.
+        strategy_name: Name of the planning strategy.
+        instruction: Strategy-specific instruction for the LLM.
+
+    Returns:
+        str: The rendered planning prompt.
+    """
+    prompt = f"Task: {user_request}\n\n"
+    prompt += f"Planning approach: {strategy_name}\n"
+    prompt += f"{instruction}\n\n"
+
+    if tools:
+        prompt += "Available tools:\n"
+        for name, description in tools:
+            prompt += f"- {name}: {description}\n"
+        prompt += "\n"
+
+    if constraints:
+        prompt += "Constraints:\n"
+        for key, value in constraints:
+            prompt += f"- {key}: {value}\n"
+        prompt += "\n"
+
+    if knowledge:
+        prompt += "Relevant knowledge:\n"
+        for key, value in knowledge:
+            prompt += f"- {key}: {value}\n"
+        prompt += "\n"
+
+    prompt += "Provide the plan as a numbered list of steps."
+    return prompt
+
 
 class PlanGenerator:
     """
     Creates execution plans based on user requests and available tools.
     """
 
-    def __init__(self, llm_service):
+    def __init__(self, llm_service, llm_cache: Optional[LLMCache] = None):
         """
         Initialize the PlanGenerator.
 
         Args:
             llm_service: Service for calling the LLM.
+            llm_cache: Optional cache for LLM completions. Defaults to an
+                in-process TTL+LRU cache.
         """
         self.llm_service = llm_service
         self.default_strategy = PlanningStrategy.CHAIN_OF_THOUGHT
+        self.llm_cache = llm_cache if llm_cache is not None else LLMCache()
+        self._inflight = {}  # request key -> Future of PlanningResult
+        self._inflight_lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
 
     def generate_plan(
         self,
@@ -47,6 +165,48 @@ class PlanGenerator:
         """
         strategy = strategy or self.default_strategy
         
+        # Coalesce concurrent identical requests (retry storms, parallel
+        # UI refreshes) onto a single in-flight generation
+        key = self._context_key(planning_context) + (strategy.value,)
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+                owner = True
+            else:
+                owner = False
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            result = self._dispatch_strategy(planning_context, strategy)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _dispatch_strategy(
+        self,
+        planning_context: PlanningContext,
+        strategy: PlanningStrategy
+    ) -> PlanningResult:
+        """
+        Run the planning method for a strategy.
+
+        Args:
+            planning_context: Context information for planning.
+            strategy: Planning strategy to use.
+
+        Returns:
+            PlanningResult: The result of the planning operation.
+        """
         # Select planning method based on strategy
         if strategy == PlanningStrategy.CHAIN_OF_THOUGHT:
             return self._plan_with_chain_of_thought(planning_context)
@@ -116,8 +276,8 @@ class PlanGenerator:
         Returns:
             PlanningResult: The result of the planning operation.
         """
-        # Create thought tree
-        thought_tree = self._generate_thought_tree(planning_context)
+        # Explore thoughts with value-guided beam search
+        thought_tree = self._beam_search_thoughts(planning_context)
         
         # Extract best path from tree
         best_path = thought_tree.best_path
@@ -125,6 +285,7 @@ class PlanGenerator:
         # Convert best path to plan
         try:
             plan_steps = []
+            prior_step_ids = []
             for i, node_id in enumerate(best_path):
                 node = thought_tree.nodes[node_id]
                 
@@ -135,14 +296,16 @@ class PlanGenerator:
                     action={"type": "unknown"},  # Will be refined later
                     expected_outcome="",  # Will be refined later
                     verification_method={},  # Will be refined later
-                    dependencies=[f"step_{j+1}" for j in range(i)]
+                    dependencies=list(prior_step_ids)
                 )
                 plan_steps.append(step)
+                prior_step_ids.append(step.step_id)
             
             # Create plan
+            plan_uuid = uuid.uuid4().hex
             plan = Plan(
-                plan_id=str(uuid.uuid4()),
-                task_id="task_" + str(uuid.uuid4())[-8:],
+                plan_id=plan_uuid,
+                task_id=f"task_{plan_uuid[:8]}",
                 name=f"Plan for: {planning_context.user_request[:50]}...",
                 description=planning_context.user_request,
                 steps=plan_steps,
@@ -184,15 +347,14 @@ class PlanGenerator:
             "For each step, include Thought (reasoning), Action (tool to use), and Observation (expected result)."
         )
         
-        # Call LLM for planning
-        response = self._call_llm_for_planning(prompt)
-        
-        # Parse ReAct plan from LLM response
+        # Stream the LLM response and parse steps as tokens arrive, so
+        # parsing overlaps with generation instead of waiting for the
+        # full completion
         try:
             plan_steps = []
-            react_steps = self._parse_react_steps(response)
-            
-            for i, react_step in enumerate(react_steps):
+            prior_step_ids = []
+            stream = self._stream_llm_for_planning(prompt)
+            for i, react_step in enumerate(self._parse_react_steps_stream(stream)):
                 # Create plan step from ReAct step
                 step = PlanStep(
                     step_id=f"step_{i+1}",
@@ -204,14 +366,16 @@ class PlanGenerator:
                     },
                     expected_outcome=react_step["observation"],
                     verification_method={"type": "observation_match"},
-                    dependencies=[f"step_{j+1}" for j in range(i)]
+                    dependencies=list(prior_step_ids)
                 )
                 plan_steps.append(step)
+                prior_step_ids.append(step.step_id)
             
             # Create plan
+            plan_uuid = uuid.uuid4().hex
             plan = Plan(
-                plan_id=str(uuid.uuid4()),
-                task_id="task_" + str(uuid.uuid4())[-8:],
+                plan_id=plan_uuid,
+                task_id=f"task_{plan_uuid[:8]}",
                 name=f"Plan for: {planning_context.user_request[:50]}...",
                 description=planning_context.user_request,
                 steps=plan_steps,
@@ -255,12 +419,9 @@ class PlanGenerator:
         high_level_response = self._call_llm_for_planning(high_level_prompt)
         high_level_goals = self._parse_high_level_goals(high_level_response)
         
-        # Then, create sub-plans for each goal
-        all_steps = []
-        current_step_index = 1
-        
+        # Build all sub-plan prompts up front
+        sub_plan_prompts = []
         for i, goal in enumerate(high_level_goals):
-            # Create context for sub-plan
             sub_context = PlanningContext(
                 user_request=goal,
                 available_tools=planning_context.available_tools,
@@ -268,30 +429,38 @@ class PlanGenerator:
                 previous_plans=planning_context.previous_plans,
                 relevant_knowledge=planning_context.relevant_knowledge
             )
-            
-            # Generate sub-plan
-            sub_plan_prompt = self._create_planning_prompt(
+            sub_plan_prompts.append(self._create_planning_prompt(
                 sub_context,
                 f"Sub-Plan for Goal {i+1}",
                 f"Create detailed steps to achieve this goal: {goal}"
-            )
-            
-            sub_plan_response = self._call_llm_for_planning(sub_plan_prompt)
-            sub_plan_steps = self._parse_plan_steps(sub_plan_response)
+            ))
+        
+        # One batched round-trip for all sub-plans; falls back to
+        # concurrent individual calls when the service cannot batch
+        sub_plan_responses = self._call_llm_for_planning_batch(sub_plan_prompts)
+        
+        # Then, assemble the plan from each goal's sub-plan
+        all_steps = []
+        all_step_ids = []
+        current_step_index = 1
+        
+        for i, goal in enumerate(high_level_goals):
+            sub_plan_steps = self._parse_plan_steps(sub_plan_responses[i])
             
-            # Add goal as a header step
+            # Add goal as a header step depending on everything so far
             goal_step = PlanStep(
                 step_id=f"step_{current_step_index}",
                 description=f"GOAL: {goal}",
                 action={"type": "goal"},
                 expected_outcome="All sub-steps completed",
                 verification_method={"type": "all_substeps_complete"},
-                dependencies=[f"step_{j+1}" for j in range(current_step_index-1)]
+                dependencies=list(all_step_ids)
             )
             all_steps.append(goal_step)
+            all_step_ids.append(goal_step.step_id)
             current_step_index += 1
             
-            # Add sub-steps with dependencies on the goal step
+            # Add sub-steps with dependencies on the previous step
             for sub_step in sub_plan_steps:
                 step = PlanStep(
                     step_id=f"step_{current_step_index}",
@@ -299,15 +468,17 @@ class PlanGenerator:
                     action={"type": "unknown"},  # Will be refined later
                     expected_outcome="",  # Will be refined later
                     verification_method={},  # Will be refined later
-                    dependencies=[f"step_{current_step_index-1}"]  # Depend on previous step
+                    dependencies=[all_step_ids[-1]]
                 )
                 all_steps.append(step)
+                all_step_ids.append(step.step_id)
                 current_step_index += 1
         
         # Create plan
+        plan_uuid = uuid.uuid4().hex
         plan = Plan(
-            plan_id=str(uuid.uuid4()),
-            task_id="task_" + str(uuid.uuid4())[-8:],
+            plan_id=plan_uuid,
+            task_id=f"task_{plan_uuid[:8]}",
             name=f"Hierarchical Plan for: {planning_context.user_request[:50]}...",
             description=planning_context.user_request,
             steps=all_steps,
@@ -349,26 +520,29 @@ class PlanGenerator:
             
             # Convert decomposition to plan steps
             plan_steps = []
+            all_step_ids = []
             step_index = 1
             
             for goal in decomposition:
-                # Add goal as a header step
+                # Add goal as a header step depending on everything so far
+                goal_step_id = f"step_{step_index}"
                 goal_step = PlanStep(
-                    step_id=f"step_{step_index}",
+                    step_id=goal_step_id,
                     description=f"GOAL: {goal['goal']}",
                     action={"type": "goal"},
                     expected_outcome="All sub-steps completed",
                     verification_method={"type": "all_substeps_complete"},
-                    dependencies=[f"step_{j+1}" for j in range(step_index-1)]
+                    dependencies=list(all_step_ids)
                 )
                 plan_steps.append(goal_step)
-                goal_step_id = f"step_{step_index}"
+                all_step_ids.append(goal_step_id)
                 step_index += 1
                 
                 # Add subgoals
                 for subgoal in goal['subgoals']:
+                    subgoal_step_id = f"step_{step_index}"
                     subgoal_step = PlanStep(
-                        step_id=f"step_{step_index}",
+                        step_id=subgoal_step_id,
                         description=f"SUBGOAL: {subgoal['subgoal']}",
                         action={"type": "subgoal"},
                         expected_outcome="All actions completed",
@@ -376,7 +550,7 @@ class PlanGenerator:
                         dependencies=[goal_step_id]
                     )
                     plan_steps.append(subgoal_step)
-                    subgoal_step_id = f"step_{step_index}"
+                    all_step_ids.append(subgoal_step_id)
                     step_index += 1
                     
                     # Add actions for this subgoal
@@ -390,12 +564,14 @@ class PlanGenerator:
                             dependencies=[subgoal_step_id]
                         )
                         plan_steps.append(action_step)
+                        all_step_ids.append(action_step.step_id)
                         step_index += 1
             
             # Create plan
+            plan_uuid = uuid.uuid4().hex
             plan = Plan(
-                plan_id=str(uuid.uuid4()),
-                task_id="task_" + str(uuid.uuid4())[-8:],
+                plan_id=plan_uuid,
+                task_id=f"task_{plan_uuid[:8]}",
                 name=f"Plan for: {planning_context.user_request[:50]}...",
                 description=planning_context.user_request,
                 steps=plan_steps,
@@ -414,4 +590,680 @@ class PlanGenerator:
             return PlanningResult(
                 success=False,
                 plan=None,
-                error=f"Faile<response clipped><NOTE>To save on context only part of this file has been shown to you. You should retry this tool after you have searched inside the file with `grep -n` in order to find the line numbers of what you are looking for.</NOTE>
\ No newline at end of file
+                error=f"Failed to parse goal decomposition: {str(e)}",
+                alternatives=[],
+                reasoning="Error occurred during plan generation."
+            )
+
+    def _beam_search_thoughts(
+        self,
+        planning_context: PlanningContext,
+        beam_width: int = 3,
+        max_depth: int = 5,
+        lambda_v: float = 0.5,
+        max_beam_width: int = 5,
+        llm_call_budget: Optional[int] = None,
+        epsilon_low: float = 0.01,
+        epsilon_high: float = 0.1
+    ) -> ThoughtTree:
+        """
+        Explore thoughts with a step-level beam search.
+
+        Instead of expanding a full tree (O(branching^depth) LLM calls),
+        only the top-k prefixes survive each depth, ranked by cumulative
+        path score plus the LLM's own value estimate for the continuation.
+        The beam width adapts per depth: when the surviving prefixes agree
+        (low score variance) the beam narrows to save calls, and when they
+        disagree it widens to spend more exploration where it matters. A
+        global LLM-call budget bounds total cost regardless of width.
+
+        Args:
+            planning_context: Context information for planning.
+            beam_width: Initial number of prefixes kept at each depth.
+            max_depth: Maximum depth of the search.
+            lambda_v: Weight of the value estimate in the ranking score.
+            max_beam_width: Upper bound when the beam widens.
+            llm_call_budget: Maximum total LLM calls. Defaults to
+                beam_width * max_depth.
+            epsilon_low: Score variance below which the beam narrows.
+            epsilon_high: Score variance above which the beam widens.
+
+        Returns:
+            ThoughtTree: The explored tree with its best path populated.
+        """
+        root = ThoughtNode(
+            node_id="node_0",
+            content=planning_context.user_request,
+            score=0.0
+        )
+        nodes = {root.node_id: root}
+        node_counter = 1
+        beam = [root.node_id]
+        # Parallel structure-of-arrays view of the tree: node "node_i" is
+        # index i, parent_indices[i] is its parent's index (-1 for root)
+        parent_indices = [-1]
+        remaining_budget = llm_call_budget if llm_call_budget is not None else beam_width * max_depth
+
+        for depth in range(max_depth):
+            if remaining_budget <= 0:
+                break
+
+            candidates = []
+
+            # Clamp this depth's expansions to the remaining budget
+            for node_id in beam[:remaining_budget]:
+                node = nodes[node_id]
+
+                # One LLM call per surviving prefix: continuations plus a
+                # self-evaluated value for each
+                prompt = self._create_thought_expansion_prompt(
+                    planning_context, node, beam_width
+                )
+                response = self._call_llm_for_planning(prompt)
+                remaining_budget -= 1
+
+                parent_index = int(node_id[5:])
+                for content, value in self._parse_thoughts(response)[:beam_width]:
+                    child = ThoughtNode(
+                        node_id=f"node_{node_counter}",
+                        content=content,
+                        parent_id=node_id,
+                        score=node.score + lambda_v * value
+                    )
+                    nodes[child.node_id] = child
+                    node.children.append(child.node_id)
+                    candidates.append(child)
+                    parent_indices.append(parent_index)
+                    node_counter += 1
+
+            if not candidates:
+                break
+
+            # Keep only the top-k prefixes for the next depth. Wide
+            # candidate sets use an O(N) argpartition; small ones stick
+            # with a Python sort, which is faster at that scale
+            if len(candidates) > _NUMPY_TOPK_THRESHOLD and _load_numpy() is not None:
+                scores = np.fromiter(
+                    (c.score for c in candidates),
+                    dtype=np.float32,
+                    count=len(candidates)
+                )
+                k = min(beam_width, len(candidates))
+                top_idx = np.argpartition(-scores, k - 1)[:k]
+                survivors = sorted(
+                    (candidates[int(i)] for i in top_idx),
+                    key=lambda n: n.score,
+                    reverse=True
+                )
+            else:
+                candidates.sort(key=lambda n: n.score, reverse=True)
+                survivors = candidates[:beam_width]
+            beam = [c.node_id for c in survivors]
+
+            # Adapt the next depth's width from the survivors' score spread:
+            # consensus narrows the beam, disagreement widens it
+            if len(survivors) > 1:
+                mean_score = sum(c.score for c in survivors) / len(survivors)
+                variance = sum((c.score - mean_score) ** 2 for c in survivors) / len(survivors)
+                if variance < epsilon_low:
+                    beam_width = max(1, beam_width - 1)
+                elif variance > epsilon_high:
+                    beam_width = min(max_beam_width, beam_width + 2)
+
+        # Extract the best path by backtracking from the best surviving prefix
+        best_path = []
+        if beam and beam[0] != root.node_id:
+            if _tot_traversal.extract_path is not None:
+                # Compiled walk over the flat parent-index array
+                parent_array = _tot_traversal.as_parent_array(parent_indices)
+                path_indices = _tot_traversal.extract_path(parent_array, int(beam[0][5:]))
+                best_path = [f"node_{i}" for i in path_indices]
+            else:
+                current = nodes[beam[0]]
+                while current is not None and current.node_id != root.node_id:
+                    best_path.append(current.node_id)
+                    current = nodes.get(current.parent_id)
+                best_path.reverse()
+
+        return ThoughtTree(
+            tree_id=str(uuid.uuid4()),
+            nodes=nodes,
+            root_id=root.node_id,
+            best_path=best_path
+        )
+
+    def _create_thought_expansion_prompt(
+        self,
+        planning_context: PlanningContext,
+        node: ThoughtNode,
+        branching_factor: int
+    ) -> str:
+        """
+        Create a prompt asking the LLM to expand a thought node.
+
+        Args:
+            planning_context: Context information for planning.
+            node: The thought node to expand.
+            branching_factor: Number of continuations to request.
+
+        Returns:
+            str: The expansion prompt.
+        """
+        prompt = f"Task: {planning_context.user_request}\n\n"
+        prompt += f"Current thought: {node.content}\n\n"
+        prompt += f"Propose {branching_factor} possible next steps toward completing the task. "
+        prompt += "For each, give a one-line description and rate whether the step will "
+        prompt += "lead to completing the task: sure, maybe, or impossible.\n\n"
+        prompt += "Format each as:\n- [description] (rating: sure|maybe|impossible)"
+        return prompt
+
+    def _parse_thoughts(self, response: str) -> List[tuple]:
+        """
+        Parse candidate thoughts and value estimates from an expansion response.
+
+        Args:
+            response: The LLM response to parse.
+
+        Returns:
+            List[tuple]: List of (content, value) pairs with value in [0, 1].
+        """
+        thoughts = []
+
+        for line in response.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+
+            # Strip bullet or number prefixes
+            if line.startswith("-") or line.startswith("*"):
+                line = line[1:].strip()
+            elif line[0].isdigit() and "." in line[:4]:
+                line = line.split(".", 1)[1].strip()
+            else:
+                continue
+
+            # Extract a trailing "(rating: ...)" or "(score: X)" if present
+            score = 0.5
+            lowered = line.lower()
+            if "(rating:" in lowered:
+                start = lowered.rindex("(rating:")
+                rating_text = lowered[start + len("(rating:"):].rstrip(") ").strip()
+                score = _RATING_VALUES.get(rating_text, 0.5)
+                line = line[:start].strip()
+            elif "(score:" in lowered:
+                start = lowered.rindex("(score:")
+                score_text = line[start + len("(score:"):].rstrip(") ").strip()
+                try:
+                    score = max(0.0, min(1.0, float(score_text)))
+                except ValueError:
+                    pass
+                line = line[:start].strip()
+
+            if line:
+                thoughts.append((line, score))
+
+        return thoughts
+
+    def _create_planning_prompt(
+        self,
+        planning_context: PlanningContext,
+        strategy_name: str,
+        instruction: str
+    ) -> str:
+        """
+        Create a planning prompt from the context.
+
+        Args:
+            planning_context: Context information for planning.
+            strategy_name: Name of the planning strategy.
+            instruction: Strategy-specific instruction for the LLM.
+
+        Returns:
+            str: The planning prompt.
+        """
+        user_request, tools_key, constraints_key, knowledge_key = self._context_key(
+            planning_context
+        )
+        return _render_planning_prompt(
+            user_request,
+            tools_key,
+            constraints_key,
+            knowledge_key,
+            strategy_name,
+            instruction
+        )
+
+    @staticmethod
+    def _context_key(planning_context: PlanningContext) -> tuple:
+        """
+        Flatten a planning context into a hashable key.
+
+        Used both to memoize rendered prompts and to coalesce concurrent
+        identical generation requests.
+
+        Args:
+            planning_context: Context information for planning.
+
+        Returns:
+            tuple: (user_request, tools, constraints, knowledge) with the
+                collection fields as hashable tuples.
+        """
+        tools_key = tuple(
+            (tool.get("name", tool.get("tool_id", "unknown")), tool.get("description", ""))
+            for tool in planning_context.available_tools
+        )
+        constraints_key = tuple(
+            (key, str(value)) for key, value in planning_context.constraints.items()
+        )
+        knowledge_key = tuple(
+            (key, str(value)) for key, value in planning_context.relevant_knowledge.items()
+        )
+        return (planning_context.user_request, tools_key, constraints_key, knowledge_key)
+
+    def _call_llm_for_planning(self, prompt: str) -> str:
+        """
+        Call the LLM service with a planning prompt.
+
+        Args:
+            prompt: The planning prompt.
+
+        Returns:
+            str: The LLM completion, or an empty string on failure.
+        """
+        request = {
+            "prompt": prompt,
+            "temperature": _PLANNING_TEMPERATURE,
+            "max_tokens": 2000,
+            "stop_sequences": []
+        }
+
+        cache_key = None
+        if self.llm_cache is not None:
+            cache_key = LLMCache.make_key(
+                prompt=prompt,
+                temperature=request["temperature"]
+            )
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("Planning LLM cache hit")
+                return cached
+
+        try:
+            response = self.llm_service(request)
+        except Exception as e:
+            self.logger.error(f"Error calling LLM for planning: {str(e)}")
+            return ""
+
+        if isinstance(response, dict):
+            completion = response.get("completion", "")
+        else:
+            completion = str(response)
+
+        if completion and cache_key is not None:
+            self.llm_cache.set(cache_key, completion)
+
+        return completion
+
+    def _call_llm_for_planning_batch(self, prompts: List[str]) -> List[str]:
+        """
+        Resolve several planning prompts in a single LLM request.
+
+        Cached completions are served per prompt; only the misses are
+        sent, in one batched request. Services that cannot batch fall
+        back to concurrent individual calls.
+
+        Args:
+            prompts: The planning prompts.
+
+        Returns:
+            List[str]: One completion per prompt, in order.
+        """
+        if not prompts:
+            return []
+        if len(prompts) == 1:
+            return [self._call_llm_for_planning(prompts[0])]
+
+        completions = [None] * len(prompts)
+        cache_keys = [None] * len(prompts)
+        pending = []
+
+        for i, prompt in enumerate(prompts):
+            if self.llm_cache is not None:
+                cache_keys[i] = LLMCache.make_key(
+                    prompt=prompt,
+                    temperature=_PLANNING_TEMPERATURE
+                )
+                cached = self.llm_cache.get(cache_keys[i])
+                if cached is not None:
+                    completions[i] = cached
+                    continue
+            pending.append(i)
+
+        if pending:
+            request = {
+                "prompt": [prompts[i] for i in pending],
+                "temperature": _PLANNING_TEMPERATURE,
+                "max_tokens": 2000,
+                "stop_sequences": []
+            }
+
+            batch = None
+            try:
+                response = self.llm_service(request)
+                batch = self._extract_batch_completions(response, len(pending))
+            except Exception as e:
+                self.logger.error(f"Error calling LLM for batched planning: {str(e)}")
+
+            if batch is None:
+                # Service cannot batch: issue the misses concurrently
+                with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                    batch = list(executor.map(
+                        self._call_llm_for_planning,
+                        [prompts[i] for i in pending]
+                    ))
+                for i, completion in zip(pending, batch):
+                    completions[i] = completion
+            else:
+                for i, completion in zip(pending, batch):
+                    completions[i] = completion
+                    if completion and cache_keys[i] is not None:
+                        self.llm_cache.set(cache_keys[i], completion)
+
+        return ["" if c is None else c for c in completions]
+
+    @staticmethod
+    def _extract_batch_completions(response: Any, expected: int) -> Optional[List[str]]:
+        """
+        Extract per-prompt completions from a batched response.
+
+        Completion order is not guaranteed by every service, so items
+        carrying an index field are matched by index.
+
+        Args:
+            response: The raw LLM service response.
+            expected: Number of completions expected.
+
+        Returns:
+            Optional[List[str]]: Completions in prompt order, or None if
+                the response does not look like a batch.
+        """
+        if isinstance(response, dict):
+            items = response.get("completions")
+        elif isinstance(response, list):
+            items = response
+        else:
+            return None
+
+        if not isinstance(items, list) or len(items) != expected:
+            return None
+
+        out = [""] * expected
+        for pos, item in enumerate(items):
+            if isinstance(item, dict):
+                index = item.get("index", pos)
+                text = item.get("completion", "")
+            else:
+                index = pos
+                text = str(item)
+            if isinstance(index, int) and 0 <= index < expected:
+                out[index] = text
+        return out
+
+    def _stream_llm_for_planning(self, prompt: str) -> Iterator[str]:
+        """
+        Call the LLM service with a planning prompt, yielding chunks.
+
+        Falls back to yielding the whole completion at once when the
+        service does not stream. The assembled completion is cached on
+        completion just like the blocking path.
+
+        Args:
+            prompt: The planning prompt.
+
+        Yields:
+            str: Chunks of the LLM completion.
+        """
+        request = {
+            "prompt": prompt,
+            "temperature": _PLANNING_TEMPERATURE,
+            "max_tokens": 2000,
+            "stop_sequences": [],
+            "stream": True
+        }
+
+        cache_key = None
+        if self.llm_cache is not None:
+            cache_key = LLMCache.make_key(
+                prompt=prompt,
+                temperature=request["temperature"]
+            )
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("Planning LLM cache hit")
+                yield cached
+                return
+
+        try:
+            response = self.llm_service(request)
+        except Exception as e:
+            self.logger.error(f"Error calling LLM for planning: {str(e)}")
+            return
+
+        if hasattr(response, "__iter__") and not isinstance(response, (dict, str, list)):
+            chunks = []
+            for chunk in response:
+                text = chunk if isinstance(chunk, str) else str(chunk)
+                chunks.append(text)
+                yield text
+            completion = "".join(chunks)
+        else:
+            if isinstance(response, dict):
+                completion = response.get("completion", "")
+            else:
+                completion = str(response)
+            yield completion
+
+        if completion and cache_key is not None:
+            self.llm_cache.set(cache_key, completion)
+
+    def _parse_plan_from_response(
+        self,
+        response: str,
+        user_request: str,
+        strategy: PlanningStrategy
+    ) -> Plan:
+        """
+        Parse a plan from an LLM response.
+
+        Args:
+            response: The LLM response to parse.
+            user_request: The original user request.
+            strategy: The planning strategy that produced the response.
+
+        Returns:
+            Plan: The parsed plan.
+        """
+        step_descriptions = self._parse_plan_steps(response)
+
+        plan_steps = []
+        prior_step_ids = []
+        for i, description in enumerate(step_descriptions):
+            step = PlanStep(
+                step_id=f"step_{i+1}",
+                description=description,
+                action={"type": "unknown"},  # Will be refined later
+                expected_outcome="",  # Will be refined later
+                verification_method={},  # Will be refined later
+                dependencies=list(prior_step_ids)
+            )
+            plan_steps.append(step)
+            prior_step_ids.append(step.step_id)
+
+        plan_uuid = uuid.uuid4().hex
+        return Plan(
+            plan_id=plan_uuid,
+            task_id=f"task_{plan_uuid[:8]}",
+            name=f"Plan for: {user_request[:50]}...",
+            description=user_request,
+            steps=plan_steps,
+            strategy=strategy,
+            status=PlanStatus.CREATED
+        )
+
+    @staticmethod
+    def _split_action(action_text: str) -> tuple:
+        """
+        Split "tool(param=value, ...)" into a tool ID and parameters.
+
+        Args:
+            action_text: The action text from a ReAct step.
+
+        Returns:
+            tuple: (tool_id, parameters dict).
+        """
+        parameters = {}
+        if "(" in action_text and action_text.endswith(")"):
+            tool_id, params_text = action_text.split("(", 1)
+            tool_id = tool_id.strip()
+            params_text = params_text[:-1]
+            for pair in params_text.split(","):
+                if "=" in pair:
+                    key, value = pair.split("=", 1)
+                    parameters[key.strip()] = value.strip().strip("'\"")
+        else:
+            tool_id = action_text
+        return tool_id, parameters
+
+    def _parse_react_steps_stream(self, chunks: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Incrementally parse ReAct steps from a stream of response chunks.
+
+        Each step is emitted as soon as the following Thought boundary (or
+        the end of the stream) is seen, so downstream work can start while
+        the LLM is still generating.
+
+        Args:
+            chunks: Iterable of response text chunks.
+
+        Yields:
+            Dict[str, Any]: Parsed ReAct steps.
+        """
+        current_step = {}
+
+        def handle_line(line):
+            nonlocal current_step
+            line = line.strip()
+            completed = None
+
+            if line.startswith("Thought:"):
+                if "thought" in current_step and "action" in current_step:
+                    current_step.setdefault("observation", "")
+                    completed = current_step
+                current_step = {"thought": line[len("Thought:"):].strip()}
+            elif line.startswith("Action:"):
+                tool_id, parameters = self._split_action(line[len("Action:"):].strip())
+                current_step["action"] = tool_id
+                current_step["parameters"] = parameters
+            elif line.startswith("Observation:"):
+                current_step["observation"] = line[len("Observation:"):].strip()
+
+            return completed
+
+        buffer = ""
+        for chunk in chunks:
+            buffer += chunk
+            while "\n" in buffer:
+                line, buffer = buffer.split("\n", 1)
+                completed = handle_line(line)
+                if completed is not None:
+                    yield completed
+
+        if buffer:
+            completed = handle_line(buffer)
+            if completed is not None:
+                yield completed
+
+        if "thought" in current_step and "action" in current_step:
+            current_step.setdefault("observation", "")
+            yield current_step
+
+    def _parse_react_steps(self, response: str) -> List[Dict[str, Any]]:
+        """
+        Parse ReAct (Thought/Action/Observation) steps from an LLM response.
+
+        Args:
+            response: The LLM response to parse.
+
+        Returns:
+            List[Dict[str, Any]]: List of parsed ReAct steps.
+        """
+        steps = []
+
+        for match in _REACT_RE.finditer(response):
+            tool_id, parameters = self._split_action(match.group("action").strip())
+            observation = match.group("observation")
+            steps.append({
+                "thought": match.group("thought").strip(),
+                "action": tool_id,
+                "parameters": parameters,
+                "observation": observation.strip() if observation else ""
+            })
+
+        return steps
+
+    def _parse_high_level_goals(self, response: str) -> List[str]:
+        """
+        Parse high-level goals from an LLM response.
+
+        Args:
+            response: The LLM response to parse.
+
+        Returns:
+            List[str]: List of goal descriptions.
+        """
+        return [match.group("text") for match in _GOAL_LINE_RE.finditer(response)]
+
+    def _parse_plan_steps(self, response: str) -> List[str]:
+        """
+        Parse step descriptions from an LLM response.
+
+        Args:
+            response: The LLM response to parse.
+
+        Returns:
+            List[str]: List of step descriptions.
+        """
+        return [match.group("text") for match in _STEP_LINE_RE.finditer(response)]
+
+    def _parse_goal_decomposition(self, response: str) -> List[Dict[str, Any]]:
+        """
+        Parse a goal decomposition (goals, subgoals, actions) from an LLM response.
+
+        Args:
+            response: The LLM response to parse.
+
+        Returns:
+            List[Dict[str, Any]]: List of goals with nested subgoals and actions.
+        """
+        decomposition = []
+        current_goal = None
+        current_subgoal = None
+
+        for match in _DECOMP_LINE_RE.finditer(response):
+            kind = match.group("kind")
+            kind = kind.lower() if kind else None
+            text = match.group("text").strip()
+
+            if kind == "goal":
+                current_goal = {"goal": text, "subgoals": []}
+                current_subgoal = None
+                decomposition.append(current_goal)
+            elif kind == "subgoal":
+                current_subgoal = {"subgoal": text, "actions": []}
+                if current_goal is not None:
+                    current_goal["subgoals"].append(current_subgoal)
+            elif kind == "action" or match.group("bullet"):
+                if current_subgoal is not None:
+                    current_subgoal["actions"].append(text)
+
+        return decomposition
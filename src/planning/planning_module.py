@@ -5,17 +5,80 @@ This module implements the main Planning Module class that integrates all planni
 components and provides a unified interface for the Agent Core.
 """
 
+import json
 import logging
 import uuid
+from collections import defaultdict
+from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 from planning.models import (
     Plan, PlanStep, PlanningStrategy, PlanStatus, StepStatus,
     PlanningContext, PlanningResult, PlanningTask
 )
-from planning.plan_generator import PlanGenerator
-from planning.plan_executor import PlanExecutor
-from planning.plan_evaluator import PlanEvaluator
+def _json_default(value):
+    """Fallback encoder for types the stdlib json module cannot handle."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _encode_json(payload: Any) -> bytes:
+    """
+    Encode a payload to JSON bytes.
+
+    Uses orjson when available, which serializes datetimes natively and
+    is several times faster than the stdlib encoder.
+
+    Args:
+        payload: The object to encode.
+
+    Returns:
+        bytes: The encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC)
+    return json.dumps(payload, default=_json_default).encode("utf-8")
+
+
+# Enum-to-string tables for the serialization hot paths: a dict index is
+# cheaper than the .value descriptor lookup per step per poll
+_PLAN_STATUS_STR = {status: status.value for status in PlanStatus}
+_STEP_STATUS_STR = {status: status.value for status in StepStatus}
+_STATUS_BY_VALUE = {status.value: status for status in StepStatus}
+_STRATEGY_STR = {strategy: strategy.value for strategy in PlanningStrategy}
+
+# Source template for the specialized plan serializer. Compiling this once
+# at init time gives get_plan a single flat function of direct attribute
+# reads into a pre-shaped dict literal, instead of re-dispatching the
+# dict-building bytecode inside a method on every call.
+_SERIALIZE_PLAN_SRC = """\
+def _serialize_plan(plan):
+    return {
+        "plan_id": plan.plan_id,
+        "task_id": plan.task_id,
+        "name": plan.name,
+        "description": plan.description,
+        "strategy": _STRATEGY_STR[plan.strategy],
+        "status": _PLAN_STATUS_STR[plan.status],
+        "steps": [
+            {
+                "step_id": step.step_id,
+                "description": step.description,
+                "status": _STEP_STATUS_STR[step.status],
+                "dependencies": step.dependencies
+            }
+            for step in plan.steps
+        ],
+        "created_at": plan.created_at.isoformat() if plan.created_at else None,
+        "updated_at": plan.updated_at.isoformat() if plan.updated_at else None
+    }
+"""
 
 
 class PlanningModule:
@@ -37,19 +100,61 @@ class PlanningModule:
         self.tool_manager = tool_manager
         self.event_processor = event_processor
         
-        # Initialize components
-        self.plan_generator = PlanGenerator(llm_service)
-        self.plan_executor = PlanExecutor(tool_manager, event_processor)
-        self.plan_evaluator = PlanEvaluator(llm_service)
+        # Components are constructed lazily on first use; see the
+        # plan_generator/plan_executor/plan_evaluator properties
+        self._generator = None
+        self._executor = None
+        self._evaluator = None
         
         # Initialize storage
         self.plans = {}  # plan_id -> Plan
         self.tasks = {}  # task_id -> PlanningTask
+        self._plans_by_task = defaultdict(set)  # task_id -> set of plan_ids
+        self._plan_json_cache = {}  # plan_id -> (updated_at, serialized dict)
+        self._plan_bytes_cache = {}  # plan_id -> (updated_at, encoded JSON bytes)
+        
+        # Compile the specialized plan serializer
+        namespace = {
+            "_PLAN_STATUS_STR": _PLAN_STATUS_STR,
+            "_STEP_STATUS_STR": _STEP_STATUS_STR,
+            "_STRATEGY_STR": _STRATEGY_STR
+        }
+        exec(compile(_SERIALIZE_PLAN_SRC, "<plan-serializer>", "exec"), namespace)
+        self._serialize_plan = namespace["_serialize_plan"]
         
         # Configure logging
         self.logger = logging.getLogger(__name__)
         self.logger.info("PlanningModule initialized")
 
+    @property
+    def plan_generator(self):
+        """
+        The plan generator, constructed on first use.
+
+        Deferring the import keeps task-management-only callers from
+        paying the generator's transitive import cost at startup.
+        """
+        if self._generator is None:
+            from planning.plan_generator import PlanGenerator
+            self._generator = PlanGenerator(self.llm_service)
+        return self._generator
+
+    @property
+    def plan_executor(self):
+        """The plan executor, constructed on first use."""
+        if self._executor is None:
+            from planning.plan_executor import PlanExecutor
+            self._executor = PlanExecutor(self.tool_manager, self.event_processor)
+        return self._executor
+
+    @property
+    def plan_evaluator(self):
+        """The plan evaluator, constructed on first use."""
+        if self._evaluator is None:
+            from planning.plan_evaluator import PlanEvaluator
+            self._evaluator = PlanEvaluator(self.llm_service)
+        return self._evaluator
+
     def create_task(
         self,
         description: str,
@@ -134,6 +239,7 @@ class PlanningModule:
         # Store plan
         plan = result.plan
         self.plans[plan.plan_id] = plan
+        self._plans_by_task[plan.task_id].add(plan.plan_id)
         
         self.logger.info(f"Generated plan {plan.plan_id} for task {task_id} using {strategy.value} strategy")
         return plan.plan_id
@@ -212,26 +318,15 @@ class PlanningModule:
         
         plan = self.plans[plan_id]
         
-        # Convert to dictionary
-        return {
-            "plan_id": plan.plan_id,
-            "task_id": plan.task_id,
-            "name": plan.name,
-            "description": plan.description,
-            "strategy": plan.strategy.value,
-            "status": plan.status.value,
-            "steps": [
-                {
-                    "step_id": step.step_id,
-                    "description": step.description,
-                    "status": step.status.value,
-                    "dependencies": step.dependencies
-                }
-                for step in plan.steps
-            ],
-            "created_at": plan.created_at.isoformat() if plan.created_at else None,
-            "updated_at": plan.updated_at.isoformat() if plan.updated_at else None
-        }
+        # Serve the cached dict while the plan is unchanged; updated_at is
+        # bumped by every mutation path, so staleness checks are one compare
+        cached = self._plan_json_cache.get(plan_id)
+        if cached is not None and cached[0] == plan.updated_at:
+            return cached[1]
+        
+        serialized = self._serialize_plan(plan)
+        self._plan_json_cache[plan_id] = (plan.updated_at, serialized)
+        return serialized
 
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -258,6 +353,43 @@ class PlanningModule:
             "deadline": task.deadline.isoformat() if task.deadline else None
         }
 
+    def get_plan_json(self, plan_id: str) -> Optional[bytes]:
+        """
+        Get a plan as encoded JSON bytes, for API responses.
+
+        Cached per plan until updated_at advances, so polling an
+        unchanged plan is a dict lookup returning the same bytes.
+
+        Args:
+            plan_id: ID of the plan to get.
+
+        Returns:
+            Optional[bytes]: The encoded plan if found, None otherwise.
+        """
+        plan = self.plans.get(plan_id)
+        if plan is None:
+            return None
+        
+        cached = self._plan_bytes_cache.get(plan_id)
+        if cached is not None and cached[0] == plan.updated_at:
+            return cached[1]
+        
+        encoded = _encode_json(self.get_plan(plan_id))
+        self._plan_bytes_cache[plan_id] = (plan.updated_at, encoded)
+        return encoded
+
+    def list_plans_json(self, task_id: Optional[str] = None) -> bytes:
+        """
+        List plans as encoded JSON bytes, for API responses.
+
+        Args:
+            task_id: Optional task ID to filter by.
+
+        Returns:
+            bytes: The encoded plan list.
+        """
+        return _encode_json(self.list_plans(task_id))
+
     def list_plans(self, task_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List all plans, optionally filtered by task ID.
@@ -268,19 +400,28 @@ class PlanningModule:
         Returns:
             List[Dict[str, Any]]: List of plans.
         """
+        # Use the task index so filtered listings only touch matching plans
+        if task_id is None:
+            plans = self.plans.values()
+        else:
+            plans = [
+                self.plans[plan_id]
+                for plan_id in self._plans_by_task.get(task_id, ())
+                if plan_id in self.plans
+            ]
+        
         plans_list = []
         
-        for plan in self.plans.values():
-            if task_id is None or plan.task_id == task_id:
-                plans_list.append({
-                    "plan_id": plan.plan_id,
-                    "task_id": plan.task_id,
-                    "name": plan.name,
-                    "status": plan.status.value,
-                    "strategy": plan.strategy.value,
-                    "steps_count": len(plan.steps),
-                    "created_at": plan.created_at.isoformat() if plan.created_at else None
-                })
+        for plan in plans:
+            plans_list.append({
+                "plan_id": plan.plan_id,
+                "task_id": plan.task_id,
+                "name": plan.name,
+                "status": _PLAN_STATUS_STR[plan.status],
+                "strategy": _STRATEGY_STR[plan.strategy],
+                "steps_count": len(plan.steps),
+                "created_at": plan.created_at.isoformat() if plan.created_at else None
+            })
         
         return plans_list
 
@@ -325,7 +466,7 @@ class PlanningModule:
         plan = self.plans[plan_id]
         
         # Find step
-        step = next((s for s in plan.steps if s.step_id == step_id), None)
+        step = plan.get_step(step_id)
         if not step:
             raise ValueError(f"Step not found: {step_id}")
         
@@ -334,10 +475,11 @@ class PlanningModule:
             step.description = updates["description"]
         
         if "status" in updates:
-            try:
-                step.status = StepStatus(updates["status"])
-            except ValueError:
+            status = _STATUS_BY_VALUE.get(updates["status"])
+            if status is None:
                 self.logger.warning(f"Invalid status: {updates['status']}")
+            else:
+                step.status = status
         
         if "action" in updates:
             step.action = updates["action"]
@@ -371,7 +513,10 @@ class PlanningModule:
             bool: True if the plan was deleted, False if it wasn't found.
         """
         if plan_id in self.plans:
-            del self.plans[plan_id]
+            plan = self.plans.pop(plan_id)
+            self._plans_by_task[plan.task_id].discard(plan_id)
+            self._plan_json_cache.pop(plan_id, None)
+            self._plan_bytes_cache.pop(plan_id, None)
             self.logger.info(f"Deleted plan: {plan_id}")
             return True
         
@@ -390,14 +535,13 @@ class PlanningModule:
         if task_id in self.tasks:
             del self.tasks[task_id]
             
-            # Also delete associated plans
-            plan_ids_to_delete = [
-                plan_id for plan_id, plan in self.plans.items()
-                if plan.task_id == task_id
-            ]
+            # Also delete associated plans via the task index
+            plan_ids_to_delete = self._plans_by_task.pop(task_id, set())
             
             for plan_id in plan_ids_to_delete:
-                del self.plans[plan_id]
+                self.plans.pop(plan_id, None)
+                self._plan_json_cache.pop(plan_id, None)
+                self._plan_bytes_cache.pop(plan_id, None)
             
             self.logger.info(f"Deleted task: {task_id} and {len(plan_ids_to_delete)} associated plans")
             return True
@@ -12,236 +12,224 @@ from typing import Dict, List, Any, Optional, Union, Callable
 from tools.models import ToolCategory, ParameterType, ToolRegistry
 from tools.provider import ToolProvider
 
+# Accepted URL schemes and the validation failure response, built once
+# instead of per call. Callers get a copy so the shared dict is never
+# mutated.
+_VALID_URL_PREFIXES = ('http://', 'https://', 'file://')
+
+_URL_PROTOCOL_ERROR = {
+    "success": False,
+    "error": "URL must include protocol prefix (http://, https://, or file://)"
+}
+
+
+# Static descriptions of the browser tools, built once at import time.
+# Each entry maps to one create_tool call; "method" names the
+# BrowserToolProvider method bound as the tool function, and "parameters"
+# holds the create_parameter keyword arguments for each parameter.
+_BROWSER_TOOL_SPECS = (
+    {
+        "name": "browser_view",
+        "description": "View content of the current browser page.",
+        "method": "browser_view",
+        "parameters": ()
+    },
+    {
+        "name": "browser_navigate",
+        "description": "Navigate browser to specified URL.",
+        "method": "browser_navigate",
+        "parameters": (
+            {
+                "name": "url",
+                "description": "Complete URL to visit. Must include protocol prefix (e.g., https:// or file://).",
+                "type": ParameterType.STRING,
+                "required": True
+            },
+        ),
+        "has_side_effects": True
+    },
+    {
+        "name": "browser_restart",
+        "description": "Restart browser and navigate to specified URL.",
+        "method": "browser_restart",
+        "parameters": (
+            {
+                "name": "url",
+                "description": "Complete URL to visit after restart. Must include protocol prefix (e.g., https:// or file://).",
+                "type": ParameterType.STRING,
+                "required": True
+            },
+        ),
+        "has_side_effects": True
+    },
+    {
+        "name": "browser_click",
+        "description": "Click on elements in the current browser page.",
+        "method": "browser_click",
+        "parameters": (
+            {
+                "name": "index",
+                "description": "(Optional) Index number of the element to click",
+                "type": ParameterType.INTEGER,
+                "required": False
+            },
+            {
+                "name": "coordinate_x",
+                "description": "(Optional) Horizontal coordinate of click position, relative to the left edge of the current viewport.",
+                "type": ParameterType.FLOAT,
+                "required": False
+            },
+            {
+                "name": "coordinate_y",
+                "description": "(Optional) Vertical coordinate of click position, relative to the top edge of the current viewport.",
+                "type": ParameterType.FLOAT,
+                "required": False
+            }
+        ),
+        "has_side_effects": True
+    },
+    {
+        "name": "browser_input",
+        "description": "Overwrite text in editable elements on the current browser page.",
+        "method": "browser_input",
+        "parameters": (
+            {
+                "name": "text",
+                "description": "Complete text content to overwrite",
+                "type": ParameterType.STRING,
+                "required": True
+            },
+            {
+                "name": "press_enter",
+                "description": "Whether to press Enter key after input",
+                "type": ParameterType.BOOLEAN,
+                "required": True
+            },
+            {
+                "name": "index",
+                "description": "(Optional) Index number of the element to overwrite text",
+                "type": ParameterType.INTEGER,
+                "required": False
+            },
+            {
+                "name": "coordinate_x",
+                "description": "(Optional) Horizontal coordinate of the element to overwrite text, relative to the left edge of the current viewport.",
+                "type": ParameterType.FLOAT,
+                "required": False
+            },
+            {
+                "name": "coordinate_y",
+                "description": "(Optional) Vertical coordinate of the element to overwrite text, relative to the top edge of the current viewport.",
+                "type": ParameterType.FLOAT,
+                "required": False
+            }
+        ),
+        "has_side_effects": True
+    },
+    {
+        "name": "browser_scroll_down",
+        "description": "Scroll down the current browser page.",
+        "method": "browser_scroll_down",
+        "parameters": (
+            {
+                "name": "to_bottom",
+                "description": "(Optional) Whether to scroll directly to page bottom instead of one viewport down, defaults to false.",
+                "type": ParameterType.BOOLEAN,
+                "required": False,
+                "default": False
+            },
+        ),
+        "has_side_effects": True
+    },
+    {
+        "name": "browser_scroll_up",
+        "description": "Scroll up the current browser page.",
+        "method": "browser_scroll_up",
+        "parameters": (
+            {
+                "name": "to_top",
+                "description": "(Optional) Whether to scroll directly to page top instead of one viewport up, defaults to false.",
+                "type": ParameterType.BOOLEAN,
+                "required": False,
+                "default": False
+            },
+        ),
+        "has_side_effects": True
+    },
+    {
+        "name": "browser_console_exec",
+        "description": "Execute JavaScript code in browser console.",
+        "method": "browser_console_exec",
+        "parameters": (
+            {
+                "name": "javascript",
+                "description": "JavaScript code to execute. Note that the runtime environment is browser console.",
+                "type": ParameterType.STRING,
+                "required": True
+            },
+        ),
+        "has_side_effects": True
+    },
+    {
+        "name": "browser_console_view",
+        "description": "View browser console output.",
+        "method": "browser_console_view",
+        "parameters": (
+            {
+                "name": "max_lines",
+                "description": "(Optional) Maximum number of log lines to return, defaults to last 100 lines.",
+                "type": ParameterType.INTEGER,
+                "required": False,
+                "default": 100
+            },
+        )
+    }
+)
+
 
 class BrowserToolProvider(ToolProvider):
     """
     Provides tools for interacting with web browsers.
     """
-    
+
     def __init__(self, tool_registry: ToolRegistry):
         """
         Initialize the BrowserToolProvider.
-        
+
         Args:
             tool_registry: The tool registry to register tools with.
         """
         super().__init__(tool_registry)
-    
+
     def register_tools(self) -> None:
         """Register browser tools with the tool registry."""
-        # Browser View
-        self.register_tool(
-            self.create_tool(
-                name="browser_view",
-                description="View content of the current browser page.",
-                category=ToolCategory.BROWSER,
-                function=self.browser_view,
-                parameters=[]
-            )
-        )
-        
-        # Browser Navigate
-        self.register_tool(
-            self.create_tool(
-                name="browser_navigate",
-                description="Navigate browser to specified URL.",
-                category=ToolCategory.BROWSER,
-                function=self.browser_navigate,
-                parameters=[
-                    self.create_parameter(
-                        name="url",
-                        description="Complete URL to visit. Must include protocol prefix (e.g., https:// or file://).",
-                        type=ParameterType.STRING,
-                        required=True
-                    )
-                ],
-                has_side_effects=True
-            )
-        )
-        
-        # Browser Restart
-        self.register_tool(
-            self.create_tool(
-                name="browser_restart",
-                description="Restart browser and navigate to specified URL.",
-                category=ToolCategory.BROWSER,
-                function=self.browser_restart,
-                parameters=[
-                    self.create_parameter(
-                        name="url",
-                        description="Complete URL to visit after restart. Must include protocol prefix (e.g., https:// or file://).",
-                        type=ParameterType.STRING,
-                        required=True
-                    )
-                ],
-                has_side_effects=True
-            )
-        )
-        
-        # Browser Click
-        self.register_tool(
-            self.create_tool(
-                name="browser_click",
-                description="Click on elements in the current browser page.",
-                category=ToolCategory.BROWSER,
-                function=self.browser_click,
-                parameters=[
-                    self.create_parameter(
-                        name="index",
-                        description="(Optional) Index number of the element to click",
-                        type=ParameterType.INTEGER,
-                        required=False
-                    ),
-                    self.create_parameter(
-                        name="coordinate_x",
-                        description="(Optional) Horizontal coordinate of click position, relative to the left edge of the current viewport.",
-                        type=ParameterType.FLOAT,
-                        required=False
-                    ),
-                    self.create_parameter(
-                        name="coordinate_y",
-                        description="(Optional) Vertical coordinate of click position, relative to the top edge of the current viewport.",
-                        type=ParameterType.FLOAT,
-                        required=False
-                    )
-                ],
-                has_side_effects=True
-            )
-        )
-        
-        # Browser Input
-        self.register_tool(
-            self.create_tool(
-                name="browser_input",
-                description="Overwrite text in editable elements on the current browser page.",
-                category=ToolCategory.BROWSER,
-                function=self.browser_input,
-                parameters=[
-                    self.create_parameter(
-                        name="text",
-                        description="Complete text content to overwrite",
-                        type=ParameterType.STRING,
-                        required=True
-                    ),
-                    self.create_parameter(
-                        name="press_enter",
-                        description="Whether to press Enter key after input",
-                        type=ParameterType.BOOLEAN,
-                        required=True
-                    ),
-                    self.create_parameter(
-                        name="index",
-                        description="(Optional) Index number of the element to overwrite text",
-                        type=ParameterType.INTEGER,
-                        required=False
-                    ),
-                    self.create_parameter(
-                        name="coordinate_x",
-                        description="(Optional) Horizontal coordinate of the element to overwrite text, relative to the left edge of the current viewport.",
-                        type=ParameterType.FLOAT,
-                        required=False
-                    ),
-                    self.create_parameter(
-                        name="coordinate_y",
-                        description="(Optional) Vertical coordinate of the element to overwrite text, relative to the top edge of the current viewport.",
-                        type=ParameterType.FLOAT,
-                        required=False
-                    )
-                ],
-                has_side_effects=True
+        for spec in _BROWSER_TOOL_SPECS:
+            self.register_tool(
+                self.create_tool(
+                    name=spec["name"],
+                    description=spec["description"],
+                    category=ToolCategory.BROWSER,
+                    function=getattr(self, spec["method"]),
+                    parameters=[
+                        self.create_parameter(**param)
+                        for param in spec["parameters"]
+                    ],
+                    has_side_effects=spec.get("has_side_effects", False)
+                )
             )
-        )
-        
-        # Browser Scroll Down
-        self.register_tool(
-            self.create_tool(
-                name="browser_scroll_down",
-                description="Scroll down the current browser page.",
-                category=ToolCategory.BROWSER,
-                function=self.browser_scroll_down,
-                parameters=[
-                    self.create_parameter(
-                        name="to_bottom",
-                        description="(Optional) Whether to scroll directly to page bottom instead of one viewport down, defaults to false.",
-                        type=ParameterType.BOOLEAN,
-                        required=False,
-                        default=False
-                    )
-                ],
-                has_side_effects=True
-            )
-        )
-        
-        # Browser Scroll Up
-        self.register_tool(
-            self.create_tool(
-                name="browser_scroll_up",
-                description="Scroll up the current browser page.",
-                category=ToolCategory.BROWSER,
-                function=self.browser_scroll_up,
-                parameters=[
-                    self.create_parameter(
-                        name="to_top",
-                        description="(Optional) Whether to scroll directly to page top instead of one viewport up, defaults to false.",
-                        type=ParameterType.BOOLEAN,
-                        required=False,
-                        default=False
-                    )
-                ],
-                has_side_effects=True
-            )
-        )
-        
-        # Browser Console Exec
-        self.register_tool(
-            self.create_tool(
-                name="browser_console_exec",
-                description="Execute JavaScript code in browser console.",
-                category=ToolCategory.BROWSER,
-                function=self.browser_console_exec,
-                parameters=[
-                    self.create_parameter(
-                        name="javascript",
-                        description="JavaScript code to execute. Note that the runtime environment is browser console.",
-                        type=ParameterType.STRING,
-                        required=True
-                    )
-                ],
-                has_side_effects=True
-            )
-        )
-        
-        # Browser Console View
-        self.register_tool(
-            self.create_tool(
-                name="browser_console_view",
-                description="View browser console output.",
-                category=ToolCategory.BROWSER,
-                function=self.browser_console_view,
-                parameters=[
-                    self.create_parameter(
-                        name="max_lines",
-                        description="(Optional) Maximum number of log lines to return, defaults to last 100 lines.",
-                        type=ParameterType.INTEGER,
-                        required=False,
-                        default=100
-                    )
-                ]
-            )
-        )
-    
+
     # Tool implementations
     def browser_view(self) -> Dict[str, Any]:
         """
         View the current browser page.
-        
+
         Returns:
             Dict[str, Any]: The page content and metadata.
         """
         try:
             # In a real implementation, this would interact with a browser
             # For this prototype, we'll return a simulated response
-            
+
             return {
                 "success": True,
                 "title": "Example Page",
@@ -253,70 +241,64 @@ class BrowserToolProvider(ToolProvider):
                     {"index": 3, "tag": "input", "text": ""}
                 ]
             }
-        
+
         except Exception as e:
-            self.logger.error(f"Error viewing browser page: {str(e)}")
+            self.logger.error("Error viewing browser page: %s", e)
             return {
                 "success": False,
                 "error": str(e)
             }
-    
+
     def browser_navigate(self, url: str) -> Dict[str, Any]:
         """
         Navigate to a URL.
-        
+
         Args:
             url: The URL to navigate to.
-            
+
         Returns:
             Dict[str, Any]: The result of the navigation.
         """
         try:
             # Validate URL
-            if not url.startswith(('http://', 'https://', 'file://')):
-                return {
-                    "success": False,
-                    "error": "URL must include protocol prefix (http://, https://, or file://)"
-                }
-            
+            if not url.startswith(_VALID_URL_PREFIXES):
+                return _URL_PROTOCOL_ERROR.copy()
+
             # In a real implementation, this would navigate the browser
             # For this prototype, we'll return a simulated response
-            
+
             return {
                 "success": True,
                 "url": url,
                 "title": "Example Page",
                 "status_code": 200
             }
-        
+
         except Exception as e:
-            self.logger.error(f"Error navigating to URL: {str(e)}")
+            self.logger.error("Error navigating to URL: %s", e)
             return {
                 "success": False,
                 "error": str(e)
             }
-    
+
     def browser_restart(self, url: str) -> Dict[str, Any]:
         """
         Restart the browser and navigate to a URL.
-        
+
         Args:
             url: The URL to navigate to after restart.
-            
+
         Returns:
             Dict[str, Any]: The result of the restart and navigation.
         """
         try:
             # Validate URL
-            if not url.startswith(('http://', 'https://', 'file://')):
-                return {
-                    "success": False,
-                    "error": "URL must include protocol prefix (http://, https://, or file://)"
-                }
-            
+            if not url.startswith(_VALID_URL_PREFIXES):
+                return _URL_PROTOCOL_ERROR.copy()
+
             # In a real implementation, this would restart the browser and navigate
             # For this prototype, we'll return a simulated response
-            
+
             return {
                 "success": True,
                 "url": url,
@@ -324,28 +306,28 @@ class BrowserToolProvider(ToolProvider):
                 "status_code": 200,
                 "restarted": True
             }
-        
+
         except Exception as e:
-            self.logger.error(f"Error restarting browser: {str(e)}")
+            self.logger.error("Error restarting browser: %s", e)
             return {
                 "success": False,
                 "error": str(e)
             }
-    
+
     def browser_click(
-        self, 
-        index: Optional[int] = None, 
-        coordinate_x: Optional[float] = None, 
+        self,
+        index: Optional[int] = None,
+        coordinate_x: Optional[float] = None,
         coordinate_y: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Click on an element or coordinates.
-        
+
         Args:
             index: Index of the element to click.
             coordinate_x: X coordinate to click.
             coordinate_y: Y coordinate to click.
-            
+
         Returns:
             Dict[str, Any]: The result of the click.
         """
@@ -356,10 +338,10 @@ class BrowserToolProvider(ToolProvider):
                     "success": False,
                     "error": "Must provide either element index or both coordinates"
                 }
-            
+
             # In a real implementation, this would click the element or coordinates
             # For this prototype, we'll return a simulated response
-            
+
             if index is not None:
                 return {
                     "success": True,
@@ -377,32 +359,32 @@ class BrowserToolProvider(ToolProvider):
                         "y": coordinate_y
                     }
                 }
-        
+
         except Exception as e:
-            self.logger.error(f"Error clicking in browser: {str(e)}")
+            self.logger.error("Error clicking in browser: %s", e)
             return {
                 "success": False,
                 "error": str(e)
             }
-    
+
     def browser_input(
-        self, 
-        text: str, 
-        press_enter: bool, 
-        index: Optional[int] = None, 
-        coordinate_x: Optional[float] = None, 
+        self,
+        text: str,
+        press_enter: bool,
+        index: Optional[int] = None,
+        coordinate_x: Optional[float] = None,
         coordinate_y: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Input text into an element.
-        
+
         Args:
             text: Text to input.
             press_enter: Whether to press Enter after input.
             index: Index of the element to input text into.
             coordinate_x: X coordinate of the element.
             coordinate_y: Y coordinate of the element.
-            
+
         Returns:
             Dict[str, Any]: The result of the input.
         """
@@ -413,10 +395,10 @@ class BrowserToolProvider(ToolProvider):
                     "success": False,
                     "error": "Must provide either element index or both coordinates"
                 }
-            
+
             # In a real implementation, this would input text into the element
             # For this prototype, we'll return a simulated response
-            
+
             if index is not None:
                 return {
                     "success": True,
@@ -437,5 +419,123 @@ class BrowserToolProvider(ToolProvider):
                     "text": text,
                     "press_enter": press_enter
                 }
-        
-        except Exception a<response clipped><NOTE>To save on context only part of this file has been shown to you. You should retry this tool after you have searched inside the file with `grep -n` in order to find the line numbers of what you are looking for.</NOTE>
\ No newline at end of file
+
+        except Exception as e:
+            self.logger.error("Error inputting text: %s", e)
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    def browser_scroll_down(self, to_bottom: bool = False) -> Dict[str, Any]:
+        """
+        Scroll down the current browser page.
+
+        Args:
+            to_bottom: Whether to scroll directly to the page bottom.
+
+        Returns:
+            Dict[str, Any]: The result of the scroll.
+        """
+        try:
+            # In a real implementation, this would scroll the browser page
+            # For this prototype, we'll return a simulated response
+
+            return {
+                "success": True,
+                "scrolled": "bottom" if to_bottom else "down",
+                "viewport_position": 1.0 if to_bottom else 0.5
+            }
+
+        except Exception as e:
+            self.logger.error("Error scrolling down: %s", e)
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    def browser_scroll_up(self, to_top: bool = False) -> Dict[str, Any]:
+        """
+        Scroll up the current browser page.
+
+        Args:
+            to_top: Whether to scroll directly to the page top.
+
+        Returns:
+            Dict[str, Any]: The result of the scroll.
+        """
+        try:
+            # In a real implementation, this would scroll the browser page
+            # For this prototype, we'll return a simulated response
+
+            return {
+                "success": True,
+                "scrolled": "top" if to_top else "up",
+                "viewport_position": 0.0 if to_top else 0.5
+            }
+
+        except Exception as e:
+            self.logger.error("Error scrolling up: %s", e)
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    def browser_console_exec(self, javascript: str) -> Dict[str, Any]:
+        """
+        Execute JavaScript code in the browser console.
+
+        Args:
+            javascript: The JavaScript code to execute.
+
+        Returns:
+            Dict[str, Any]: The result of the execution.
+        """
+        try:
+            # In a real implementation, this would execute the code in the console
+            # For this prototype, we'll return a simulated response
+
+            return {
+                "success": True,
+                "javascript": javascript,
+                "result": "undefined"
+            }
+
+        except Exception as e:
+            self.logger.error("Error executing JavaScript: %s", e)
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    def browser_console_view(self, max_lines: int = 100) -> Dict[str, Any]:
+        """
+        View the browser console output.
+
+        Args:
+            max_lines: Maximum number of log lines to return.
+
+        Returns:
+            Dict[str, Any]: The console output.
+        """
+        try:
+            # In a real implementation, this would read the browser console
+            # For this prototype, we'll return a simulated response
+
+            logs = [
+                {"level": "info", "message": "Page loaded"},
+                {"level": "warning", "message": "Deprecated API usage"}
+            ]
+
+            return {
+                "success": True,
+                "logs": logs[-max_lines:],
+                "total_lines": len(logs)
+            }
+
+        except Exception as e:
+            self.logger.error("Error viewing console output: %s", e)
+            return {
+                "success": False,
+                "error": str(e)
+            }
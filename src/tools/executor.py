@@ -7,13 +7,130 @@ tools and handling their results.
 
 import logging
 import time
-from typing import Dict, List, Any, Optional, Union, Callable
-from datetime import datetime
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Any, Optional, Union, Callable
 
 from tools.models import (
     ToolDefinition, ToolExecutionRequest, ToolExecutionResult, ToolRegistry
 )
 
+# Expected Python types and error phrasing per parameter type, keyed once
+# here instead of re-testing an if/elif chain per parameter per call.
+_TYPE_CHECKS = {
+    "string": str,
+    "integer": int,
+    "float": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict
+}
+
+_TYPE_NAMES = {
+    "string": "a string",
+    "integer": "an integer",
+    "float": "a number",
+    "boolean": "a boolean",
+    "array": "an array",
+    "object": "an object"
+}
+
+
+def _build_validator(tool: ToolDefinition) -> Callable[[Dict[str, Any]], Optional[str]]:
+    """
+    Build a validator specialized to one tool's parameter definitions.
+
+    The per-parameter constraint branches and error strings are resolved
+    once here, so the returned callable only runs the checks each
+    parameter actually declares. It returns None when the parameters are
+    valid, otherwise a description of the first violation.
+
+    Args:
+        tool: The tool definition to specialize for.
+
+    Returns:
+        Callable[[Dict[str, Any]], Optional[str]]: The validator.
+    """
+    required_errors = tuple(
+        (param.name, f"Missing required parameter: {param.name}")
+        for param in tool.parameters if param.required
+    )
+
+    checks_by_name: Dict[str, List[Callable]] = {}
+    for param in tool.parameters:
+        name = param.name
+        param_type = param.type
+        checks: List[Callable] = []
+
+        expected = _TYPE_CHECKS.get(param_type)
+        if expected is not None:
+            error = f"Parameter {name} must be {_TYPE_NAMES[param_type]}"
+            checks.append(
+                lambda value, expected=expected, error=error:
+                    None if isinstance(value, expected) else error
+            )
+
+        if param._enum_set is not None:
+            error = f"Parameter {name} must be one of: {', '.join(map(str, param.enum))}"
+            checks.append(
+                lambda value, allowed=param._enum_set, error=error:
+                    None if value in allowed else error
+            )
+
+        if param_type == "integer" or param_type == "float":
+            if param.min_value is not None:
+                error = f"Parameter {name} must be at least {param.min_value}"
+                checks.append(
+                    lambda value, bound=param.min_value, error=error:
+                        None if value >= bound else error
+                )
+            if param.max_value is not None:
+                error = f"Parameter {name} must be at most {param.max_value}"
+                checks.append(
+                    lambda value, bound=param.max_value, error=error:
+                        None if value <= bound else error
+                )
+
+        if param_type == "string":
+            if param.min_length is not None:
+                error = f"Parameter {name} must be at least {param.min_length} characters"
+                checks.append(
+                    lambda value, bound=param.min_length, error=error:
+                        None if len(value) >= bound else error
+                )
+            if param.max_length is not None:
+                error = f"Parameter {name} must be at most {param.max_length} characters"
+                checks.append(
+                    lambda value, bound=param.max_length, error=error:
+                        None if len(value) <= bound else error
+                )
+            if param._compiled_pattern is not None:
+                error = f"Parameter {name} must match pattern: {param.pattern}"
+                checks.append(
+                    lambda value, match=param._compiled_pattern.match, error=error:
+                        None if match(value) else error
+                )
+
+        checks_by_name[name] = checks
+
+    def validate(parameters: Dict[str, Any]) -> Optional[str]:
+        for name, error in required_errors:
+            if name not in parameters:
+                return error
+
+        for param_name, param_value in parameters.items():
+            checks = checks_by_name.get(param_name)
+            if checks is None:
+                return f"Unknown parameter: {param_name}"
+            for check in checks:
+                error = check(param_value)
+                if error is not None:
+                    return error
+
+        return None
+
+    return validate
+
 
 class ToolExecutor:
     """
@@ -29,9 +146,18 @@ class ToolExecutor:
         """
         self.tool_registry = tool_registry
         self.logger = logging.getLogger(__name__)
-        self.execution_history: List[ToolExecutionResult] = []
         self.max_history_size = 1000
+        self.execution_history: Deque[ToolExecutionResult] = deque(maxlen=self.max_history_size)
+        # Per-tool history index so filtered reads avoid scanning the
+        # full history
+        self._by_tool_history: Dict[str, Deque[ToolExecutionResult]] = {}
         self.callbacks: Dict[str, List[Callable]] = {}
+        # Callbacks bucketed at registration time so triggering avoids
+        # per-call dict lookups and event-key formatting
+        self._any_callbacks: List[Callable] = []
+        self._success_callbacks: List[Callable] = []
+        self._error_callbacks: List[Callable] = []
+        self._by_tool_callbacks: Dict[str, List[Callable]] = {}
 
     def execute_tool(self, request: ToolExecutionRequest) -> ToolExecutionResult:
         """
@@ -43,80 +169,84 @@ class ToolExecutor:
         Returns:
             ToolExecutionResult: The result of the tool execution.
         """
+        request_id = request.request_id
+        tool_name = request.tool_name
+
         # Get the tool definition
-        tool = self.tool_registry.get_tool(request.tool_name)
+        tool = self.tool_registry.get_tool(tool_name)
         if tool is None:
             return ToolExecutionResult(
-                request_id=request.request_id,
-                tool_name=request.tool_name,
+                request_id=request_id,
+                tool_name=tool_name,
                 success=False,
-                error=f"Tool not found: {request.tool_name}"
+                error=f"Tool not found: {tool_name}"
             )
 
         # Check if the tool is enabled
         if not tool.enabled:
             return ToolExecutionResult(
-                request_id=request.request_id,
-                tool_name=request.tool_name,
+                request_id=request_id,
+                tool_name=tool_name,
                 success=False,
-                error=f"Tool is disabled: {request.tool_name}"
+                error=f"Tool is disabled: {tool_name}"
             )
 
         # Check rate limit
         if tool.rate_limit is not None and tool.last_used is not None:
-            elapsed = (datetime.now() - tool.last_used).total_seconds()
+            elapsed = time.monotonic() - tool.last_used
             if elapsed < tool.rate_limit:
                 return ToolExecutionResult(
-                    request_id=request.request_id,
-                    tool_name=request.tool_name,
+                    request_id=request_id,
+                    tool_name=tool_name,
                     success=False,
                     error=f"Rate limit exceeded. Try again in {tool.rate_limit - elapsed:.1f} seconds."
                 )
 
-        # Validate parameters
-        validation_result = self._validate_parameters(tool, request.parameters)
-        if not validation_result["valid"]:
-            return ToolExecutionResult(
-                request_id=request.request_id,
-                tool_name=request.tool_name,
-                success=False,
-                error=f"Parameter validation failed: {validation_result['error']}"
-            )
+        # Validate parameters, unless the caller vouches for them
+        if not request.trust_validated:
+            validation_error = self._validate_parameters(tool, request.parameters)
+            if validation_error is not None:
+                return ToolExecutionResult(
+                    request_id=request_id,
+                    tool_name=tool_name,
+                    success=False,
+                    error=f"Parameter validation failed: {validation_error}"
+                )
 
         # Execute the tool
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             if tool.function is None:
                 return ToolExecutionResult(
-                    request_id=request.request_id,
-                    tool_name=request.tool_name,
+                    request_id=request_id,
+                    tool_name=tool_name,
                     success=False,
-                    error=f"Tool has no implementation: {request.tool_name}"
+                    error=f"Tool has no implementation: {tool_name}"
                 )
 
             result = tool.function(**request.parameters)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
 
             # Update last used timestamp
-            tool.last_used = datetime.now()
+            tool.last_used = time.monotonic()
 
             # Create success result
             execution_result = ToolExecutionResult(
-                request_id=request.request_id,
-                tool_name=request.tool_name,
+                request_id=request_id,
+                tool_name=tool_name,
                 success=True,
                 result=result,
                 execution_time=execution_time
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"Error executing tool {request.tool_name}: {str(e)}")
+            execution_time = time.perf_counter() - start_time
+            self.logger.error("Error executing tool %s: %s", tool_name, e)
 
             # Create error result
             execution_result = ToolExecutionResult(
-                request_id=request.request_id,
-                tool_name=request.tool_name,
+                request_id=request_id,
+                tool_name=tool_name,
                 success=False,
                 error=str(e),
                 execution_time=execution_time
@@ -130,7 +260,7 @@ class ToolExecutor:
 
         return execution_result
 
-    def _validate_parameters(self, tool: ToolDefinition, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_parameters(self, tool: ToolDefinition, parameters: Dict[str, Any]) -> Optional[str]:
         """
         Validate parameters against tool definition.
 
@@ -139,109 +269,13 @@ class ToolExecutor:
             parameters: The parameters to validate.
 
         Returns:
-            Dict[str, Any]: Validation result with 'valid' and optional 'error' keys.
+            Optional[str]: None if the parameters are valid, otherwise a
+                description of the first violation.
         """
-        # Check for missing required parameters
-        for param in tool.parameters:
-            if param.required and param.name not in parameters:
-                return {
-                    "valid": False,
-                    "error": f"Missing required parameter: {param.name}"
-                }
-
-        # Check parameter types and constraints
-        for param_name, param_value in parameters.items():
-            # Find parameter definition
-            param_def = next((p for p in tool.parameters if p.name == param_name), None)
-            if param_def is None:
-                return {
-                    "valid": False,
-                    "error": f"Unknown parameter: {param_name}"
-                }
-
-            # Check type
-            if param_def.type == "string" and not isinstance(param_value, str):
-                return {
-                    "valid": False,
-                    "error": f"Parameter {param_name} must be a string"
-                }
-            elif param_def.type == "integer" and not isinstance(param_value, int):
-                return {
-                    "valid": False,
-                    "error": f"Parameter {param_name} must be an integer"
-                }
-            elif param_def.type == "float" and not isinstance(param_value, (int, float)):
-                return {
-                    "valid": False,
-                    "error": f"Parameter {param_name} must be a number"
-                }
-            elif param_def.type == "boolean" and not isinstance(param_value, bool):
-                return {
-                    "valid": False,
-                    "error": f"Parameter {param_name} must be a boolean"
-                }
-            elif param_def.type == "array" and not isinstance(param_value, list):
-                return {
-                    "valid": False,
-                    "error": f"Parameter {param_name} must be an array"
-                }
-            elif param_def.type == "object" and not isinstance(param_value, dict):
-                return {
-                    "valid": False,
-                    "error": f"Parameter {param_name} must be an object"
-                }
-
-            # Check enum
-            if param_def.enum is not None and param_value not in param_def.enum:
-                return {
-                    "valid": False,
-                    "error": f"Parameter {param_name} must be one of: {', '.join(map(str, param_def.enum))}"
-                }
-
-            # Check numeric constraints
-            if param_def.type in ["integer", "float"]:
-                if param_def.min_value is not None and param_value < param_def.min_value:
-                    return {
-                        "valid": False,
-                        "error": f"Parameter {param_name} must be at least {param_def.min_value}"
-                    }
-                if param_def.max_value is not None and param_value > param_def.max_value:
-                    return {
-                        "valid": False,
-                        "error": f"Parameter {param_name} must be at most {param_def.max_value}"
-                    }
-
-            # Check string constraints
-            if param_def.type == "string":
-                if param_def.min_length is not None and len(param_value) < param_def.min_length:
-                    return {
-                        "valid": False,
-                        "error": f"Parameter {param_name} must be at least {param_def.min_length} characters"
-                    }
-                if param_def.max_length is not None and len(param_value) > param_def.max_length:
-                    return {
-                        "valid": False,
-                        "error": f"Parameter {param_name} must be at most {param_def.max_length} characters"
-                    }
-                if param_def.pattern is not None:
-                    import re
-                    if not re.match(param_def.pattern, param_value):
-                        return {
-                            "valid": False,
-                            "error": f"Parameter {param_name} must match pattern: {param_def.pattern}"
-                        }
-
-            # Check array constraints
-            if param_def.type == "array" and param_def.items is not None:
-                # TODO: Implement array item validation
-                pass
-
-            # Check object constraints
-            if param_def.type == "object" and param_def.properties is not None:
-                # TODO: Implement object property validation
-                pass
-
-        return {"valid": True}
+        validator = tool._validator
+        if validator is None:
+            validator = tool._validator = _build_validator(tool)
+        return validator(parameters)
 
     def _add_to_history(self, result: ToolExecutionResult) -> None:
         """
@@ -251,10 +285,11 @@ class ToolExecutor:
             result: The result to add.
         """
         self.execution_history.append(result)
-        
-        # Trim history if it exceeds max size
-        if len(self.execution_history) > self.max_history_size:
-            self.execution_history = self.execution_history[-self.max_history_size:]
+
+        tool_history = self._by_tool_history.get(result.tool_name)
+        if tool_history is None:
+            tool_history = self._by_tool_history[result.tool_name] = deque(maxlen=self.max_history_size)
+        tool_history.append(result)
 
     def register_callback(self, event: str, callback: Callable) -> None:
         """
@@ -266,9 +301,20 @@ class ToolExecutor:
         """
         if event not in self.callbacks:
             self.callbacks[event] = []
-        
+
         self.callbacks[event].append(callback)
 
+        # Bucket the callback so _trigger_callbacks dispatches without
+        # rebuilding event keys
+        if event == 'any':
+            self._any_callbacks.append(callback)
+        elif event == 'success':
+            self._success_callbacks.append(callback)
+        elif event == 'error':
+            self._error_callbacks.append(callback)
+        elif event.startswith('tool:'):
+            self._by_tool_callbacks.setdefault(event[5:], []).append(callback)
+
     def _trigger_callbacks(self, result: ToolExecutionResult) -> None:
         """
         Trigger callbacks for a result.
@@ -277,27 +323,26 @@ class ToolExecutor:
             result: The result to trigger callbacks for.
         """
         # Trigger 'any' callbacks
-        for callback in self.callbacks.get('any', []):
+        for callback in self._any_callbacks:
             try:
                 callback(result)
             except Exception as e:
-                self.logger.error(f"Error in callback: {str(e)}")
-        
+                self.logger.error("Error in callback: %s", e)
+
         # Trigger 'success' or 'error' callbacks
-        event = 'success' if result.success else 'error'
-        for callback in self.callbacks.get(event, []):
+        event_callbacks = self._success_callbacks if result.success else self._error_callbacks
+        for callback in event_callbacks:
             try:
                 callback(result)
             except Exception as e:
-                self.logger.error(f"Error in callback: {str(e)}")
-        
+                self.logger.error("Error in callback: %s", e)
+
         # Trigger tool-specific callbacks
-        tool_event = f"tool:{result.tool_name}"
-        for callback in self.callbacks.get(tool_event, []):
+        for callback in self._by_tool_callbacks.get(result.tool_name, ()):
             try:
                 callback(result)
             except Exception as e:
-                self.logger.error(f"Error in callback: {str(e)}")
+                self.logger.error("Error in callback: %s", e)
 
     def get_history(self, tool_name: Optional[str] = None, limit: int = 10) -> List[ToolExecutionResult]:
         """
@@ -310,12 +355,15 @@ class ToolExecutor:
         Returns:
             List[ToolExecutionResult]: The execution history.
         """
-        if tool_name is None:
-            return self.execution_history[-limit:]
-        
-        filtered = [r for r in self.execution_history if r.tool_name == tool_name]
-        return filtered[-limit:]
+        history = self.execution_history if tool_name is None else self._by_tool_history.get(tool_name)
+        if history is None:
+            return []
+
+        recent = list(islice(reversed(history), limit))
+        recent.reverse()
+        return recent
 
     def clear_history(self) -> None:
         """Clear the execution history."""
-        self.execution_history = []
+        self.execution_history.clear()
+        self._by_tool_history.clear()
@@ -7,7 +7,7 @@ interacting with the file system.
 
 import os
 import re
-import glob
+import fnmatch
 import logging
 from typing import Dict, List, Any, Optional, Union, Callable
 
@@ -440,4 +440,81 @@ class FileToolProvider(ToolProvider):
             if not os.path.isfile(file):
                 return {
                     "success": False,
-                 <response clipped><NOTE>To save on context only part of this file has been shown to you. You should retry this tool after you have searched inside the file with `grep -n` in order to find the line numbers of what you are looking for.</NOTE>
\ No newline at end of file
+                    "error": f"File not found: {file}"
+                }
+            
+            # Read file content
+            if sudo:
+                # In a real implementation, this would use sudo
+                # For this prototype, we'll just read the file directly
+                with open(file, 'r') as f:
+                    lines = f.readlines()
+            else:
+                with open(file, 'r') as f:
+                    lines = f.readlines()
+            
+            # Find matching lines
+            pattern = re.compile(regex)
+            matches = []
+            for line_number, line in enumerate(lines):
+                for match in pattern.finditer(line):
+                    matches.append({
+                        "line_number": line_number,
+                        "line": line.rstrip('\n'),
+                        "match": match.group(0)
+                    })
+            
+            return {
+                "success": True,
+                "file": file,
+                "matches": matches,
+                "match_count": len(matches)
+            }
+        
+        except Exception as e:
+            self.logger.error(f"Error searching file content: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    def file_find_by_name(
+        self, 
+        path: str, 
+        glob: str
+    ) -> Dict[str, Any]:
+        """
+        Find files by name pattern in a directory.
+        
+        Args:
+            path: Absolute path of the directory to search.
+            glob: Filename pattern using glob syntax wildcards.
+            
+        Returns:
+            Dict[str, Any]: The matching files.
+        """
+        try:
+            # Check if directory exists
+            if not os.path.isdir(path):
+                return {
+                    "success": False,
+                    "error": f"Directory not found: {path}"
+                }
+            
+            # Match directory entries against the pattern
+            names = fnmatch.filter(os.listdir(path), glob)
+            files = [os.path.join(path, name) for name in sorted(names)]
+            
+            return {
+                "success": True,
+                "path": path,
+                "files": files,
+                "file_count": len(files)
+            }
+        
+        except Exception as e:
+            self.logger.error(f"Error finding files by name: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
@@ -0,0 +1,222 @@
+"""
+Models for the tool integration framework.
+
+This module defines the data structures used by the tool integration framework.
+"""
+
+import logging
+import re
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+
+class ToolCategory(Enum):
+    """Categories of tools."""
+    BROWSER = "browser"
+    FILE = "file"
+    SHELL = "shell"
+    INFORMATION = "information"
+    MESSAGE = "message"
+
+
+class ParameterType(str, Enum):
+    """Types of tool parameters."""
+    STRING = "string"
+    INTEGER = "integer"
+    FLOAT = "float"
+    BOOLEAN = "boolean"
+    ARRAY = "array"
+    OBJECT = "object"
+
+
+class ToolParameter:
+    """A parameter definition for a tool."""
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        type: ParameterType,
+        required: bool = False,
+        default: Optional[Any] = None,
+        enum: Optional[List[Any]] = None,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        min_length: Optional[int] = None,
+        max_length: Optional[int] = None,
+        pattern: Optional[str] = None,
+        items: Optional[Dict[str, Any]] = None,
+        properties: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.description = description
+        self.type = type
+        self.required = required
+        self.default = default
+        self.enum = enum
+        self.min_value = min_value
+        self.max_value = max_value
+        self.min_length = min_length
+        self.max_length = max_length
+        self.pattern = pattern
+        self.items = items
+        self.properties = properties
+        # Compiled once here so validation skips the re module's cache
+        # lookup on every call
+        self._compiled_pattern = re.compile(pattern) if pattern is not None else None
+        # Frozen for O(1) membership checks during validation; the list is
+        # kept for ordered error messages
+        self._enum_set = frozenset(enum) if enum is not None else None
+
+
+class ToolDefinition:
+    """A tool that can be executed by the agent."""
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        category: ToolCategory,
+        function: Optional[Callable],
+        parameters: Optional[List[ToolParameter]] = None,
+        enabled: bool = True,
+        requires_confirmation: bool = False,
+        has_side_effects: bool = False,
+        is_dangerous: bool = False,
+        rate_limit: Optional[int] = None
+    ):
+        self.name = name
+        self.description = description
+        self.category = category
+        self.function = function
+        self.parameters = parameters or []
+        self.enabled = enabled
+        self.requires_confirmation = requires_confirmation
+        self.has_side_effects = has_side_effects
+        self.is_dangerous = is_dangerous
+        self.rate_limit = rate_limit
+        self.last_used = None
+        self._params_by_name = {param.name: param for param in self.parameters}
+        # Specialized parameter validator, built lazily by the executor on
+        # first use
+        self._validator: Optional[Callable] = None
+
+    def get_parameter(self, name: str) -> Optional[ToolParameter]:
+        """
+        Look up a parameter definition by name in O(1).
+
+        Args:
+            name: Name of the parameter.
+
+        Returns:
+            Optional[ToolParameter]: The parameter if defined, None otherwise.
+        """
+        return self._params_by_name.get(name)
+
+
+class ToolExecutionRequest:
+    """A request to execute a tool."""
+    def __init__(
+        self,
+        request_id: str,
+        tool_name: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        trust_validated: bool = False
+    ):
+        self.request_id = request_id
+        self.tool_name = tool_name
+        self.parameters = parameters or {}
+        # Set by callers that already validated the parameters (e.g. a
+        # planner re-issuing a previously validated request) so the
+        # executor can skip re-validation
+        self.trust_validated = trust_validated
+
+
+class ToolExecutionResult:
+    """The result of a tool execution."""
+    def __init__(
+        self,
+        request_id: str,
+        tool_name: str,
+        success: bool,
+        result: Optional[Any] = None,
+        error: Optional[str] = None,
+        execution_time: float = 0.0
+    ):
+        self.request_id = request_id
+        self.tool_name = tool_name
+        self.success = success
+        self.result = result
+        self.error = error
+        self.execution_time = execution_time
+
+
+class ToolRegistry:
+    """Registry of available tools."""
+
+    def __init__(self):
+        self.tools: Dict[str, ToolDefinition] = {}
+        self.logger = logging.getLogger(__name__)
+
+    def register_tool(self, tool: ToolDefinition) -> bool:
+        """
+        Register a tool.
+
+        Args:
+            tool: The tool to register.
+
+        Returns:
+            bool: True if the tool was registered, False if the name is taken.
+        """
+        if tool.name in self.tools:
+            self.logger.warning(f"Tool already registered: {tool.name}")
+            return False
+
+        self.tools[tool.name] = tool
+        return True
+
+    def unregister_tool(self, name: str) -> bool:
+        """
+        Unregister a tool.
+
+        Args:
+            name: Name of the tool to unregister.
+
+        Returns:
+            bool: True if the tool was unregistered, False if it wasn't found.
+        """
+        if name in self.tools:
+            del self.tools[name]
+            return True
+        return False
+
+    def get_tool(self, name: str) -> Optional[ToolDefinition]:
+        """
+        Get a tool by name.
+
+        Args:
+            name: Name of the tool to get.
+
+        Returns:
+            Optional[ToolDefinition]: The tool if found, None otherwise.
+        """
+        return self.tools.get(name)
+
+    def list_tools(self) -> List[str]:
+        """
+        List the names of all registered tools.
+
+        Returns:
+            List[str]: The registered tool names.
+        """
+        return list(self.tools.keys())
+
+    def get_tools_by_category(self, category: ToolCategory) -> List[ToolDefinition]:
+        """
+        Get all tools in a category.
+
+        Args:
+            category: The category to filter by.
+
+        Returns:
+            List[ToolDefinition]: The tools in the category.
+        """
+        return [tool for tool in self.tools.values() if tool.category == category]